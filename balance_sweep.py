@@ -0,0 +1,307 @@
+# Balayage de paramètres d'équilibrage sur plusieurs processus, sans affichage
+#
+#   python balance_sweep.py res.jsonl hunger_decay=0.03,0.05 thirst_decay=0.05,0.1
+#   python balance_sweep.py res.jsonl --random 200 hunt_chance=0.1:0.6
+#   options: --runs N --days N --seed N --processes N
+#
+# Chaque configuration est jouée par un pilote automatique sur les mêmes graines;
+# son résumé est ajouté en une ligne JSON dès qu'il est prêt. Relancer la même
+# commande reprend le balayage là où il s'est arrêté.
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import time
+
+from survival_core import (
+    MAX_TEMPERATURE,
+    NEXT_TIME_OF_DAY,
+    BALANCE,
+    Balance,
+    SurvivalSimulation,
+    Weather,
+)
+
+RUNS = 100  # parties par configuration
+MAX_DAYS = 60  # une partie qui atteint ce jour compte comme survivante
+DECISION_TICKS = 1000  # au plus entre deux décisions (une période dure ~200 ticks)
+# Sans changement de période (period_chance=0) les jours ne passent plus: la
+# partie est aussi bornée en ticks, à dix jours moyens par jour de max_days
+MAX_TICKS_PER_DAY = 8000
+SEED = 0
+CAUSES = ["vivant", "soif", "faim", "température", "maladie"]
+
+
+# Stratégie jouée à chaque période: boire et manger au besoin, puis une action
+def autopilot(simulation):
+    player = simulation.player
+    inventory = player.inventory
+    balance = player.balance
+
+    # Préparer l'eau et la viande tant que le feu brûle
+    if player.has_fire:
+        while inventory.has_item("Eau de pluie"):
+            simulation.special_craft("purify_water")
+        while inventory.has_item("Viande crue"):
+            player.cook("Viande crue")
+
+    while player.thirst < balance.max_thirst * 0.6:
+        drinks = inventory.items_in("drinkable")
+        if not drinks:
+            break
+        best = max(drinks, key=lambda name: inventory.objects[name].thirst_value)
+        simulation.consume_item("drink", best)
+
+    while player.hunger < balance.max_hunger * 0.6:
+        foods = inventory.items_in("food")
+        if not foods:
+            break
+        # La viande crue (risque de maladie) seulement en dernier recours
+        best = max(
+            foods,
+            key=lambda name: (
+                name != "Viande crue",
+                inventory.objects[name].hunger_value,
+            ),
+        )
+        simulation.consume_item("eat", best)
+
+    # Seule la pluie rend de l'eau: hors pluie, chaque action (cueillette,
+    # chasse, repos) coûte de la soif sans la compenser. Le joueur attend donc
+    # tant que la nourriture ne presse pas, et travaille sous la pluie.
+    raining = simulation.current_weather == Weather.RAINY
+    hungry = player.hunger < balance.max_hunger * 0.4
+    has_food = inventory.has_category("food")
+    to_prepare = inventory.has_item("Viande crue") or inventory.has_item("Eau de pluie")
+    if not player.has_fire and to_prepare and inventory.has_item("Bois", 3):
+        simulation.perform_action("fire")
+    elif (
+        not player.has_shelter
+        and inventory.has_item("Bois", 5)
+        and inventory.has_item("Corde", 2)
+    ):
+        simulation.perform_action("shelter")
+    elif raining:
+        if player.energy < 15:
+            simulation.rest(8)
+        else:
+            simulation.perform_action("forage")
+    elif hungry and not has_food and player.thirst > balance.max_thirst * 0.3:
+        if player.energy >= 20:
+            simulation.perform_action("hunt")
+        elif player.energy >= 15:
+            simulation.perform_action("forage")
+        else:
+            simulation.rest(8)
+    # Sinon attendre
+
+
+def cause_of_death(player):
+    if player.health > 0:
+        return "vivant"
+    if player.thirst <= 0:
+        return "soif"
+    if player.hunger <= 0:
+        return "faim"
+    if abs(player.body_temperature - MAX_TEMPERATURE) > 2:
+        return "température"
+    return "maladie"
+
+
+def play(balance, seed, max_days=MAX_DAYS):
+    # Une décision par période; le temps entre deux décisions est avancé par segments
+    simulation = SurvivalSimulation(seed=seed, balance=balance)
+    simulation.initialize()
+    player = simulation.player
+    max_ticks = max_days * MAX_TICKS_PER_DAY
+    while (
+        player.health > 0
+        and simulation.days_survived < max_days
+        and simulation.tick < max_ticks
+    ):
+        autopilot(simulation)
+        simulation.fast_forward(
+            DECISION_TICKS, until=NEXT_TIME_OF_DAY[simulation.time_of_day]
+        )
+    return simulation.days_survived, cause_of_death(player)
+
+
+def percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def evaluate(task):
+    # Exécuté dans un processus du pool: seules la tâche et le résumé transitent
+    key, params, runs, seed, max_days = task
+    record = {
+        "key": key,
+        "params": params,
+        "runs": runs,
+        "seed": seed,
+        "max_days": max_days,
+    }
+    start = time.perf_counter()
+    try:
+        record.update(summarize(params, runs, seed, max_days))
+    except Exception as error:
+        # Une configuration en échec est notée sans interrompre le balayage
+        record["error"] = f"{type(error).__name__}: {error}"
+    record["seconds"] = time.perf_counter() - start
+    return record
+
+
+def summarize(params, runs, seed, max_days):
+    balance = BALANCE._replace(**params)
+    days = []
+    causes = dict.fromkeys(CAUSES, 0)
+    for run in range(runs):
+        # Mêmes graines pour toutes les configurations: écarts moins bruités
+        survived, cause = play(balance, seed + run, max_days)
+        days.append(survived)
+        causes[cause] += 1
+    days.sort()
+    return {
+        "median_days": statistics.median(days),
+        "mean_days": statistics.fmean(days),
+        "p10_days": percentile(days, 0.1),
+        "p90_days": percentile(days, 0.9),
+        "causes": causes,
+    }
+
+
+# Configurations: produit cartésien de listes de valeurs ({nom: [valeurs]})
+def grid(ranges):
+    names = list(ranges)
+    for values in itertools.product(*(ranges[name] for name in names)):
+        yield dict(zip(names, values))
+
+
+# Configurations tirées uniformément dans des intervalles ({nom: (min, max)})
+def sample(ranges, count, seed=SEED):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield {name: rng.uniform(low, high) for name, (low, high) in ranges.items()}
+
+
+def config_key(params, runs, seed, max_days):
+    text = json.dumps([params, runs, seed, max_days], sort_keys=True)
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def load_results(path):
+    # Résumés déjà écrits; une dernière ligne tronquée (interruption) est retirée
+    if not os.path.exists(path):
+        return {}
+    with open(path, "rb") as source:
+        data = source.read()
+    end = data.rfind(b"\n") + 1
+    if end < len(data):
+        with open(path, "r+b") as target:
+            target.truncate(end)
+    results = {}
+    for line in data[:end].splitlines():
+        record = json.loads(line)
+        results[record["key"]] = record
+    return results
+
+
+def sweep(
+    path,
+    configurations,
+    runs=RUNS,
+    seed=SEED,
+    max_days=MAX_DAYS,
+    processes=None,
+):
+    # Générateur: chaque résumé est écrit puis renvoyé dès qu'un processus le termine
+    done = load_results(path)
+    tasks = {}
+    for params in configurations:
+        unknown = set(params) - set(Balance._fields)
+        if unknown:
+            raise ValueError(f"Paramètres inconnus: {', '.join(sorted(unknown))}")
+        key = config_key(params, runs, seed, max_days)
+        # Les configurations en échec sont retentées à la reprise
+        if key not in done or "error" in done[key]:
+            tasks[key] = (key, params, runs, seed, max_days)
+    if not tasks:
+        return
+
+    with open(path, "a", encoding="utf-8") as target:
+        with multiprocessing.Pool(processes) as pool:
+            # Tâches indépendantes et une seule par envoi: aucun processus
+            # n'attend les autres, le débit suit le nombre de cœurs
+            for record in pool.imap_unordered(evaluate, tasks.values()):
+                target.write(json.dumps(record, ensure_ascii=False) + "\n")
+                target.flush()
+                yield record
+
+
+def parse_ranges(arguments, random_mode):
+    # nom=v1,v2,... pour une grille, nom=min:max pour un tirage aléatoire
+    ranges = {}
+    for argument in arguments:
+        name, _, values = argument.partition("=")
+        if random_mode:
+            low, high = values.split(":")
+            ranges[name] = (float(low), float(high))
+        else:
+            ranges[name] = [float(value) for value in values.split(",")]
+    return ranges
+
+
+if __name__ == "__main__":
+    options = {}
+    arguments = []
+    args = iter(sys.argv[1:])
+    for arg in args:
+        if arg.startswith("--"):
+            options[arg] = next(args)
+        else:
+            arguments.append(arg)
+    if not arguments:
+        sys.exit("Usage: python balance_sweep.py résultats.jsonl [nom=valeurs ...]")
+
+    path = arguments[0]
+    runs = int(options.get("--runs", RUNS))
+    max_days = int(options.get("--days", MAX_DAYS))
+    seed = int(options.get("--seed", SEED))
+    processes = int(options["--processes"]) if "--processes" in options else None
+    random_mode = "--random" in options
+    ranges = parse_ranges(arguments[1:], random_mode)
+    if random_mode:
+        configurations = list(sample(ranges, int(options["--random"]), seed))
+    else:
+        configurations = list(grid(ranges))
+
+    start = time.perf_counter()
+    count = 0
+    try:
+        for record in sweep(path, configurations, runs, seed, max_days, processes):
+            count += 1
+            if "error" in record:
+                print(f"[{count}] {record['params']}: échec ({record['error']})")
+                continue
+            causes = ", ".join(f"{n} {c}" for n, c in record["causes"].items() if c)
+            print(
+                f"[{count}] {record['params']}: médiane {record['median_days']} j "
+                f"({causes})"
+            )
+    except ValueError as error:
+        sys.exit(str(error))
+    elapsed = time.perf_counter() - start
+    if count:
+        print(f"{count} configurations en {elapsed:.1f} s ({count / elapsed:.2f}/s)")
+
+    # Meilleures configurations parmi tous les résultats du fichier
+    results = sorted(
+        (r for r in load_results(path).values() if "error" not in r),
+        key=lambda r: r["median_days"],
+        reverse=True,
+    )
+    for record in results[:5]:
+        print(f"{record['median_days']:6.1f} j  {record['params']}")
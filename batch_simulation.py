@@ -0,0 +1,274 @@
+# Simulation vectorisée (NumPy) de nombreuses parties de survie indépendantes
+import sys
+import time
+
+import numpy as np
+
+from survival_core import (
+    BALANCE,
+    MAX_TEMPERATURE,
+    Weather,
+    TimeOfDay,
+)
+
+# Codes de Weather/TimeOfDay utilisés dans les tableaux
+SNOWY = Weather.SNOWY.value
+RAINY = Weather.RAINY.value
+WEATHER_VALUES = np.array([weather.value for weather in Weather], dtype=np.int8)
+MORNING = list(TimeOfDay).index(TimeOfDay.MORNING)
+NIGHT = list(TimeOfDay).index(TimeOfDay.NIGHT)
+TIME_PERIODS = len(TimeOfDay)
+
+# Causes de décès
+ALIVE = 0
+DEATH_THIRST = 1
+DEATH_HUNGER = 2
+DEATH_TEMPERATURE = 3
+CAUSES = {
+    ALIVE: "vivant",
+    DEATH_THIRST: "soif",
+    DEATH_HUNGER: "faim",
+    DEATH_TEMPERATURE: "température",
+}
+
+
+class BatchSimulation:
+    # Tableaux d'état, restreints aux parties encore en cours
+    STATE = [
+        "ids",
+        "health",
+        "hunger",
+        "thirst",
+        "energy",
+        "temperature",
+        "has_fire",
+        "fire_duration",
+        "has_shelter",
+        "time_of_day",
+        "weather",
+        "days_survived",
+        "next_period",
+        "active",
+    ]
+
+    def __init__(
+        self,
+        runs,
+        seed=None,
+        time_scale=None,
+        has_fire=False,
+        has_shelter=False,
+        fire_duration=0.0,
+        dtype=np.float64,
+        balance=BALANCE,
+    ):
+        if time_scale is None:
+            time_scale = balance.time_scale
+        self.runs = runs
+        self.rng = np.random.default_rng(seed)
+        self.balance = balance
+        self.time_scale = time_scale
+        self.tick = 0
+
+        def column(value, kind=dtype):
+            return np.array(np.broadcast_to(value, (runs,)), dtype=kind)
+
+        # État des joueurs
+        self.health = column(balance.max_health)
+        self.hunger = column(balance.max_hunger)
+        self.thirst = column(balance.max_thirst)
+        self.energy = column(balance.max_energy)
+        self.temperature = column(MAX_TEMPERATURE)
+        self.has_fire = column(has_fire, bool)
+        self.fire_duration = column(fire_duration)
+        self.has_shelter = column(has_shelter, bool)
+
+        # État du monde de chaque partie
+        self.time_of_day = column(MORNING, np.int8)
+        self.weather = column(Weather.SUNNY.value, np.int8)
+        self.days_survived = column(1, np.int32)
+        # Taux par tick, dans le type des tableaux d'état
+        cooling = np.zeros(max(WEATHER_VALUES) + 1)
+        cooling[SNOWY] = balance.snow_cooling * time_scale
+        cooling[RAINY] = balance.rain_cooling * time_scale
+        self.cooling = cooling.astype(dtype)
+        self.night_cooling = np.array(
+            [0.0, balance.night_cooling * time_scale], dtype=dtype
+        )
+        self.damage = np.array(
+            [
+                balance.starvation_damage * time_scale,
+                balance.dehydration_damage * time_scale,
+                balance.exposure_damage * time_scale,
+            ],
+            dtype=dtype,
+        )
+        self.period_chance = balance.period_chance * time_scale
+        self.next_period = self.rng.geometric(self.period_chance, runs)
+
+        # Résultats, indexés par numéro de partie
+        self.ids = np.arange(runs)
+        self.active = np.ones(runs, dtype=bool)
+        self.remaining = runs
+        self.alive = np.ones(runs, dtype=bool)
+        self.ticks_survived = np.zeros(runs, dtype=np.int64)
+        self.final_days = np.zeros(runs, dtype=np.int32)
+        self.cause = np.zeros(runs, dtype=np.int8)
+
+    def step(self):
+        count = self.remaining
+        if count == 0:
+            return 0
+        balance = self.balance
+        ts = self.time_scale
+        self.tick += 1
+
+        # Changement de période de la journée: l'instant du prochain changement
+        # est tiré selon la loi géométrique équivalente au test par tick
+        advance = self.next_period == self.tick
+        if advance.any():
+            changed = np.flatnonzero(advance)
+            self.next_period[changed] += self.rng.geometric(
+                self.period_chance, changed.size
+            )
+            self.time_of_day[changed] = (self.time_of_day[changed] + 1) % TIME_PERIODS
+            new_day = changed[self.time_of_day[changed] == MORNING]
+            self.days_survived[new_day] += 1
+            weather_change = new_day[
+                self.rng.random(new_day.size) < balance.weather_chance
+            ]
+            self.weather[weather_change] = self.rng.choice(
+                WEATHER_VALUES, weather_change.size
+            )
+
+        # Mise à jour du feu
+        has_fire = self.has_fire
+        if has_fire.any():
+            np.subtract(
+                self.fire_duration,
+                balance.fire_burn * ts,
+                out=self.fire_duration,
+                where=has_fire,
+            )
+            extinguished = has_fire & (self.fire_duration <= 0)
+            has_fire &= ~extinguished
+            self.fire_duration[extinguished] = 0.0
+
+        # Diminution naturelle des statistiques (Player.update_stats)
+        self.hunger -= balance.hunger_decay * ts
+        self.thirst -= balance.thirst_decay * ts
+        self.energy -= balance.energy_decay * ts
+
+        # Impact de la météo et de la nuit sur la température corporelle
+        # (tables de correspondance plutôt que des branches masquées)
+        night = self.time_of_day == NIGHT
+        temperature = self.temperature
+        temperature -= self.cooling[self.weather]
+        temperature -= self.night_cooling[night.view(np.int8)]
+
+        # Feu et abri
+        if has_fire.any():
+            warmed = np.minimum(temperature + balance.fire_warming, MAX_TEMPERATURE)
+            np.copyto(temperature, warmed, where=has_fire)
+        has_shelter = self.has_shelter
+        if has_shelter.any():
+            sheltered = has_shelter & (temperature < MAX_TEMPERATURE)
+            warmed = np.minimum(temperature + balance.shelter_warming, MAX_TEMPERATURE)
+            np.copyto(temperature, warmed, where=sheltered)
+            rested = np.minimum(self.energy + balance.shelter_rest, balance.max_energy)
+            np.copyto(self.energy, rested, where=has_shelter & night)
+
+        # Impact de la faim, de la soif et de la température sur la santé
+        starving = self.hunger <= 0
+        parched = self.thirst <= 0
+        exposed = np.abs(temperature - MAX_TEMPERATURE) > 2
+        damage = starving * self.damage[0]
+        damage += parched * self.damage[1]
+        damage += exposed * self.damage[2]
+        self.health -= damage
+
+        np.clip(self.hunger, 0, balance.max_hunger, out=self.hunger)
+        np.clip(self.thirst, 0, balance.max_thirst, out=self.thirst)
+        np.clip(self.energy, 0, balance.max_energy, out=self.energy)
+        np.clip(self.health, 0, balance.max_health, out=self.health)
+
+        # Fin de partie: enregistrer le résultat des parties terminées
+        dead = (self.health <= 0) & self.active
+        if dead.any():
+            cause = np.where(
+                parched,
+                DEATH_THIRST,
+                np.where(starving, DEATH_HUNGER, DEATH_TEMPERATURE),
+            )
+            self.record(dead, cause[dead])
+        return count
+
+    def record(self, finished, cause):
+        ids = self.ids[finished]
+        self.alive[ids] = cause == ALIVE
+        self.cause[ids] = cause
+        self.ticks_survived[ids] = self.tick
+        self.final_days[ids] = self.days_survived[finished]
+        self.active &= ~finished
+        self.remaining -= ids.size
+
+        # Compactage différé: les tableaux ne sont réduits que lorsqu'une
+        # part importante des lignes correspond à des parties terminées
+        if self.remaining <= self.active.size * 0.75:
+            keep = self.active
+            for name in self.STATE:
+                setattr(self, name, getattr(self, name)[keep])
+
+    def run(self, max_ticks=100000):
+        while self.tick < max_ticks and self.step():
+            pass
+        # Parties encore en vie à la limite de durée
+        if self.remaining:
+            finished = self.active.copy()
+            cause = np.full(int(finished.sum()), ALIVE, dtype=np.int8)
+            self.record(finished, cause)
+        return self.outcomes()
+
+    def outcomes(self):
+        return {
+            "days_survived": self.final_days.copy(),
+            "ticks_survived": self.ticks_survived.copy(),
+            "cause": self.cause.copy(),
+            "alive": self.alive.copy(),
+        }
+
+
+def simulate_runs(runs, seed=None, max_ticks=100000, chunk_size=100000, **kwargs):
+    # Découpage en lots pour borner la mémoire sur de très grands balayages
+    seeds = np.random.SeedSequence(seed).spawn(max(1, -(-runs // chunk_size)))
+    chunks = []
+    for chunk_seed, start in zip(seeds, range(0, runs, chunk_size)):
+        size = min(chunk_size, runs - start)
+        simulation = BatchSimulation(size, seed=chunk_seed, **kwargs)
+        chunks.append(simulation.run(max_ticks))
+    return {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+
+
+def summarize(outcomes):
+    days = outcomes["days_survived"]
+    causes = np.bincount(outcomes["cause"], minlength=len(CAUSES))
+    return {
+        "runs": int(days.size),
+        "median_days": float(np.median(days)),
+        "mean_days": float(days.mean()),
+        "p10_days": float(np.percentile(days, 10)),
+        "p90_days": float(np.percentile(days, 90)),
+        "causes": {CAUSES[code]: int(n) for code, n in enumerate(causes)},
+    }
+
+
+if __name__ == "__main__":
+    # python batch_simulation.py [parties] [--float32]
+    arguments = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    runs = int(arguments[0]) if arguments else 100000
+    dtype = np.float32 if "--float32" in sys.argv else np.float64
+    start = time.perf_counter()
+    outcomes = simulate_runs(runs, seed=0, dtype=dtype)
+    elapsed = time.perf_counter() - start
+    print(summarize(outcomes))
+    print(f"{runs} parties en {elapsed:.1f} s ({runs / elapsed:,.0f} parties/s)")
@@ -0,0 +1,283 @@
+# Banc de performance reproductible: ticks, images par état d'interface et actions
+#
+#   python benchmarks.py                      mesure et affiche
+#   python benchmarks.py --save base.json     enregistre une référence
+#   python benchmarks.py --compare base.json  compare à une référence (code 1 si régression)
+#   python benchmarks.py --startup            mesure seulement le démarrage
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+# Affichage factice: aucune fenêtre, le rendu se fait en mémoire
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from game_v2 import SurvivalGame  # noqa: E402
+from survival_core import (  # noqa: E402
+    MAX_ENERGY,
+    MAX_HEALTH,
+    MAX_HUNGER,
+    MAX_TEMPERATURE,
+    MAX_THIRST,
+    Inventory,
+    Item,
+)
+
+VERSION = 1
+SEED = 1234
+TICKS = 50000
+FRAMES = 200
+ACTION_REPEATS = 1000
+ROUNDS = 5  # chaque mesure garde la meilleure série, moins sensible au bruit
+THRESHOLD = 0.10  # écart toléré avant de signaler une régression
+STARTUP_TARGET_MS = 300  # objectif de délai avant la première image
+
+# Démarrage mesuré dans un interpréteur neuf: import, création du jeu, première image
+STARTUP_PROBE = """
+import json, time
+start = time.perf_counter()
+import game_v2
+imported = time.perf_counter()
+game = game_v2.SurvivalGame(seed={seed})
+game.initialize()
+ready = time.perf_counter()
+game.draw()
+done = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "initialize_ms": (ready - imported) * 1000,
+    "first_frame_ms": (done - start) * 1000,
+}}))
+"""
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index]
+
+
+def summarize(rounds, scale, unit):
+    # Meilleure moyenne et meilleur p99 parmi les séries de durées (en s)
+    return {
+        f"mean_{unit}": min(sum(times) / len(times) for times in rounds) * scale,
+        f"p99_{unit}": min(percentile(times, 0.99) for times in rounds) * scale,
+    }
+
+
+def reset(game):
+    # Même graine à chaque série: la charge de travail est identique d'un passage à l'autre
+    game.rng.seed(SEED)
+    game.initialize()
+
+
+def bench_ticks(game, ticks=TICKS, rounds=ROUNDS):
+    best = 0.0
+    for _ in range(rounds):
+        reset(game)
+        start = time.perf_counter()
+        for _ in range(ticks):
+            game.update_game_state()
+            if game.player.health <= 0:
+                reset(game)
+        best = max(best, ticks / (time.perf_counter() - start))
+    return best
+
+
+# États d'interface mesurés: préparation du jeu avant la série d'images
+UI_STATES = {
+    "hud": lambda game: None,
+    "inventory": lambda game: game.toggle_inventory(),
+    "crafting": lambda game: game.toggle_crafting(),
+    "popup": lambda game: game.show_rest_popup(),
+}
+
+
+def bench_frames(game, state, frames=FRAMES, rounds=ROUNDS):
+    samples = []
+    for _ in range(rounds):
+        reset(game)
+        game.inventory_visible = False
+        game.crafting_visible = False
+        game.active_popup = None
+        UI_STATES[state](game)
+
+        times = []
+        for _ in range(frames):
+            start = time.perf_counter()
+            game.input_router.update_hover(pygame.mouse.get_pos())
+            game.simulation_tick()
+            game.draw()
+            times.append(time.perf_counter() - start)
+        samples.append(times)
+    return summarize(samples, 1000, "ms")
+
+
+def restock(game, materials):
+    # Inventaire neuf et sans limite de poids, pour des mesures comparables
+    player = game.player
+    player.inventory = Inventory()
+    player.inventory.max_grams = 10**9
+    for name, quantity in materials.items():
+        player.inventory.add_item(Item.get(name), quantity)
+    # Joueur en pleine forme: aucune action ne tombe sur un joueur mort
+    player.health = MAX_HEALTH
+    player.hunger = MAX_HUNGER
+    player.thirst = MAX_THIRST
+    player.energy = MAX_ENERGY
+    player.body_temperature = MAX_TEMPERATURE
+    player.has_fire = False
+    player.fire_duration = 0
+    player.has_shelter = False
+
+
+# Actions mesurées: (matériaux fournis avant l'appel, appel)
+ACTIONS = {
+    "forage": ({}, lambda game: game.perform_action("forage")),
+    "hunt": ({"Lance en bois": 1}, lambda game: game.perform_action("hunt")),
+    "fire": ({"Bois": 3}, lambda game: game.perform_action("fire")),
+    "shelter": ({"Bois": 5, "Corde": 2}, lambda game: game.perform_action("shelter")),
+    "craft": (
+        {"Pierre": 2, "Bois": 1, "Corde": 1},
+        lambda game: game.craft_item("Hache de pierre"),
+    ),
+    "eat": ({"Baies": 1}, lambda game: game.consume_item("eat", "Baies")),
+    "rest": ({}, lambda game: game.rest(8)),
+}
+
+
+def bench_actions(game, repeats=ACTION_REPEATS, rounds=ROUNDS):
+    results = {}
+    for name, (materials, action) in ACTIONS.items():
+        samples = []
+        for _ in range(rounds):
+            reset(game)
+            times = []
+            for _ in range(repeats):
+                restock(game, materials)
+                start = time.perf_counter()
+                action(game)
+                times.append(time.perf_counter() - start)
+            samples.append(times)
+        results[name] = summarize(samples, 1e6, "us")
+    return results
+
+
+def bench_startup(rounds=ROUNDS):
+    directory = os.path.dirname(os.path.abspath(__file__))
+    samples = []
+    for _ in range(rounds):
+        output = subprocess.run(
+            [sys.executable, "-c", STARTUP_PROBE.format(seed=SEED)],
+            cwd=directory,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        samples.append(json.loads(output.splitlines()[-1]))
+    return {key: min(sample[key] for sample in samples) for key in samples[0]}
+
+
+def run_benchmarks():
+    game = SurvivalGame(seed=SEED)
+    return {
+        "version": VERSION,
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "ticks_per_second": bench_ticks(game),
+        "frames": {state: bench_frames(game, state) for state in UI_STATES},
+        "actions": bench_actions(game),
+        "startup": bench_startup(),
+    }
+
+
+def flatten(results):
+    # Métriques comparables: (nom, valeur, plus grand = meilleur, facteur de tolérance)
+    metrics = [("ticks_per_second", results["ticks_per_second"], True, 1)]
+    for key, value in results.get("startup", {}).items():
+        metrics.append((f"startup.{key}", value, False, 1))
+    for group in ("frames", "actions"):
+        for name, values in results[group].items():
+            for key, value in values.items():
+                # Les queues de distribution sont plus bruitées: tolérance double
+                tolerance = 2 if key.startswith("p99") else 1
+                metrics.append((f"{group}.{name}.{key}", value, False, tolerance))
+    return metrics
+
+
+def compare(results, baseline, threshold=THRESHOLD):
+    reference = {name: value for name, value, _, _ in flatten(baseline)}
+    regressions = []
+    for name, value, higher_is_better, tolerance in flatten(results):
+        if name not in reference or not reference[name]:
+            continue
+        change = (value - reference[name]) / reference[name]
+        worse = -change if higher_is_better else change
+        flag = "RÉGRESSION" if worse > threshold * tolerance else ""
+        print(
+            f"{name:32} {reference[name]:12.2f} -> {value:12.2f} {change:+7.1%} {flag}"
+        )
+        if flag:
+            regressions.append(name)
+
+    first_frame = results["startup"]["first_frame_ms"]
+    if first_frame > STARTUP_TARGET_MS:
+        print(
+            f"Première image en {first_frame:.0f} ms > objectif {STARTUP_TARGET_MS} ms"
+        )
+        regressions.append("startup.first_frame_ms")
+    return regressions
+
+
+def report(results):
+    print(f"Ticks: {results['ticks_per_second']:,.0f} ticks/s")
+    for state, values in results["frames"].items():
+        print(
+            f"Image {state:10} moyenne {values['mean_ms']:.3f} ms, "
+            f"p99 {values['p99_ms']:.3f} ms"
+        )
+    for name, values in results["actions"].items():
+        print(
+            f"Action {name:9} moyenne {values['mean_us']:.1f} µs, "
+            f"p99 {values['p99_us']:.1f} µs"
+        )
+    startup = results["startup"]
+    print(
+        f"Démarrage: import {startup['import_ms']:.0f} ms, "
+        f"initialisation {startup['initialize_ms']:.0f} ms, "
+        f"première image {startup['first_frame_ms']:.0f} ms "
+        f"(objectif {STARTUP_TARGET_MS} ms)"
+    )
+
+
+if __name__ == "__main__":
+    if "--startup" in sys.argv:
+        startup = bench_startup()
+        print(json.dumps(startup, indent=2))
+        sys.exit(0 if startup["first_frame_ms"] <= STARTUP_TARGET_MS else 1)
+
+    results = run_benchmarks()
+    report(results)
+
+    if "--save" in sys.argv:
+        path = sys.argv[sys.argv.index("--save") + 1]
+        with open(path, "w", encoding="utf-8") as target:
+            json.dump(results, target, indent=2)
+        print(f"Référence enregistrée: {path}")
+
+    if "--compare" in sys.argv:
+        path = sys.argv[sys.argv.index("--compare") + 1]
+        with open(path, encoding="utf-8") as source:
+            baseline = json.load(source)
+        if baseline.get("version") != VERSION:
+            sys.exit(f"Version de référence inconnue: {baseline.get('version')}")
+        threshold = THRESHOLD
+        if "--threshold" in sys.argv:
+            threshold = float(sys.argv[sys.argv.index("--threshold") + 1])
+        regressions = compare(results, baseline, threshold)
+        sys.exit(1 if regressions else 0)
@@ -1,1473 +1,1905 @@
-import pygame
-import random
-import math
-import os
-from enum import Enum
-import time
-
-# Initialisation de Pygame
-pygame.init()
-
-# Définition des constantes
-SCREEN_WIDTH = 1024
-SCREEN_HEIGHT = 768
-FPS = 60
-
-# Couleurs
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-RED = (255, 0, 0)
-GREEN = (0, 255, 0)
-BLUE = (0, 0, 255)
-GRAY = (150, 150, 150)
-DARK_GREEN = (0, 100, 0)
-BROWN = (139, 69, 19)
-LIGHT_BLUE = (173, 216, 230)
-YELLOW = (255, 255, 0)
-DARK_BLUE = (0, 0, 139)
-
-# Constantes de jeu
-MAX_HEALTH = 100
-MAX_HUNGER = 100
-MAX_THIRST = 100
-MAX_ENERGY = 100
-MAX_TEMPERATURE = 37.0  # température corporelle normale en °C
-
-
-# Énumération pour les conditions météorologiques
-class Weather(Enum):
-    SUNNY = 1
-    CLOUDY = 2
-    RAINY = 3
-    STORMY = 4
-    SNOWY = 5
-
-
-# Énumération pour les périodes de la journée
-class TimeOfDay(Enum):
-    MORNING = 1
-    AFTERNOON = 2
-    EVENING = 3
-    NIGHT = 4
-
-
-# Fonction pour charger les images
-def load_image(name, scale=1.0):
-    try:
-        image = pygame.image.load(name)
-        if scale != 1.0:
-            original_size = image.get_size()
-            new_size = (int(original_size[0] * scale), int(original_size[1] * scale))
-            image = pygame.transform.scale(image, new_size)
-        return image
-    except pygame.error:
-        # Si l'image n'est pas trouvée, créer une surface avec un motif de placeholder
-        size = (64, 64)
-        image = pygame.Surface(size)
-        for x in range(0, size[0], 8):
-            for y in range(0, size[1], 8):
-                color = (
-                    (100, 100, 100) if (x // 8 + y // 8) % 2 == 0 else (150, 150, 150)
-                )
-                pygame.draw.rect(image, color, (x, y, 8, 8))
-
-        # Ajouter le nom de l'image manquante
-        font = pygame.font.SysFont(None, 15)
-        text = font.render(os.path.basename(name), True, (255, 50, 50))
-        text_rect = text.get_rect(center=(size[0] // 2, size[1] // 2))
-        image.blit(text, text_rect)
-
-        if scale != 1.0:
-            original_size = image.get_size()
-            new_size = (int(original_size[0] * scale), int(original_size[1] * scale))
-            image = pygame.transform.scale(image, new_size)
-        return image
-
-
-# Classe pour représenter l'inventaire du joueur
-
-
-class Inventory:
-    def __init__(self):
-        self.items = {}
-        self.max_weight = 20.0  # poids maximum en kg
-        self.current_weight = 0.0
-
-    def add_item(self, item, quantity=1):
-        if self.current_weight + (item.weight * quantity) <= self.max_weight:
-            if item.name in self.items:
-                self.items[item.name] += quantity
-            else:
-                self.items[item.name] = quantity
-            self.current_weight += item.weight * quantity
-            return True
-        else:
-            return False
-
-    def remove_item(self, item_name, quantity=1):
-        if item_name in self.items and self.items[item_name] >= quantity:
-            self.items[item_name] -= quantity
-            item = next((i for i in Item.all_items if i.name == item_name), None)
-            if item:
-                self.current_weight -= item.weight * quantity
-            if self.items[item_name] <= 0:
-                del self.items[item_name]
-            return True
-        return False
-
-    def has_item(self, item_name, quantity=1):
-        return item_name in self.items and self.items[item_name] >= quantity
-
-
-# Classe pour les objets du jeu
-class Item:
-    all_items = []
-
-    def __init__(
-        self,
-        name,
-        weight,
-        description,
-        icon_name=None,
-        is_food=False,
-        is_drinkable=False,
-        is_weapon=False,
-        is_tool=False,
-        hunger_value=0,
-        thirst_value=0,
-        damage=0,
-        durability=100,
-    ):
-        self.name = name
-        self.weight = weight
-        self.description = description
-        self.icon_name = (
-            icon_name if icon_name else f"icons/{name.lower().replace(' ', '_')}.png"
-        )
-        self.is_food = is_food
-        self.is_drinkable = is_drinkable
-        self.is_weapon = is_weapon
-        self.is_tool = is_tool
-        self.hunger_value = hunger_value
-        self.thirst_value = thirst_value
-        self.damage = damage
-        self.durability = durability
-        self.icon = (
-            load_image(self.icon_name) if os.path.exists(self.icon_name) else None
-        )
-        if self.icon is None:
-            # Créer une icône par défaut
-            self.icon = pygame.Surface((64, 64))
-            self.icon.fill(GRAY)
-            font = pygame.font.SysFont(None, 20)
-            text = font.render(name[:10], True, BLACK)
-            text_rect = text.get_rect(center=(32, 32))
-            self.icon.blit(text, text_rect)
-        Item.all_items.append(self)
-
-    @classmethod
-    def initialize_items(cls):
-        # Nourriture
-        Item(
-            "Baies",
-            0.1,
-            "Des baies sauvages comestibles.",
-            is_food=True,
-            hunger_value=5,
-            thirst_value=2,
-        )
-        Item(
-            "Viande crue",
-            0.5,
-            "De la viande crue. Mieux vaut la cuire avant de la manger.",
-            is_food=True,
-            hunger_value=10,
-        )
-        Item(
-            "Viande cuite",
-            0.5,
-            "De la viande bien cuite.",
-            is_food=True,
-            hunger_value=30,
-        )
-
-        # Boisson
-        Item(
-            "Eau de pluie",
-            0.5,
-            "De l'eau de pluie recueillie.",
-            is_drinkable=True,
-            thirst_value=20,
-        )
-        Item(
-            "Eau purifiée",
-            0.5,
-            "De l'eau potable et purifiée.",
-            is_drinkable=True,
-            thirst_value=40,
-        )
-
-        # Armes
-        Item(
-            "Couteau de fortune",
-            0.3,
-            "Un couteau rudimentaire fabriqué avec des matériaux trouvés.",
-            is_weapon=True,
-            is_tool=True,
-            damage=10,
-            durability=50,
-        )
-        Item(
-            "Lance en bois",
-            1.2,
-            "Une lance taillée dans du bois.",
-            is_weapon=True,
-            damage=15,
-            durability=30,
-        )
-
-        # Outils
-        Item(
-            "Hache de pierre",
-            2.0,
-            "Une hache primitive faite de pierre et de bois.",
-            is_tool=True,
-            durability=40,
-        )
-        Item(
-            "Briquet",
-            0.1,
-            "Un briquet qui permet d'allumer un feu facilement.",
-            is_tool=True,
-            durability=100,
-        )
-
-        # Ressources
-        Item("Bois", 1.0, "Du bois ramassé dans la forêt.")
-        Item(
-            "Pierre",
-            0.8,
-            "Une pierre qui peut être utilisée pour fabriquer des outils.",
-        )
-        Item("Corde", 0.2, "Une corde fabriquée à partir de fibres végétales.")
-
-
-# Classe principale du joueur
-class Player:
-    def __init__(self, name):
-        self.name = name
-        self.health = MAX_HEALTH
-        self.hunger = MAX_HUNGER
-        self.thirst = MAX_THIRST
-        self.energy = MAX_ENERGY
-        self.body_temperature = MAX_TEMPERATURE
-        self.inventory = Inventory()
-        self.skills = {
-            "Survie": 1,
-            "Chasse": 1,
-            "Construction": 1,
-            "Cuisine": 1,
-            "Combat": 1,
-        }
-        self.has_shelter = False
-        self.has_fire = False
-        self.fire_duration = 0
-        self.message_log = []
-
-        # Position visuelle pour le joueur
-        self.x = SCREEN_WIDTH // 2
-        self.y = SCREEN_HEIGHT // 2
-
-        # Animation
-        self.animation_frame = 0
-        self.animation_time = 0
-
-    def add_message(self, message):
-        self.message_log.append(message)
-        if len(self.message_log) > 10:  # Limiter à 10 messages
-            self.message_log.pop(0)
-
-    def update_stats(self, game):
-        # Diminution naturelle des statistiques au fil du temps
-        self.hunger -= 0.05 * game.time_scale
-        self.thirst -= 0.1 * game.time_scale
-        self.energy -= 0.03 * game.time_scale
-
-        # Impact de la météo sur la température corporelle
-        if game.current_weather == Weather.SNOWY:
-            self.body_temperature -= 0.02 * game.time_scale
-        elif game.current_weather == Weather.RAINY:
-            self.body_temperature -= 0.01 * game.time_scale
-
-        # Impact du moment de la journée sur la température
-        if game.time_of_day == TimeOfDay.NIGHT:
-            self.body_temperature -= 0.01 * game.time_scale
-
-        # Impact du feu sur la température corporelle
-        if self.has_fire:
-            self.body_temperature = min(self.body_temperature + 0.02, MAX_TEMPERATURE)
-
-        # Impact d'un abri sur la température corporelle et l'énergie
-        if self.has_shelter:
-            if self.body_temperature < MAX_TEMPERATURE:
-                self.body_temperature = min(
-                    self.body_temperature + 0.005, MAX_TEMPERATURE
-                )
-
-            # Récupération d'énergie pendant la nuit si dans un abri
-            if game.time_of_day == TimeOfDay.NIGHT:
-                self.energy = min(self.energy + 0.05, MAX_ENERGY)
-
-        # Impact de la faim et de la soif sur la santé
-        if self.hunger <= 0:
-            self.health -= 0.1 * game.time_scale
-            self.hunger = 0
-
-        if self.thirst <= 0:
-            self.health -= 0.2 * game.time_scale
-            self.thirst = 0
-
-        # Impact de la température corporelle sur la santé
-        if abs(self.body_temperature - MAX_TEMPERATURE) > 2:
-            self.health -= 0.05 * game.time_scale
-
-        # Limites des statistiques
-        self.hunger = max(0, min(self.hunger, MAX_HUNGER))
-        self.thirst = max(0, min(self.thirst, MAX_THIRST))
-        self.energy = max(0, min(self.energy, MAX_ENERGY))
-        self.health = max(0, min(self.health, MAX_HEALTH))
-
-    def eat(self, item_name):
-        if not self.inventory.has_item(item_name):
-            self.add_message(f"Vous n'avez pas de {item_name} dans votre inventaire.")
-            return False
-
-        item = next((i for i in Item.all_items if i.name == item_name), None)
-        if not item or not item.is_food:
-            self.add_message(f"{item_name} n'est pas comestible.")
-            return False
-
-        self.hunger += item.hunger_value
-        self.thirst += item.thirst_value
-        self.inventory.remove_item(item_name)
-
-        self.add_message(f"Vous avez mangé {item_name}.")
-        if item_name == "Viande crue":
-            # Risque de maladie avec la viande crue
-            if random.random() < 0.3:
-                self.health -= 10
-                self.add_message(
-                    "Vous ne vous sentez pas bien après avoir mangé de la viande crue."
-                )
-
-        self.hunger = min(self.hunger, MAX_HUNGER)
-        self.thirst = min(self.thirst, MAX_THIRST)
-        return True
-
-    def drink(self, item_name):
-        if not self.inventory.has_item(item_name):
-            self.add_message(f"Vous n'avez pas de {item_name} dans votre inventaire.")
-            return False
-
-        item = next((i for i in Item.all_items if i.name == item_name), None)
-        if not item or not item.is_drinkable:
-            self.add_message(f"{item_name} n'est pas buvable.")
-            return False
-
-        self.thirst += item.thirst_value
-        self.inventory.remove_item(item_name)
-
-        self.add_message(f"Vous avez bu {item_name}.")
-        if item_name == "Eau de pluie" and random.random() < 0.2:
-            # Risque de maladie avec l'eau non purifiée
-            self.health -= 5
-            self.add_message("Cette eau n'était peut-être pas assez propre...")
-
-        self.thirst = min(self.thirst, MAX_THIRST)
-        return True
-
-    def rest(self, hours):
-        if not self.has_shelter and random.random() < 0.5:
-            # Risque en dormant sans abri
-            self.add_message(
-                "Vous avez été dérangé pendant votre sommeil et n'avez pas pu vous reposer correctement."
-            )
-            self.energy += hours * 5
-        else:
-            self.energy += hours * 10
-            self.add_message(f"Vous vous êtes reposé pendant {hours} heures.")
-
-        # Diminution de la faim et de la soif pendant le repos
-        self.hunger -= hours * 1
-        self.thirst -= hours * 1.5
-
-        self.energy = min(self.energy, MAX_ENERGY)
-        return True
-
-    def build_shelter(self):
-        required_materials = {"Bois": 5, "Corde": 2}
-
-        # Vérification des matériaux
-        for material, quantity in required_materials.items():
-            if not self.inventory.has_item(material, quantity):
-                self.add_message(
-                    f"Vous avez besoin de {quantity} {material} pour construire un abri."
-                )
-                return False
-
-        # Consommation des matériaux
-        for material, quantity in required_materials.items():
-            self.inventory.remove_item(material, quantity)
-
-        self.has_shelter = True
-        self.energy -= 20
-        self.add_message("Vous avez construit un abri simple mais efficace!")
-        return True
-
-    def make_fire(self):
-        required_materials = {"Bois": 3}
-
-        # Vérification des matériaux
-        for material, quantity in required_materials.items():
-            if not self.inventory.has_item(material, quantity):
-                self.add_message(
-                    f"Vous avez besoin de {quantity} {material} pour faire un feu."
-                )
-                return False
-
-        # Vérification du briquet
-        has_lighter = self.inventory.has_item("Briquet")
-
-        # Consommation des matériaux
-        for material, quantity in required_materials.items():
-            self.inventory.remove_item(material, quantity)
-
-        # Chance de réussite
-        success_chance = 0.9 if has_lighter else 0.5
-
-        if random.random() < success_chance:
-            self.has_fire = True
-            self.fire_duration = 8  # Le feu dure 8 heures
-            self.energy -= 10
-            self.add_message("Vous avez réussi à allumer un feu!")
-            return True
-        else:
-            self.add_message("Vous n'avez pas réussi à allumer le feu.")
-            return False
-
-    def cook(self, item_name):
-        if not self.has_fire:
-            self.add_message("Vous avez besoin d'un feu pour cuisiner.")
-            return False
-
-        if item_name == "Viande crue" and self.inventory.has_item(item_name):
-            self.inventory.remove_item(item_name)
-            self.inventory.add_item(
-                next(i for i in Item.all_items if i.name == "Viande cuite")
-            )
-            self.add_message("Vous avez cuisiné de la viande crue en viande cuite.")
-
-            # Amélioration de la compétence de cuisine
-            self.skills["Cuisine"] += 0.1
-            return True
-        else:
-            self.add_message(f"Vous ne pouvez pas cuisiner {item_name}.")
-            return False
-
-    def hunt(self, game):
-        if self.energy < 20:
-            self.add_message("Vous êtes trop fatigué pour chasser.")
-            return False
-
-        # Vérification d'une arme
-        has_weapon = any(
-            item_name
-            for item_name in self.inventory.items
-            if next((i for i in Item.all_items if i.name == item_name), None).is_weapon
-        )
-
-        success_chance = 0.3 + (0.1 * self.skills["Chasse"])
-        if has_weapon:
-            success_chance += 0.2
-
-        if random.random() < success_chance:
-            # Réussite de la chasse
-            meat_qty = random.randint(1, 3)
-            for _ in range(meat_qty):
-                self.inventory.add_item(
-                    next(i for i in Item.all_items if i.name == "Viande crue")
-                )
-
-            self.add_message(
-                f"Chasse réussie! Vous avez obtenu {meat_qty} morceaux de viande crue."
-            )
-
-            # Amélioration de la compétence de chasse
-            self.skills["Chasse"] += 0.2
-        else:
-            self.add_message("Vous n'avez rien trouvé à chasser.")
-
-        self.energy -= 20
-        self.hunger -= 5
-        self.thirst -= 10
-        return True
-
-    def forage(self, game):
-        if self.energy < 15:
-            self.add_message("Vous êtes trop fatigué pour chercher des ressources.")
-            return False
-
-        # Recherche de ressources basée sur l'environnement actuel
-        found_items = []
-
-        # Chances de trouver des ressources
-        if game.current_weather != Weather.STORMY:
-            if random.random() < 0.7:
-                wood_qty = random.randint(1, 3)
-                for _ in range(wood_qty):
-                    self.inventory.add_item(
-                        next(i for i in Item.all_items if i.name == "Bois")
-                    )
-                found_items.append(f"{wood_qty} Bois")
-
-            if random.random() < 0.5:
-                stone_qty = random.randint(1, 2)
-                for _ in range(stone_qty):
-                    self.inventory.add_item(
-                        next(i for i in Item.all_items if i.name == "Pierre")
-                    )
-                found_items.append(f"{stone_qty} Pierre")
-
-            if random.random() < 0.3:
-                self.inventory.add_item(
-                    next(i for i in Item.all_items if i.name == "Corde")
-                )
-                found_items.append("1 Corde")
-
-            if random.random() < 0.4:
-                berry_qty = random.randint(1, 4)
-                for _ in range(berry_qty):
-                    self.inventory.add_item(
-                        next(i for i in Item.all_items if i.name == "Baies")
-                    )
-                found_items.append(f"{berry_qty} Baies")
-
-            # Collecte d'eau pendant la pluie
-            if game.current_weather == Weather.RAINY and random.random() < 0.8:
-                water_qty = random.randint(1, 2)
-                for _ in range(water_qty):
-                    self.inventory.add_item(
-                        next(i for i in Item.all_items if i.name == "Eau de pluie")
-                    )
-                found_items.append(f"{water_qty} Eau de pluie")
-
-        if found_items:
-            self.add_message(f"Vous avez trouvé: {', '.join(found_items)}")
-        else:
-            self.add_message("Vous n'avez rien trouvé d'intéressant.")
-
-        self.energy -= 15
-        self.hunger -= 3
-        self.thirst -= 7
-        return True
-
-    def craft(self, item_name):
-        crafting_recipes = {
-            "Couteau de fortune": {"Pierre": 1, "Bois": 1},
-            "Lance en bois": {"Bois": 2, "Corde": 1},
-            "Hache de pierre": {"Pierre": 2, "Bois": 1, "Corde": 1},
-        }
-
-        if item_name not in crafting_recipes:
-            self.add_message(f"Vous ne savez pas fabriquer {item_name}.")
-            return False
-
-        required_materials = crafting_recipes[item_name]
-
-        # Vérification des matériaux
-        for material, quantity in required_materials.items():
-            if not self.inventory.has_item(material, quantity):
-                self.add_message(
-                    f"Vous avez besoin de {quantity} {material} pour fabriquer {item_name}."
-                )
-                return False
-
-        # Consommation des matériaux
-        for material, quantity in required_materials.items():
-            self.inventory.remove_item(material, quantity)
-
-        # Ajout de l'objet fabriqué
-        self.inventory.add_item(next(i for i in Item.all_items if i.name == item_name))
-
-        self.add_message(f"Vous avez fabriqué {item_name}!")
-
-        # Amélioration de la compétence de construction
-        self.skills["Construction"] += 0.2
-        self.energy -= 10
-        return True
-
-    def purify_water(self):
-        if not self.has_fire:
-            self.add_message("Vous avez besoin d'un feu pour purifier l'eau.")
-            return False
-
-        if not self.inventory.has_item("Eau de pluie"):
-            self.add_message("Vous n'avez pas d'eau de pluie à purifier.")
-            return False
-
-        self.inventory.remove_item("Eau de pluie")
-        self.inventory.add_item(
-            next(i for i in Item.all_items if i.name == "Eau purifiée")
-        )
-
-        self.add_message("Vous avez purifié de l'eau de pluie en eau potable.")
-        return True
-
-
-# Interface utilisateur
-class Button:
-    def __init__(
-        self,
-        x,
-        y,
-        width,
-        height,
-        text,
-        color=GRAY,
-        hover_color=LIGHT_BLUE,
-        text_color=BLACK,
-        action=None,
-    ):
-        self.rect = pygame.Rect(x, y, width, height)
-        self.text = text
-        self.color = color
-        self.hover_color = hover_color
-        self.text_color = text_color
-        self.action = action
-        self.hovered = False
-
-    def draw(self, screen):
-        color = self.hover_color if self.hovered else self.color
-        pygame.draw.rect(screen, color, self.rect, 0, 5)
-        pygame.draw.rect(screen, BLACK, self.rect, 2, 5)
-
-        font = pygame.font.SysFont(None, 24)
-        text_surface = font.render(self.text, True, self.text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
-
-    def update(self, mouse_pos):
-        self.hovered = self.rect.collidepoint(mouse_pos)
-
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.hovered:
-            if self.action:
-                return self.action()
-        return False
-
-
-# Classe pour la gestion des popups
-class Popup:
-    def __init__(self, title, content, buttons=None):
-        self.title = title
-        self.content = content
-        self.buttons = buttons if buttons else []
-        self.active = True
-
-        # Dimensionnement du popup
-        self.width = 400
-        self.height = 300
-        self.x = (SCREEN_WIDTH - self.width) // 2
-        self.y = (SCREEN_HEIGHT - self.height) // 2
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
-
-    def draw(self, screen):
-        if not self.active:
-            return
-
-        # Fond semi-transparent
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        screen.blit(overlay, (0, 0))
-
-        # Fond du popup
-        pygame.draw.rect(screen, WHITE, self.rect, 0, 10)
-        pygame.draw.rect(screen, BLACK, self.rect, 2, 10)
-
-        # Titre
-        font_title = pygame.font.SysFont(None, 32)
-        text_title = font_title.render(self.title, True, BLACK)
-        screen.blit(text_title, (self.x + 20, self.y + 20))
-
-        # Contenu
-        font_content = pygame.font.SysFont(None, 24)
-        lines = self.content.split("\n")
-        for i, line in enumerate(lines):
-            text_line = font_content.render(line, True, BLACK)
-            screen.blit(text_line, (self.x + 20, self.y + 60 + i * 30))
-
-        # Boutons
-        for button in self.buttons:
-            button.draw(screen)
-
-    def update(self, mouse_pos):
-        if not self.active:
-            return
-
-        for button in self.buttons:
-            button.update(mouse_pos)
-
-    def handle_event(self, event):
-        if not self.active:
-            return False
-
-        for button in self.buttons:
-            if button.handle_event(event):
-                return True
-        return False
-
-
-# Classe principale du jeu
-class SurvivalGame:
-    def __init__(self):
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        pygame.display.set_caption("Survie Réaliste - Jeu de Simulation")
-        self.clock = pygame.time.Clock()
-        self.player = None
-        self.days_survived = 1
-        self.time_of_day = TimeOfDay.MORNING
-        self.current_weather = Weather.SUNNY
-        self.time_scale = 0.1  # Facteur d'écoulement du temps
-        self.running = True
-
-        # Interface
-        self.buttons = []
-        self.active_popup = None
-        self.inventory_visible = False
-        self.crafting_visible = False
-
-        # Images de fond selon le temps/jour
-        self.background_images = {
-            # Format: (TimeOfDay, Weather): image_path
-            (TimeOfDay.MORNING, Weather.SUNNY): "bg_morning_sunny.png",
-            (TimeOfDay.AFTERNOON, Weather.SUNNY): "bg_afternoon_sunny.png",
-            (TimeOfDay.EVENING, Weather.SUNNY): "bg_evening_sunny.png",
-            (TimeOfDay.NIGHT, Weather.SUNNY): "bg_night_sunny.png",
-            # Etc. pour d'autres combinaisons
-        }
-
-        # Image par défaut
-        self.default_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.default_bg.fill((100, 150, 200))  # Bleu ciel par défaut
-
-        # Chargement des ressources
-        self.initialize_resources()
-
-        # Actions
-        self.initialize_actions()
-
-    def initialize_resources(self):
-        # Charger les images (ou créer des placeholders)
-        self.images = {
-            "player": load_image("player.png"),
-            "fire": load_image("fire.png"),
-            "shelter": load_image("shelter.png"),
-            # Charger les backgrounds ici s'ils existent
-        }
-
-    def toggle_inventory(self):
-        self.inventory_visible = not self.inventory_visible
-        self.crafting_visible = False
-        return True
-
-    def toggle_crafting(self):
-        self.crafting_visible = not self.crafting_visible
-        self.inventory_visible = False
-        return True
-
-    def show_consume_popup(self):
-        content = "Que voulez-vous consommer?"
-        buttons = []
-
-        food_items = [
-            name
-            for name, qty in self.player.inventory.items.items()
-            if next((i for i in Item.all_items if i.name == name), None).is_food
-        ]
-
-        drink_items = [
-            name
-            for name, qty in self.player.inventory.items.items()
-            if next((i for i in Item.all_items if i.name == name), None).is_drinkable
-        ]
-
-        y_offset = 0
-        for i, item in enumerate(food_items):
-            y = self.screen.get_height() // 2 - 50 + y_offset
-            buttons.append(
-                Button(
-                    self.screen.get_width() // 2 - 180,
-                    y,
-                    150,
-                    30,
-                    f"Manger {item}",
-                    action=lambda i=item: self.consume_item("eat", i),
-                )
-            )
-            y_offset += 40
-
-        y_offset = 0
-        for i, item in enumerate(drink_items):
-            y = self.screen.get_height() // 2 - 50 + y_offset
-            buttons.append(
-                Button(
-                    self.screen.get_width() // 2 + 30,
-                    y,
-                    150,
-                    30,
-                    f"Boire {item}",
-                    action=lambda i=item: self.consume_item("drink", i),
-                )
-            )
-            y_offset += 40
-
-        # Bouton Annuler
-        buttons.append(
-            Button(
-                self.screen.get_width() // 2 - 40,
-                self.screen.get_height() // 2 + 100,
-                80,
-                30,
-                "Annuler",
-                action=self.close_popup,
-            )
-        )
-
-        self.active_popup = Popup("Consommer", content, buttons)
-        return True
-
-    def perform_action(self, action):
-        if action == "hunt":
-            self.player.hunt(self)
-        elif action == "forage":
-            self.player.forage(self)
-        elif action == "fire":
-            if self.player.has_fire:
-                self.player.add_message("Vous avez déjà un feu allumé.")
-            else:
-                self.player.make_fire()
-        elif action == "shelter":
-            if self.player.has_shelter:
-                self.player.add_message("Vous avez déjà construit un abri.")
-            else:
-                self.player.build_shelter()
-        return True
-
-    def show_rest_popup(self):
-        content = "Combien d'heures voulez-vous vous reposer?"
-        buttons = []
-
-        for hours in [2, 4, 8]:
-            buttons.append(
-                Button(
-                    self.screen.get_width() // 2 - 40,
-                    self.screen.get_height() // 2 - 30 + hours * 10,
-                    80,
-                    30,
-                    f"{hours}h",
-                    action=lambda h=hours: self.rest(h),
-                )
-            )
-
-        # Bouton Annuler
-        buttons.append(
-            Button(
-                self.screen.get_width() // 2 - 40,
-                self.screen.get_height() // 2 + 70,
-                80,
-                30,
-                "Annuler",
-                action=self.close_popup,
-            )
-        )
-
-        self.active_popup = Popup("Repos", content, buttons)
-        return True
-
-    def initialize_actions(self):
-        button_width = 130
-        button_height = 40
-        button_margin = 10
-        start_x = 20
-        start_y = SCREEN_HEIGHT - 50
-
-        actions = [
-            {"text": "Inventaire", "action": self.toggle_inventory},
-            {"text": "Fabriquer", "action": self.toggle_crafting},
-            {"text": "Manger/Boire", "action": self.show_consume_popup},
-            {"text": "Chasser", "action": lambda: self.perform_action("hunt")},
-            {"text": "Cueillette", "action": lambda: self.perform_action("forage")},
-            {"text": "Feu", "action": lambda: self.perform_action("fire")},
-            {"text": "Abri", "action": lambda: self.perform_action("shelter")},
-            {"text": "Repos", "action": self.show_rest_popup},
-        ]
-
-        for i, action in enumerate(actions):
-            x = start_x + (button_width + button_margin) * (i % 4)
-            y = start_y - (button_height + button_margin) * (i // 4)
-            self.buttons.append(
-                Button(
-                    x,
-                    y,
-                    button_width,
-                    button_height,
-                    action["text"],
-                    action=action["action"],
-                )
-            )
-
-    def initialize(self):
-        # Créer le joueur
-        self.player = Player("Survivant")
-
-        # Initialisation des objets du jeu
-        Item.initialize_items()
-
-        # Objets de départ
-        self.player.inventory.add_item(
-            next(i for i in Item.all_items if i.name == "Couteau de fortune")
-        )
-        self.player.inventory.add_item(
-            next(i for i in Item.all_items if i.name == "Baies"), 2
-        )
-        self.player.inventory.add_item(
-            next(i for i in Item.all_items if i.name == "Eau de pluie")
-        )
-
-        # Message de bienvenue
-        self.player.add_message(
-            "Vous vous réveillez dans une forêt inconnue. Vous devez survivre."
-        )
-
-    def update_game_state(self):
-        # Mise à jour du temps de jeu
-        if random.random() < 0.05 * self.time_scale:
-            # Changement de la période de la journée
-            times = list(TimeOfDay)
-            current_index = times.index(self.time_of_day)
-            self.time_of_day = times[(current_index + 1) % len(times)]
-
-            if self.time_of_day == TimeOfDay.MORNING:
-                # Nouvelle journée
-                self.days_survived += 1
-                self.player.add_message(f"Jour {self.days_survived}")
-
-                # Chance de changement météo
-                if random.random() < 0.3:
-                    weathers = list(Weather)
-                    self.current_weather = random.choice(weathers)
-                    self.player.add_message(
-                        f"Le temps change: {self.current_weather.name}"
-                    )
-
-        # Mise à jour du feu
-        if self.player.has_fire:
-            self.player.fire_duration -= 0.1 * self.time_scale
-            if self.player.fire_duration <= 0:
-                self.player.has_fire = False
-                self.player.fire_duration = 0
-                self.player.add_message("Le feu s'est éteint.")
-
-        # Mise à jour des statistiques du joueur
-        self.player.update_stats(self)
-
-        # Vérification de fin de jeu
-        if self.player.health <= 0:
-            self.show_game_over_popup()
-
-    def show_game_over_popup(self):
-        content = f"Vous n'avez pas survécu.\nJours de survie: {self.days_survived}\n\nVoulez-vous recommencer?"
-        buttons = [
-            Button(
-                self.screen.get_width() // 2 - 100,
-                self.screen.get_height() // 2 + 50,
-                80,
-                40,
-                "Oui",
-                action=self.restart_game,
-            ),
-            Button(
-                self.screen.get_width() // 2 + 20,
-                self.screen.get_height() // 2 + 50,
-                80,
-                40,
-                "Non",
-                action=self.quit_game,
-            ),
-        ]
-        self.active_popup = Popup("Fin de partie", content, buttons)
-
-    def restart_game(self):
-        self.active_popup = None
-        self.initialize()
-        return True
-
-    def quit_game(self):
-        self.running = False
-        return True
-
-    def consume_item(self, action_type, item_name):
-        if action_type == "eat":
-            self.player.eat(item_name)
-        elif action_type == "drink":
-            self.player.drink(item_name)
-
-        self.active_popup = None
-        return True
-
-    def rest(self, hours):
-        self.player.rest(hours)
-
-        # Accélération du temps
-        for _ in range(int(hours * 10)):
-            self.update_game_state()
-
-        self.active_popup = None
-        return True
-
-    def close_popup(self):
-        self.active_popup = None
-        return True
-
-    def draw_status_bars(self):
-        # Barres de statut pour santé, faim, soif, énergie et température
-        bar_width = 150
-        bar_height = 20
-        bar_margin = 10
-        start_x = 20
-        start_y = 20
-
-        stats = [
-            {
-                "name": "Santé",
-                "value": self.player.health,
-                "max": MAX_HEALTH,
-                "color": RED,
-            },
-            {
-                "name": "Faim",
-                "value": self.player.hunger,
-                "max": MAX_HUNGER,
-                "color": GREEN,
-            },
-            {
-                "name": "Soif",
-                "value": self.player.thirst,
-                "max": MAX_THIRST,
-                "color": BLUE,
-            },
-            {
-                "name": "Énergie",
-                "value": self.player.energy,
-                "max": MAX_ENERGY,
-                "color": YELLOW,
-            },
-        ]
-
-        font = pygame.font.SysFont(None, 24)
-
-        for i, stat in enumerate(stats):
-            # Cadre
-            bar_rect = pygame.Rect(
-                start_x, start_y + (bar_height + bar_margin) * i, bar_width, bar_height
-            )
-            pygame.draw.rect(self.screen, BLACK, bar_rect, 2)
-
-            # Remplissage
-            fill_width = int((stat["value"] / stat["max"]) * (bar_width - 4))
-            fill_rect = pygame.Rect(
-                start_x + 2,
-                start_y + 2 + (bar_height + bar_margin) * i,
-                fill_width,
-                bar_height - 4,
-            )
-            pygame.draw.rect(self.screen, stat["color"], fill_rect)
-
-            # Texte
-            text = font.render(
-                f"{stat['name']}: {int(stat['value'])}/{stat['max']}", True, BLACK
-            )
-            self.screen.blit(
-                text,
-                (start_x + bar_width + 10, start_y + (bar_height + bar_margin) * i),
-            )
-
-        # Température
-        temp_y = start_y + (bar_height + bar_margin) * len(stats)
-        temp_text = font.render(
-            f"Température: {self.player.body_temperature:.1f}°C", True, BLACK
-        )
-        self.screen.blit(temp_text, (start_x, temp_y))
-
-        # Jour et temps
-        day_text = font.render(
-            f"Jour: {self.days_survived} - {self.time_of_day.name}", True, BLACK
-        )
-        self.screen.blit(day_text, (start_x, temp_y + 30))
-
-        # Météo
-        weather_text = font.render(f"Météo: {self.current_weather.name}", True, BLACK)
-        self.screen.blit(weather_text, (start_x, temp_y + 60))
-
-    def draw_message_log(self):
-        font = pygame.font.SysFont(None, 20)
-        log_width = 300
-        log_height = 150
-        log_x = SCREEN_WIDTH - log_width - 20
-        log_y = 20
-
-        # Fond semi-transparent
-        log_surface = pygame.Surface((log_width, log_height), pygame.SRCALPHA)
-        log_surface.fill((0, 0, 0, 128))
-        self.screen.blit(log_surface, (log_x, log_y))
-
-        # Bordure
-        pygame.draw.rect(self.screen, WHITE, (log_x, log_y, log_width, log_height), 2)
-
-        # Messages
-        for i, message in enumerate(self.player.message_log):
-            if i >= 8:  # Limiter à 8 messages affichés
-                break
-            text = font.render(message, True, WHITE)
-            self.screen.blit(text, (log_x + 10, log_y + 10 + i * 20))
-
-    def draw_inventory(self):
-        if not self.inventory_visible:
-            return
-
-        inventory_width = 400
-        inventory_height = 400
-        inventory_x = (SCREEN_WIDTH - inventory_width) // 2
-        inventory_y = (SCREEN_HEIGHT - inventory_height) // 2
-
-        # Fond semi-transparent
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
-
-        # Fond de l'inventaire
-        inventory_surface = pygame.Surface((inventory_width, inventory_height))
-        inventory_surface.fill(WHITE)
-        self.screen.blit(inventory_surface, (inventory_x, inventory_y))
-
-        # Bordure
-        pygame.draw.rect(
-            self.screen,
-            BLACK,
-            (inventory_x, inventory_y, inventory_width, inventory_height),
-            2,
-        )
-
-        # Titre
-        font_title = pygame.font.SysFont(None, 32)
-        title_text = font_title.render(
-            f"Inventaire ({self.player.inventory.current_weight:.1f}/{self.player.inventory.max_weight} kg)",
-            True,
-            BLACK,
-        )
-        self.screen.blit(title_text, (inventory_x + 10, inventory_y + 10))
-
-        # Items
-        font_items = pygame.font.SysFont(None, 24)
-        item_y = inventory_y + 50
-        for item_name, quantity in self.player.inventory.items.items():
-            item = next((i for i in Item.all_items if i.name == item_name), None)
-            if item:
-                item_text = font_items.render(
-                    f"{item_name} x{quantity} ({item.weight * quantity:.1f} kg)",
-                    True,
-                    BLACK,
-                )
-                if item.icon:
-                    self.screen.blit(item.icon, (inventory_x + 10, item_y))
-                    self.screen.blit(item_text, (inventory_x + 80, item_y + 10))
-                else:
-                    self.screen.blit(item_text, (inventory_x + 10, item_y))
-
-                item_y += 40
-
-        # Bouton Fermer
-        close_button = Button(
-            inventory_x + inventory_width - 90,
-            inventory_y + inventory_height - 40,
-            80,
-            30,
-            "Fermer",
-            action=self.toggle_inventory,
-        )
-        close_button.draw(self.screen)
-
-    def draw_crafting(self):
-        if not self.crafting_visible:
-            return
-
-        crafting_width = 500
-        crafting_height = 400
-        crafting_x = (SCREEN_WIDTH - crafting_width) // 2
-        crafting_y = (SCREEN_HEIGHT - crafting_height) // 2
-
-        # Fond semi-transparent
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        self.screen.blit(overlay, (0, 0))
-
-        # Fond du crafting
-        crafting_surface = pygame.Surface((crafting_width, crafting_height))
-        crafting_surface.fill(WHITE)
-        self.screen.blit(crafting_surface, (crafting_x, crafting_y))
-
-        # Bordure
-        pygame.draw.rect(
-            self.screen,
-            BLACK,
-            (crafting_x, crafting_y, crafting_width, crafting_height),
-            2,
-        )
-
-        # Titre
-        font_title = pygame.font.SysFont(None, 32)
-        title_text = font_title.render("Fabrication", True, BLACK)
-        self.screen.blit(title_text, (crafting_x + 10, crafting_y + 10))
-
-        # Recettes
-        font_items = pygame.font.SysFont(None, 24)
-        recipes = [
-            {"name": "Couteau de fortune", "materials": {"Pierre": 1, "Bois": 1}},
-            {"name": "Lance en bois", "materials": {"Bois": 2, "Corde": 1}},
-            {
-                "name": "Hache de pierre",
-                "materials": {"Pierre": 2, "Bois": 1, "Corde": 1},
-            },
-            {"name": "Purifier l'eau", "special": "purify_water"},
-        ]
-
-        item_y = crafting_y + 50
-        buttons = []
-
-        for recipe in recipes:
-            if "special" in recipe:
-                # Action spéciale
-                text = "Purifier l'eau (Eau de pluie + Feu)"
-                can_craft = self.player.has_fire and self.player.inventory.has_item(
-                    "Eau de pluie"
-                )
-            else:
-                # Recette standard
-                text = f"{recipe['name']} - Matériaux: " + ", ".join(
-                    [f"{qty} {mat}" for mat, qty in recipe["materials"].items()]
-                )
-                can_craft = all(
-                    self.player.inventory.has_item(mat, qty)
-                    for mat, qty in recipe["materials"].items()
-                )
-
-            item_text = font_items.render(text, True, BLACK)
-            self.screen.blit(item_text, (crafting_x + 10, item_y))
-
-            # Bouton Fabriquer
-            button_color = GREEN if can_craft else GRAY
-            if "special" in recipe:
-                craft_action = lambda r=recipe["special"]: self.special_craft(r)
-            else:
-                craft_action = lambda r=recipe["name"]: self.craft_item(r)
-
-            craft_button = Button(
-                crafting_x + crafting_width - 110,
-                item_y,
-                100,
-                30,
-                "Fabriquer",
-                color=button_color,
-                action=craft_action,
-            )
-            craft_button.draw(self.screen)
-            buttons.append(craft_button)
-
-            item_y += 60
-
-        # Bouton Fermer
-        close_button = Button(
-            crafting_x + crafting_width - 90,
-            crafting_y + crafting_height - 40,
-            80,
-            30,
-            "Fermer",
-            action=self.toggle_crafting,
-        )
-        close_button.draw(self.screen)
-        buttons.append(close_button)
-
-        # Mise à jour et gestion des boutons
-        mouse_pos = pygame.mouse.get_pos()
-        for button in buttons:
-            button.update(mouse_pos)
-
-    def craft_item(self, item_name):
-        self.player.craft(item_name)
-        return True
-
-    def special_craft(self, action):
-        if action == "purify_water":
-            self.player.purify_water()
-        return True
-
-    def draw(self):
-        # Fond d'écran selon la météo et l'heure
-        background_key = (self.time_of_day, self.current_weather)
-        if background_key in self.background_images:
-            bg_path = self.background_images[background_key]
-            if os.path.exists(bg_path):
-                bg_image = load_image(bg_path, scale=1.0)
-                self.screen.blit(bg_image, (0, 0))
-            else:
-                self.screen.blit(self.default_bg, (0, 0))
-        else:
-            self.screen.blit(self.default_bg, (0, 0))
-
-        # Dessin des éléments de jeu
-        if self.player.has_shelter:
-            self.screen.blit(
-                self.images["shelter"], (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2)
-            )
-
-        if self.player.has_fire:
-            self.screen.blit(
-                self.images["fire"], (SCREEN_WIDTH // 2 + 50, SCREEN_HEIGHT // 2 + 30)
-            )
-
-        # Joueur
-        self.screen.blit(self.images["player"], (self.player.x, self.player.y))
-
-        # Interface utilisateur
-        self.draw_status_bars()
-        self.draw_message_log()
-
-        # Boutons d'action
-        for button in self.buttons:
-            button.draw(self.screen)
-
-        # Inventaire et crafting (si visible)
-        self.draw_inventory()
-        self.draw_crafting()
-
-        # Popup (si actif)
-        if self.active_popup:
-            self.active_popup.draw(self.screen)
-
-        # Mise à jour de l'écran
-        pygame.display.flip()
-
-    def run(self):
-        self.initialize()
-
-        while self.running:
-            mouse_pos = pygame.mouse.get_pos()
-
-            # Gestion des événements
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
-
-                # Gérer les clics sur les boutons
-                if self.active_popup:
-                    self.active_popup.handle_event(event)
-                elif self.inventory_visible:
-                    if event.type == pygame.MOUSEBUTTONDOWN:
-                        # Bouton pour fermer l'inventaire
-                        inventory_width = 400
-                        inventory_height = 400
-                        inventory_x = (SCREEN_WIDTH - inventory_width) // 2
-                        inventory_y = (SCREEN_HEIGHT - inventory_height) // 2
-                        close_button_rect = pygame.Rect(
-                            inventory_x + inventory_width - 90,
-                            inventory_y + inventory_height - 40,
-                            80,
-                            30,
-                        )
-                        if close_button_rect.collidepoint(event.pos):
-                            self.inventory_visible = False
-                elif self.crafting_visible:
-                    # Gestion des boutons de crafting
-                    if event.type == pygame.MOUSEBUTTONDOWN:
-                        crafting_width = 500
-                        crafting_height = 400
-                        crafting_x = (SCREEN_WIDTH - crafting_width) // 2
-                        crafting_y = (SCREEN_HEIGHT - crafting_height) // 2
-
-                        # Vérifier les boutons de crafting
-                        recipes = [
-                            {
-                                "name": "Couteau de fortune",
-                                "materials": {"Pierre": 1, "Bois": 1},
-                            },
-                            {
-                                "name": "Lance en bois",
-                                "materials": {"Bois": 2, "Corde": 1},
-                            },
-                            {
-                                "name": "Hache de pierre",
-                                "materials": {"Pierre": 2, "Bois": 1, "Corde": 1},
-                            },
-                            {"name": "Purifier l'eau", "special": "purify_water"},
-                        ]
-
-                        for i, recipe in enumerate(recipes):
-                            craft_button_rect = pygame.Rect(
-                                crafting_x + crafting_width - 110,
-                                crafting_y + 50 + i * 60,
-                                100,
-                                30,
-                            )
-                            if craft_button_rect.collidepoint(event.pos):
-                                if "special" in recipe:
-                                    self.special_craft(recipe["special"])
-                                else:
-                                    self.craft_item(recipe["name"])
-
-                        # Bouton pour fermer le crafting
-                        close_button_rect = pygame.Rect(
-                            crafting_x + crafting_width - 90,
-                            crafting_y + crafting_height - 40,
-                            80,
-                            30,
-                        )
-                        if close_button_rect.collidepoint(event.pos):
-                            self.crafting_visible = False
-                else:
-                    for button in self.buttons:
-                        if (
-                            event.type == pygame.MOUSEBUTTONDOWN
-                            and button.rect.collidepoint(mouse_pos)
-                        ):
-                            button.action()
-
-            # Mise à jour des boutons
-            for button in self.buttons:
-                button.update(mouse_pos)
-
-            # Mise à jour de l'état du jeu
-            self.update_game_state()
-
-            # Dessin
-            self.draw()
-
-            # Contrôle de la fréquence d'images
-            self.clock.tick(FPS)
-
-        pygame.quit()
-
-
-# Point d'entrée du programme
-if __name__ == "__main__":
-    game = SurvivalGame()
-    game.run()
+import pygame
+import math
+import os
+import sys
+import hashlib
+import csv
+import mmap
+import struct
+from collections import OrderedDict, deque
+import time
+
+import savegame
+import survival_core
+from survival_core import (
+    MAX_HEALTH,
+    MAX_HUNGER,
+    MAX_THIRST,
+    MAX_ENERGY,
+    Weather,
+    TimeOfDay,
+    NEXT_TIME_OF_DAY,
+    Item,
+    Recipe,
+    CraftabilityCache,
+    SurvivalSimulation,
+    SimulationClock,
+)
+
+# Définition des constantes
+SCREEN_WIDTH = 1024
+SCREEN_HEIGHT = 768
+FPS = 60
+MAX_FRAME_SKIP = 4  # images sautées au plus d'affilée quand l'affichage est en retard
+SPEED_KEYS = {pygame.K_1: "x1", pygame.K_2: "x4", pygame.K_3: "x16", pygame.K_4: "max"}
+LOG_SCROLL_KEYS = {pygame.K_PAGEUP: 5, pygame.K_PAGEDOWN: -5}
+
+# Couleurs
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+BLUE = (0, 0, 255)
+GRAY = (150, 150, 150)
+DARK_GREEN = (0, 100, 0)
+BROWN = (139, 69, 19)
+LIGHT_BLUE = (173, 216, 230)
+YELLOW = (255, 255, 0)
+DARK_BLUE = (0, 0, 139)
+
+# Ressources graphiques référencées par le jeu
+SCENE_IMAGES = {"player": "player.png", "fire": "fire.png", "shelter": "shelter.png"}
+IMAGE_ASSETS = list(SCENE_IMAGES.values())
+ASSET_STREAM_BUDGET = 0.002  # secondes par image consacrées au chargement différé
+ASSET_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), ".asset_cache"
+)
+
+# Images de fond selon le temps/jour
+BACKGROUND_IMAGES = {
+    # Format: (TimeOfDay, Weather): image_path
+    (TimeOfDay.MORNING, Weather.SUNNY): "bg_morning_sunny.png",
+    (TimeOfDay.AFTERNOON, Weather.SUNNY): "bg_afternoon_sunny.png",
+    (TimeOfDay.EVENING, Weather.SUNNY): "bg_evening_sunny.png",
+    (TimeOfDay.NIGHT, Weather.SUNNY): "bg_night_sunny.png",
+    # Etc. pour d'autres combinaisons
+}
+
+
+# Initialisation des seuls modules de Pygame utilisés (affichage et polices),
+# faite à la création du jeu plutôt qu'à l'import: ni audio ni manettes
+def init_pygame():
+    # Après un pygame.quit() (partie précédente dans le même processus), les
+    # polices et les surfaces converties pour l'ancien écran sont invalides
+    if not pygame.display.get_init():
+        pygame.display.init()
+        ModalPanel.overlay = None
+        icon_atlas.clear()
+    if not pygame.font.get_init():
+        pygame.font.init()
+        text_renderer.clear()
+
+
+# Service de rendu de texte: une police par taille et cache LRU des surfaces rendues
+class TextRenderer:
+    def __init__(self, max_surfaces=512):
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.max_surfaces = max_surfaces
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        self.fonts.clear()
+        self.surfaces.clear()
+
+    def get_font(self, size):
+        font = self.fonts.get(size)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+                self.clear()
+            font = pygame.font.SysFont(None, size)
+            self.fonts[size] = font
+        return font
+
+    def render(self, text, size, color, antialias=True):
+        key = (text, size, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = self.get_font(size).render(text, antialias, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def wrap(self, text, size, width):
+        # Découpage mot à mot selon la largeur réelle du texte rendu
+        font = self.get_font(size)
+        lines = []
+        line = ""
+        for word in text.split():
+            candidate = f"{line} {word}" if line else word
+            if line and font.size(candidate)[0] > width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+        return lines
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cached": len(self.surfaces),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+text_renderer = TextRenderer()
+
+
+# Fonction pour charger les images
+def load_image(name, scale=1.0):
+    try:
+        image = pygame.image.load(name)
+        if scale != 1.0:
+            original_size = image.get_size()
+            new_size = (int(original_size[0] * scale), int(original_size[1] * scale))
+            image = pygame.transform.scale(image, new_size)
+        return image
+    except pygame.error:
+        # Si l'image n'est pas trouvée, créer une surface avec un motif de placeholder
+        size = (64, 64)
+        image = pygame.Surface(size)
+        for x in range(0, size[0], 8):
+            for y in range(0, size[1], 8):
+                color = (
+                    (100, 100, 100) if (x // 8 + y // 8) % 2 == 0 else (150, 150, 150)
+                )
+                pygame.draw.rect(image, color, (x, y, 8, 8))
+
+        # Ajouter le nom de l'image manquante
+        text = text_renderer.render(os.path.basename(name), 15, (255, 50, 50))
+        text_rect = text.get_rect(center=(size[0] // 2, size[1] // 2))
+        image.blit(text, text_rect)
+
+        if scale != 1.0:
+            original_size = image.get_size()
+            new_size = (int(original_size[0] * scale), int(original_size[1] * scale))
+            image = pygame.transform.scale(image, new_size)
+        return image
+
+
+# Icône générée pour un objet sans image
+def make_placeholder_icon(name):
+    icon = pygame.Surface((64, 64))
+    icon.fill(GRAY)
+    text = text_renderer.render(name[:10], 20, BLACK)
+    text_rect = text.get_rect(center=(32, 32))
+    icon.blit(text, text_rect)
+    return icon
+
+
+# Cache de pixels pré-décodés, projeté en mémoire (mmap) au lancement
+class BakedAssetCache:
+    MAGIC = b"SGAC"
+    VERSION = 2
+    # magic, version, opaque, largeur, hauteur
+    HEADER = struct.Struct("<4sHHII")
+
+    def __init__(self, directory=ASSET_CACHE_DIR, enabled=True):
+        self.directory = directory
+        self.enabled = enabled
+        self.mapped = {}  # clé -> (fichier, mmap) maintenus ouverts
+        self.hits = 0
+        self.misses = 0
+
+    def source_key(self, path, scale=1.0):
+        with open(path, "rb") as source:
+            digest = hashlib.sha1(source.read()).hexdigest()
+        return f"{digest}-{scale:g}"
+
+    def generated_key(self, recipe, scale=1.0):
+        digest = hashlib.sha1(f"v{self.VERSION}:{recipe}".encode("utf-8")).hexdigest()
+        return f"gen-{digest}-{scale:g}"
+
+    def entry_path(self, key):
+        return os.path.join(self.directory, key + ".raw")
+
+    def read(self, key):
+        path = self.entry_path(key)
+        if not os.path.exists(path):
+            return None
+
+        source = open(path, "rb")
+        try:
+            # ACCESS_COPY: pages privées, la surface reste modifiable sans toucher au fichier
+            data = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_COPY)
+        except ValueError:
+            source.close()
+            return None
+        magic, version, opaque, width, height = self.HEADER.unpack_from(data)
+        if (
+            magic != self.MAGIC
+            or version != self.VERSION
+            or len(data) != self.HEADER.size + width * height * 4
+        ):
+            data.close()
+            source.close()
+            return None
+
+        self.mapped[key] = (source, data)
+        pixels = memoryview(data)[self.HEADER.size :]
+        image = pygame.image.frombuffer(pixels, (width, height), "BGRA")
+        if opaque:
+            # Alpha ignoré au blit, sans copie: la surface reste sur le mmap,
+            # déjà au format de l'écran (to_display_format la renvoie telle quelle)
+            image.set_alpha(None)
+        return image
+
+    def write(self, key, image):
+        os.makedirs(self.directory, exist_ok=True)
+        opaque = (
+            not (image.get_flags() & pygame.SRCALPHA)
+            and image.get_alpha() is None
+            and image.get_colorkey() is None
+        )
+        if image.get_colorkey() is not None:
+            # Couleur transparente (PNG à palette): cuite en alpha par pixel,
+            # le blit sur une surface vide ne copie que les pixels visibles
+            keyed = image
+            image = pygame.Surface(keyed.get_size(), pygame.SRCALPHA, 32)
+            image.fill((0, 0, 0, 0))
+            image.blit(keyed, (0, 0))
+        width, height = image.get_size()
+        header = self.HEADER.pack(self.MAGIC, self.VERSION, int(opaque), width, height)
+        path = self.entry_path(key)
+        temp_path = path + ".tmp"
+        with open(temp_path, "wb") as target:
+            target.write(header)
+            target.write(pygame.image.tobytes(image, "BGRA"))
+        os.replace(temp_path, path)
+
+    def fetch(self, key, build):
+        image = self.read(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        # Absent ou source modifiée: (re)cuisson automatique
+        self.misses += 1
+        image = build()
+        try:
+            self.write(key, image)
+        except OSError:
+            pass
+        return image
+
+    def load(self, path, scale=1.0):
+        if not self.enabled:
+            return load_image(path, scale)
+        if os.path.exists(path):
+            key = self.source_key(path, scale)
+        else:
+            key = self.generated_key(f"missing:{path}", scale)
+        return self.fetch(key, lambda: load_image(path, scale))
+
+    def load_generated(self, recipe, build):
+        if not self.enabled:
+            return build()
+        return self.fetch(self.generated_key(recipe), build)
+
+    def prune(self, keep_keys):
+        # Supprimer les entrées qui ne correspondent plus à aucune source
+        if not os.path.isdir(self.directory):
+            return 0
+        removed = 0
+        for filename in os.listdir(self.directory):
+            key, extension = os.path.splitext(filename)
+            if extension == ".raw" and key not in keep_keys and key not in self.mapped:
+                os.remove(os.path.join(self.directory, filename))
+                removed += 1
+        return removed
+
+
+baked_assets = BakedAssetCache()
+
+
+def load_item_icon(item):
+    if os.path.exists(item.icon_name):
+        return baked_assets.load(item.icon_name)
+    # Créer une icône par défaut
+    return baked_assets.load_generated(
+        f"icon:{item.name}", lambda: make_placeholder_icon(item.name)
+    )
+
+
+# Atlas des icônes d'objets: une seule surface découpée en cases de 64x64 et une
+# table nom -> case. Chaque icône y est copiée à son premier affichage.
+class IconAtlas:
+    SIZE = 64
+    COLUMNS = 16
+
+    def __init__(self):
+        self.surface = None
+        self.rects = {}  # nom de l'objet -> case dans l'atlas
+
+    def clear(self):
+        self.surface = None
+        self.rects.clear()
+
+    def allocate(self, rows):
+        surface = pygame.Surface(
+            (self.COLUMNS * self.SIZE, rows * self.SIZE), pygame.SRCALPHA
+        )
+        surface = to_display_format(surface)
+        surface.fill((0, 0, 0, 0))
+        if self.surface is not None:
+            surface.blit(self.surface, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        self.surface = surface
+
+    def add(self, name, icon):
+        index = len(self.rects)
+        if self.surface is None:
+            # Dimensionné d'emblée pour tout le catalogue connu
+            count = max(index + 1, len(Item.all_items))
+            self.allocate(-(-count // self.COLUMNS))
+        elif index >= self.COLUMNS * (self.surface.get_height() // self.SIZE):
+            # Catalogue agrandi: doubler le nombre de lignes
+            self.allocate(2 * self.surface.get_height() // self.SIZE)
+
+        if icon.get_size() != (self.SIZE, self.SIZE):
+            icon = pygame.transform.scale(icon, (self.SIZE, self.SIZE))
+        rect = pygame.Rect(
+            index % self.COLUMNS * self.SIZE,
+            index // self.COLUMNS * self.SIZE,
+            self.SIZE,
+            self.SIZE,
+        )
+        # Copie exacte des pixels (alpha compris) dans la case encore vide
+        self.surface.blit(icon, rect, special_flags=pygame.BLEND_RGBA_ADD)
+        self.rects[name] = rect
+        return rect
+
+    def get(self, item):
+        rect = self.rects.get(item.name)
+        if rect is None:
+            rect = self.add(item.name, load_item_icon(item))
+        return rect
+
+
+icon_atlas = IconAtlas()
+
+
+# Convertir une surface au format de pixels de l'écran (blits sans conversion)
+def to_display_format(image):
+    display = pygame.display.get_surface()
+    if display is None:
+        return image
+    # Déjà au format de l'écran (ex: surfaces du cache pré-décodé): aucune copie
+    same_format = (
+        image.get_bytesize() == display.get_bytesize()
+        and image.get_masks()[:3] == display.get_masks()[:3]
+    )
+    if image.get_flags() & pygame.SRCALPHA:
+        return image if same_format else image.convert_alpha()
+    if image.get_alpha() is not None:
+        return image.convert_alpha()
+    return image if same_format else image.convert()
+
+
+# Images de la scène, chargées à leur premier usage
+class SceneImages(dict):
+    def __init__(self, assets, paths=SCENE_IMAGES):
+        super().__init__()
+        self.assets = assets
+        self.paths = paths
+
+    def __missing__(self, name):
+        image = self.assets.get(self.paths[name])
+        self[name] = image
+        return image
+
+
+# Gestionnaire central des ressources graphiques
+class AssetManager:
+    def __init__(self, scaled_budget=32 * 1024 * 1024):
+        self.surfaces = {}  # chemin -> surface convertie (None si absente)
+        self.scaled = OrderedDict()  # (chemin, taille) -> surface redimensionnée
+        self.scaled_budget = scaled_budget  # budget mémoire en octets
+        self.scaled_bytes = 0
+
+    def load(self, path):
+        if path not in self.surfaces:
+            self.surfaces[path] = to_display_format(baked_assets.load(path))
+        return self.surfaces[path]
+
+    def load_optional(self, path):
+        # Ressource facultative (ex: fonds d'écran): None si le fichier manque
+        if path not in self.surfaces:
+            if os.path.exists(path):
+                self.surfaces[path] = to_display_format(baked_assets.load(path))
+            else:
+                self.surfaces[path] = None
+        return self.surfaces[path]
+
+    def preload(self, paths, optional=False):
+        for path in paths:
+            if optional:
+                self.load_optional(path)
+            else:
+                self.load(path)
+
+    def get(self, path, scale=1.0, optional=False):
+        base = self.load_optional(path) if optional else self.load(path)
+        if base is None or scale == 1.0:
+            return base
+
+        width, height = base.get_size()
+        size = (int(width * scale), int(height * scale))
+        key = (path, size)
+        image = self.scaled.get(key)
+        if image is not None:
+            self.scaled.move_to_end(key)
+            return image
+
+        image = pygame.transform.scale(base, size)
+        self.scaled[key] = image
+        self.scaled_bytes += self.surface_bytes(image)
+        # Éviction LRU des variantes redimensionnées au-delà du budget
+        while self.scaled_bytes > self.scaled_budget and len(self.scaled) > 1:
+            _, evicted = self.scaled.popitem(last=False)
+            self.scaled_bytes -= self.surface_bytes(evicted)
+        return image
+
+    @staticmethod
+    def surface_bytes(surface):
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+
+
+# Joueur avec sa représentation à l'écran
+class Player(survival_core.Player):
+    def __init__(self, name, balance=survival_core.BALANCE):
+        super().__init__(name, balance)
+
+        # Position visuelle pour le joueur
+        self.x = SCREEN_WIDTH // 2
+        self.y = SCREEN_HEIGHT // 2
+
+        # Animation
+        self.animation_frame = 0
+        self.animation_time = 0
+
+
+# Interface utilisateur
+class Button:
+    def __init__(
+        self,
+        x,
+        y,
+        width,
+        height,
+        text,
+        color=GRAY,
+        hover_color=LIGHT_BLUE,
+        text_color=BLACK,
+        action=None,
+    ):
+        self.rect = pygame.Rect(x, y, width, height)
+        self.text = text
+        self.color = color
+        self.hover_color = hover_color
+        self.text_color = text_color
+        self.action = action
+        self.hovered = False
+
+    def draw(self, screen):
+        color = self.hover_color if self.hovered else self.color
+        pygame.draw.rect(screen, color, self.rect, 0, 5)
+        pygame.draw.rect(screen, BLACK, self.rect, 2, 5)
+
+        text_surface = text_renderer.render(self.text, 24, self.text_color)
+        text_rect = text_surface.get_rect(center=self.rect.center)
+        screen.blit(text_surface, text_rect)
+
+
+# Panneau modal avec surfaces persistantes: voile, cadre et texte statique
+# sont composés une seule fois, les lignes dynamiques seulement si l'état change
+class ModalPanel:
+    overlay = None
+
+    def __init__(self, rect, texts=(), radius=0):
+        self.rect = pygame.Rect(rect)
+        self.texts = list(texts)  # (texte, taille, position relative)
+        self.radius = radius
+        self.chrome = None
+        self.rows = None
+        self.state = None
+        self.row_renders = 0
+
+    @classmethod
+    def get_overlay(cls):
+        if cls.overlay is None:
+            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 128))
+            cls.overlay = to_display_format(overlay)
+        return cls.overlay
+
+    def build_chrome(self):
+        chrome = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        local_rect = chrome.get_rect()
+        pygame.draw.rect(chrome, WHITE, local_rect, 0, self.radius)
+        pygame.draw.rect(chrome, BLACK, local_rect, 2, self.radius)
+        for text, size, position in self.texts:
+            chrome.blit(text_renderer.render(text, size, BLACK), position)
+        return to_display_format(chrome)
+
+    def draw(self, screen, state=None, render_rows=None):
+        screen.blit(self.get_overlay(), (0, 0))
+
+        if self.chrome is None:
+            self.chrome = self.build_chrome()
+        screen.blit(self.chrome, self.rect)
+
+        if render_rows is None:
+            return
+        if self.rows is None or state != self.state:
+            self.state = state
+            self.rows = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+            render_rows(self.rows)
+            self.row_renders += 1
+        screen.blit(self.rows, self.rect)
+
+
+# Classe pour la gestion des popups
+class Popup:
+    def __init__(self, title, content, buttons=None):
+        self.title = title
+        self.content = content
+        self.buttons = buttons if buttons else []
+        self.active = True
+
+        # Dimensionnement du popup
+        self.width = 400
+        self.height = 300
+        self.x = (SCREEN_WIDTH - self.width) // 2
+        self.y = (SCREEN_HEIGHT - self.height) // 2
+        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+
+        texts = [(self.title, 32, (20, 20))]
+        for i, line in enumerate(self.content.split("\n")):
+            texts.append((line, 24, (20, 60 + i * 30)))
+        self.panel = ModalPanel(self.rect, texts, radius=10)
+
+    def draw(self, screen):
+        if not self.active:
+            return
+
+        # Fond, cadre, titre et contenu pré-composés
+        self.panel.draw(screen)
+
+        # Boutons
+        for button in self.buttons:
+            button.draw(screen)
+
+
+# Routage des entrées: les rectangles des widgets de chaque couche sont indexés
+# dans une grille uniforme, et chaque événement souris est testé avec sa propre
+# position. Une couche modale active capture la souris pour les couches dessous.
+class InputLayer:
+    def __init__(self, name, is_active, widgets, modal=False, cell_size=64):
+        self.name = name
+        self.is_active = is_active
+        self.widgets = widgets  # fonction renvoyant la liste des widgets
+        self.modal = modal
+        self.cell_size = cell_size
+        self.indexed = None
+        self.cells = {}
+
+    def index(self):
+        # Reconstruction seulement si la liste de widgets a changé
+        widgets = self.widgets()
+        if widgets is self.indexed:
+            return
+        self.indexed = widgets
+        self.cells = {}
+        size = self.cell_size
+        for order, widget in enumerate(widgets):
+            rect = widget.rect
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                    self.cells.setdefault((cx, cy), []).append((order, widget))
+
+    def hit(self, pos):
+        self.index()
+        cell = (pos[0] // self.cell_size, pos[1] // self.cell_size)
+        # Le dernier widget ajouté est au-dessus
+        for _, widget in reversed(self.cells.get(cell, ())):
+            if widget.rect.collidepoint(pos):
+                return widget
+        return None
+
+
+class InputRouter:
+    def __init__(self):
+        self.layers = []  # du fond vers le dessus
+        self.key_bindings = {}
+        self.hovered = None
+        self.events = 0
+        self.dispatch_time = 0.0
+        self.click_time = None
+        self.latencies = deque(maxlen=120)
+
+    def add_layer(self, layer):
+        self.layers.append(layer)
+        return layer
+
+    def bind_key(self, key, callback):
+        self.key_bindings[key] = callback
+
+    def widget_at(self, pos):
+        for layer in reversed(self.layers):
+            if not layer.is_active():
+                continue
+            widget = layer.hit(pos)
+            if widget is not None or layer.modal:
+                return widget
+        return None
+
+    def dispatch(self, event):
+        start = time.perf_counter()
+        self.events += 1
+        handled = False
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            widget = self.widget_at(event.pos)
+            action = getattr(widget, "action", None)
+            if action:
+                self.click_time = start
+                action()
+                handled = True
+        elif event.type == pygame.MOUSEWHEEL:
+            # La molette ne porte pas de position: celle du pointeur
+            widget = self.widget_at(pygame.mouse.get_pos())
+            on_wheel = getattr(widget, "on_wheel", None)
+            if on_wheel:
+                on_wheel(event.y)
+                handled = True
+        elif event.type == pygame.KEYDOWN and event.key in self.key_bindings:
+            self.key_bindings[event.key]()
+            handled = True
+        self.dispatch_time += time.perf_counter() - start
+        return handled
+
+    def update_hover(self, pos):
+        widget = self.widget_at(pos)
+        if widget is self.hovered:
+            return
+        if self.hovered is not None:
+            self.hovered.hovered = False
+        if widget is not None and hasattr(widget, "hovered"):
+            widget.hovered = True
+            self.hovered = widget
+        else:
+            self.hovered = None
+
+    def frame_presented(self):
+        # Latence clic -> action -> image affichée
+        if self.click_time is not None:
+            self.latencies.append(time.perf_counter() - self.click_time)
+            self.click_time = None
+
+    def stats(self):
+        latencies = self.latencies
+        return {
+            "events": self.events,
+            "dispatch_us": (
+                self.dispatch_time / self.events * 1e6 if self.events else 0.0
+            ),
+            "click_latency_ms": (
+                sum(latencies) / len(latencies) * 1000 if latencies else 0.0
+            ),
+            "click_latency_max_ms": max(latencies, default=0.0) * 1000,
+        }
+
+
+# Rendu par rectangles modifiés: seules les régions invalidées sont redessinées
+class DirtyRectRenderer:
+    def __init__(self, game):
+        self.game = game
+        self.signatures = {}
+        self.rects = {}
+        self.full_redraw = True
+        self.frames = 0
+        self.pixels_updated = 0
+
+    def invalidate(self):
+        self.full_redraw = True
+
+    def render(self):
+        screen = self.game.screen
+        dirty = []
+        full = self.full_redraw
+        for name, rect, signature in self.game.dirty_regions():
+            previous_rect = self.rects.get(name)
+            if self.signatures.get(name) == signature and previous_rect == rect:
+                continue
+            self.signatures[name] = signature
+            self.rects[name] = rect
+            if name == "background":
+                full = True
+            dirty.append(rect)
+            if previous_rect is not None and previous_rect != rect:
+                dirty.append(previous_rect)
+
+        self.frames += 1
+        if full:
+            self.full_redraw = False
+            self.game.draw_scene()
+            pygame.display.flip()
+            self.pixels_updated += screen.get_width() * screen.get_height()
+            return
+
+        if not dirty:
+            return
+
+        # Redessiner la scène uniquement dans chaque rectangle invalidé
+        for rect in dirty:
+            screen.set_clip(rect)
+            self.game.draw_scene()
+        screen.set_clip(None)
+        pygame.display.update(dirty)
+        self.pixels_updated += sum(rect.width * rect.height for rect in dirty)
+
+
+# Barres de statut: chaque ligne est redessinée dans la surface composée
+# uniquement quand sa valeur affichée (entier, 0,1 °C, jour...) change
+class StatusHUD:
+    BAR_WIDTH = 150
+    BAR_HEIGHT = 20
+    ROW_HEIGHT = 30
+    WIDTH = 400
+    BARS = [
+        ("Santé", "health", MAX_HEALTH, RED),
+        ("Faim", "hunger", MAX_HUNGER, GREEN),
+        ("Soif", "thirst", MAX_THIRST, BLUE),
+        ("Énergie", "energy", MAX_ENERGY, YELLOW),
+    ]
+
+    def __init__(self, position):
+        rows = len(self.BARS) + 3  # température, jour, météo
+        self.rect = pygame.Rect(position, (self.WIDTH, rows * self.ROW_HEIGHT))
+        self.panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.values = [None] * rows
+        self.version = 0
+        self.redraws = 0  # mises à jour de la surface
+        self.rows_redrawn = 0
+        self.window_start = time.perf_counter()
+        self.window_redraws = 0
+        self.redraws_per_second = 0.0
+
+    def displayed_values(self, game):
+        player = game.player
+        values = []
+        for _, attribute, maximum, _ in self.BARS:
+            value = getattr(player, attribute)
+            values.append((int(value), int((value / maximum) * (self.BAR_WIDTH - 4))))
+        values.append(f"{player.body_temperature:.1f}")
+        values.append((game.days_survived, game.time_of_day.name))
+        values.append(game.current_weather.name)
+        return values
+
+    def update(self, game):
+        changed = False
+        for row, value in enumerate(self.displayed_values(game)):
+            if value != self.values[row]:
+                self.values[row] = value
+                self.draw_row(row, value)
+                changed = True
+        if changed:
+            self.version += 1
+            self.redraws += 1
+            self.window_redraws += 1
+
+        # Fréquence des mises à jour, sur une fenêtre d'une seconde
+        now = time.perf_counter()
+        if now - self.window_start >= 1.0:
+            self.redraws_per_second = self.window_redraws / (now - self.window_start)
+            self.window_start = now
+            self.window_redraws = 0
+
+    def draw_row(self, row, value):
+        y = row * self.ROW_HEIGHT
+        self.panel.fill((0, 0, 0, 0), (0, y, self.WIDTH, self.ROW_HEIGHT))
+        self.rows_redrawn += 1
+
+        if row < len(self.BARS):
+            name, _, maximum, color = self.BARS[row]
+            shown, fill_width = value
+            bar_rect = pygame.Rect(0, y, self.BAR_WIDTH, self.BAR_HEIGHT)
+            pygame.draw.rect(self.panel, BLACK, bar_rect, 2)
+            fill_rect = pygame.Rect(2, y + 2, fill_width, self.BAR_HEIGHT - 4)
+            pygame.draw.rect(self.panel, color, fill_rect)
+            text = f"{name}: {shown}/{maximum}"
+            self.panel.blit(
+                text_renderer.render(text, 24, BLACK), (self.BAR_WIDTH + 10, y)
+            )
+            return
+
+        if row == len(self.BARS):
+            text = f"Température: {value}°C"
+        elif row == len(self.BARS) + 1:
+            text = f"Jour: {value[0]} - {value[1]}"
+        else:
+            text = f"Météo: {value}"
+        self.panel.blit(text_renderer.render(text, 24, BLACK), (0, y))
+
+    def draw(self, screen, game):
+        self.update(game)
+        screen.blit(self.panel, self.rect)
+
+    def stats(self):
+        return {
+            "redraws": self.redraws,
+            "rows_redrawn": self.rows_redrawn,
+            "redraws_per_second": self.redraws_per_second,
+        }
+
+
+# Journal affiché: les lignes de chaque message sont rendues une seule fois, à
+# son arrivée, et le panneau n'est recomposé que sur nouveau message ou défilement
+class MessageLogView:
+    def __init__(self, rect, font_size=20, line_height=20, padding=10):
+        self.rect = pygame.Rect(rect)
+        self.font_size = font_size
+        self.line_height = line_height
+        self.padding = padding
+        self.visible_lines = (self.rect.height - padding) // line_height
+        self.log = None
+        self.seen = 0
+        self.entries = deque()  # surfaces des lignes de chaque message
+        self.line_count = 0
+        self.scroll = 0  # lignes remontées depuis le bas
+        self.panel = None
+        self.compositions = 0
+
+    def sync(self, log):
+        if log is not self.log:
+            self.log = log
+            self.seen = 0
+            self.entries.clear()
+            self.line_count = 0
+            self.scroll = 0
+            self.panel = None
+
+        new = log.total - self.seen
+        if new <= 0:
+            return
+        self.seen = log.total
+        font = text_renderer.get_font(self.font_size)
+        width = self.rect.width - 2 * self.padding
+        added = 0
+        for message in log.recent(new):
+            lines = [
+                font.render(line, True, WHITE)
+                for line in text_renderer.wrap(message, self.font_size, width)
+            ]
+            self.entries.append(lines)
+            added += len(lines)
+        while len(self.entries) > len(log):
+            self.line_count -= len(self.entries.popleft())
+        self.line_count += added
+
+        # En défilement, garder les mêmes lignes à l'écran
+        if self.scroll:
+            self.scroll_by(added)
+        self.panel = None
+
+    def on_wheel(self, lines):
+        self.scroll_by(lines)
+
+    def scroll_by(self, lines):
+        limit = max(0, self.line_count - self.visible_lines)
+        scroll = min(max(self.scroll + lines, 0), limit)
+        if scroll != self.scroll:
+            self.scroll = scroll
+            self.panel = None
+
+    def state(self):
+        return (self.seen, self.scroll)
+
+    def compose(self):
+        panel = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 128))
+        pygame.draw.rect(panel, WHITE, panel.get_rect(), 2)
+
+        # Lignes visibles, en partant du bas du journal
+        end = self.line_count - self.scroll
+        start = max(0, end - self.visible_lines)
+        index = 0
+        y = self.padding
+        for lines in self.entries:
+            for line in lines:
+                if start <= index < end:
+                    panel.blit(line, (self.padding, y))
+                    y += self.line_height
+                index += 1
+            if index >= end:
+                break
+        self.compositions += 1
+        return to_display_format(panel)
+
+    def draw(self, screen, log):
+        self.sync(log)
+        if self.panel is None:
+            self.panel = self.compose()
+        screen.blit(self.panel, self.rect)
+
+
+# Profilage par image: chaque phase de la boucle est chronométrée par des
+# marques successives. Désactivé, il ne coûte qu'un test d'attribut par phase.
+class FrameProfiler:
+    PHASES = [
+        "events",
+        "simulation",
+        "draw_scene",
+        "draw_hud",
+        "draw_log",
+        "draw_buttons",
+        "draw_inventory",
+        "draw_crafting",
+        "draw_popup",
+        "flip",
+        "assets",
+        "wait",
+    ]
+    COLORS = [
+        (230, 25, 75),
+        (60, 180, 75),
+        (255, 225, 25),
+        (0, 130, 200),
+        (245, 130, 48),
+        (145, 30, 180),
+        (70, 240, 240),
+        (240, 50, 230),
+        (210, 245, 60),
+        (250, 190, 212),
+        (170, 110, 40),
+        (128, 128, 128),
+    ]
+    GRAPH_FRAMES = 120
+    GRAPH_SCALE = 4  # pixels par milliseconde
+    REFRESH_FRAMES = 30  # fréquence de recomposition de l'affichage
+
+    def __init__(self, history=3600, window=240, counters=None):
+        self.enabled = False
+        self.counters = counters  # fonction -> {libellé: valeur}, sous les phases
+        self.requested = False  # état demandé, appliqué au début de l'image
+        self.phase_index = {phase: i for i, phase in enumerate(self.PHASES)}
+        self.current = [0.0] * len(self.PHASES)
+        self.last = 0.0
+        self.frame = 0
+        self.frame_start = 0.0
+        self.records = deque(maxlen=history)  # (image, début, durées en s...)
+        self.windows = [deque(maxlen=window) for _ in self.PHASES]
+        self.overlay = None
+        self.overlay_rect = pygame.Rect(
+            SCREEN_WIDTH - 270, SCREEN_HEIGHT - 260, 260, 250
+        )
+
+    def toggle(self):
+        # Basculé en cours d'image (touche F3), le profileur ne change d'état
+        # qu'à l'image suivante: aucune image n'est chronométrée à moitié
+        self.requested = not self.requested
+        return True
+
+    def begin_frame(self):
+        # Renvoie True si l'état vient de changer (graphe apparu ou disparu)
+        changed = self.requested != self.enabled
+        if changed:
+            self.enabled = self.requested
+            self.overlay = None
+        if self.enabled:
+            self.current = [0.0] * len(self.PHASES)
+            self.frame_start = self.last = time.perf_counter()
+        return changed
+
+    def mark(self, phase):
+        # Temps écoulé depuis la marque précédente, attribué à la phase
+        now = time.perf_counter()
+        self.current[self.phase_index[phase]] += now - self.last
+        self.last = now
+
+    def end_frame(self):
+        self.frame += 1
+        self.records.append((self.frame, self.frame_start, *self.current))
+        for window, duration in zip(self.windows, self.current):
+            window.append(duration)
+        if self.frame % self.REFRESH_FRAMES == 0:
+            self.overlay = None
+
+    def summary(self):
+        # Moyenne et p95 par phase sur la fenêtre glissante, en ms
+        summary = {}
+        for phase, window in zip(self.PHASES, self.windows):
+            if not window:
+                continue
+            ordered = sorted(window)
+            summary[phase] = (
+                sum(ordered) / len(ordered) * 1000,
+                ordered[int(0.95 * (len(ordered) - 1))] * 1000,
+            )
+        return summary
+
+    def compose(self):
+        panel = pygame.Surface(self.overlay_rect.size, pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+        width, height = self.overlay_rect.size
+
+        # Lignes: phase, moyenne et p95
+        y = 4
+        for phase, (mean, p95) in self.summary().items():
+            color = self.COLORS[self.phase_index[phase]]
+            panel.blit(text_renderer.render(phase, 16, color), (6, y))
+            for value, right in ((mean, 180), (p95, 230)):
+                text = text_renderer.render(f"{value:.2f}", 16, color)
+                panel.blit(text, text.get_rect(topright=(right, y)))
+            y += 12
+        panel.blit(text_renderer.render("moy. / p95 (ms)", 16, WHITE), (130, y))
+        y += 14
+        if self.counters is not None:
+            for label, value in self.counters().items():
+                panel.blit(text_renderer.render(f"{label}: {value}", 16, WHITE), (6, y))
+                y += 12
+
+        # Graphe empilé des dernières images, sans l'attente (travail seul),
+        # avec une ligne de repère au budget d'une image
+        base = height - 4
+        budget = base - int(1000 / FPS * self.GRAPH_SCALE)
+        pygame.draw.line(panel, WHITE, (4, budget), (width - 4, budget))
+        records = list(self.records)[-self.GRAPH_FRAMES :]
+        bar = max(1, (width - 8) // self.GRAPH_FRAMES)
+        for i, record in enumerate(records):
+            x = 4 + i * bar
+            top = base
+            for phase_index, duration in enumerate(record[2:-1]):
+                size = int(duration * 1000 * self.GRAPH_SCALE)
+                if size <= 0:
+                    continue
+                top -= size
+                pygame.draw.rect(
+                    panel,
+                    self.COLORS[phase_index],
+                    (x, max(top, y), bar, size),
+                )
+                if top <= y:
+                    break
+        return to_display_format(panel)
+
+    def draw(self, screen):
+        if self.overlay is None:
+            self.overlay = self.compose()
+        screen.blit(self.overlay, self.overlay_rect)
+
+    def export_csv(self, path):
+        with open(path, "w", encoding="utf-8", newline="") as target:
+            writer = csv.writer(target)
+            writer.writerow(["frame", "start_s"] + [f"{p}_ms" for p in self.PHASES])
+            for frame, start, *durations in self.records:
+                writer.writerow(
+                    [frame, f"{start:.6f}"] + [f"{d * 1000:.4f}" for d in durations]
+                )
+        return len(self.records)
+
+
+# Classe principale du jeu
+class SurvivalGame(SurvivalSimulation):
+    player_class = Player
+
+    def __init__(
+        self,
+        dirty_rects=False,
+        seed=None,
+        record_path=None,
+        save_path=None,
+        profile=False,
+    ):
+        super().__init__(seed=seed, record=record_path is not None)
+        self.record_path = record_path
+        self.save_path = save_path
+        self.autosaver = savegame.AutoSaver(save_path) if save_path else None
+        init_pygame()
+        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pygame.display.set_caption("Survie Réaliste - Jeu de Simulation")
+        self.clock = pygame.time.Clock()
+        self.simulation_clock = SimulationClock()
+        self.skipped_frames = 0
+        self.running = True
+
+        # Interface
+        self.buttons = []
+        self.active_popup = None
+        self.inventory_visible = False
+        self.crafting_visible = False
+
+        # Images de fond selon le temps/jour
+        self.background_images = dict(BACKGROUND_IMAGES)
+
+        # Image par défaut
+        self.default_bg = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.default_bg.fill((100, 150, 200))  # Bleu ciel par défaut
+
+        # Chargement des ressources
+        self.assets = AssetManager()
+        self.initialize_resources()
+
+        # Actions
+        self.initialize_actions()
+        self.initialize_panels()
+        self.initialize_input()
+
+        # Rendu par rectangles modifiés (optionnel)
+        self.dirty_renderer = DirtyRectRenderer(self) if dirty_rects else None
+        self.profiler = FrameProfiler(counters=self.profiler_counters)
+        if profile:
+            self.profiler.toggle()
+
+    def initialize_resources(self):
+        # Seul le joueur est chargé avant la première image (le fond l'est par
+        # draw_scene); le reste arrive par tranches une fois l'image affichée
+        self.images = SceneImages(self.assets)
+        self.images["player"]
+        self.asset_stream = self.secondary_assets()
+
+    def secondary_assets(self):
+        # Ressources absentes de la première image, dans l'ordre où elles servent
+        for name in SCENE_IMAGES:
+            yield self.images[name]
+        yield self.warm_backgrounds()
+        for item in Item.all_items:
+            yield icon_atlas.get(item)
+
+    def stream_assets(self, budget=ASSET_STREAM_BUDGET):
+        deadline = time.perf_counter() + budget
+        while self.asset_stream is not None and time.perf_counter() < deadline:
+            if next(self.asset_stream, self) is self:
+                self.asset_stream = None
+
+    def warm_backgrounds(self):
+        # Précharger les fonds de la période actuelle et de la suivante
+        next_time = NEXT_TIME_OF_DAY[self.time_of_day]
+        keys = [
+            (self.time_of_day, self.current_weather),
+            (next_time, self.current_weather),
+        ]
+        self.assets.preload(
+            [
+                self.background_images[key]
+                for key in keys
+                if key in self.background_images
+            ],
+            optional=True,
+        )
+
+    def toggle_inventory(self):
+        self.inventory_visible = not self.inventory_visible
+        self.crafting_visible = False
+        return True
+
+    def toggle_crafting(self):
+        self.crafting_visible = not self.crafting_visible
+        self.inventory_visible = False
+        return True
+
+    def show_consume_popup(self):
+        content = "Que voulez-vous consommer?"
+        buttons = []
+
+        food_items = self.player.inventory.items_in("food")
+        drink_items = self.player.inventory.items_in("drinkable")
+
+        y_offset = 0
+        for i, item in enumerate(food_items):
+            y = self.screen.get_height() // 2 - 50 + y_offset
+            buttons.append(
+                Button(
+                    self.screen.get_width() // 2 - 180,
+                    y,
+                    150,
+                    30,
+                    f"Manger {item}",
+                    action=lambda i=item: self.consume_item("eat", i),
+                )
+            )
+            y_offset += 40
+
+        y_offset = 0
+        for i, item in enumerate(drink_items):
+            y = self.screen.get_height() // 2 - 50 + y_offset
+            buttons.append(
+                Button(
+                    self.screen.get_width() // 2 + 30,
+                    y,
+                    150,
+                    30,
+                    f"Boire {item}",
+                    action=lambda i=item: self.consume_item("drink", i),
+                )
+            )
+            y_offset += 40
+
+        # Bouton Annuler
+        buttons.append(
+            Button(
+                self.screen.get_width() // 2 - 40,
+                self.screen.get_height() // 2 + 100,
+                80,
+                30,
+                "Annuler",
+                action=self.close_popup,
+            )
+        )
+
+        self.active_popup = Popup("Consommer", content, buttons)
+        return True
+
+    def show_rest_popup(self):
+        content = "Combien d'heures voulez-vous vous reposer?"
+        buttons = []
+
+        for hours in [2, 4, 8]:
+            buttons.append(
+                Button(
+                    self.screen.get_width() // 2 - 40,
+                    self.screen.get_height() // 2 - 30 + hours * 10,
+                    80,
+                    30,
+                    f"{hours}h",
+                    action=lambda h=hours: self.rest(h),
+                )
+            )
+
+        # Bouton Annuler
+        buttons.append(
+            Button(
+                self.screen.get_width() // 2 - 40,
+                self.screen.get_height() // 2 + 70,
+                80,
+                30,
+                "Annuler",
+                action=self.close_popup,
+            )
+        )
+
+        self.active_popup = Popup("Repos", content, buttons)
+        return True
+
+    def initialize_actions(self):
+        button_width = 130
+        button_height = 40
+        button_margin = 10
+        start_x = 20
+        start_y = SCREEN_HEIGHT - 50
+
+        actions = [
+            {"text": "Inventaire", "action": self.toggle_inventory},
+            {"text": "Fabriquer", "action": self.toggle_crafting},
+            {"text": "Manger/Boire", "action": self.show_consume_popup},
+            {"text": "Chasser", "action": lambda: self.perform_action("hunt")},
+            {"text": "Cueillette", "action": lambda: self.perform_action("forage")},
+            {"text": "Feu", "action": lambda: self.perform_action("fire")},
+            {"text": "Abri", "action": lambda: self.perform_action("shelter")},
+            {"text": "Repos", "action": self.show_rest_popup},
+        ]
+
+        for i, action in enumerate(actions):
+            x = start_x + (button_width + button_margin) * (i % 4)
+            y = start_y - (button_height + button_margin) * (i // 4)
+            self.buttons.append(
+                Button(
+                    x,
+                    y,
+                    button_width,
+                    button_height,
+                    action["text"],
+                    action=action["action"],
+                )
+            )
+
+    def initialize_panels(self):
+        # Barres de statut, en haut à gauche
+        self.status_hud = StatusHUD((20, 20))
+
+        # Journal des messages, en haut à droite
+        log_width = 300
+        self.message_view = MessageLogView(
+            (SCREEN_WIDTH - log_width - 20, 20, log_width, 150)
+        )
+
+        # Inventaire: cadre persistant, lignes recomposées quand le contenu change
+        inventory_width = 400
+        inventory_height = 400
+        inventory_x = (SCREEN_WIDTH - inventory_width) // 2
+        inventory_y = (SCREEN_HEIGHT - inventory_height) // 2
+        self.inventory_panel = ModalPanel(
+            (inventory_x, inventory_y, inventory_width, inventory_height)
+        )
+        self.inventory_close_button = Button(
+            inventory_x + inventory_width - 90,
+            inventory_y + inventory_height - 40,
+            80,
+            30,
+            "Fermer",
+            action=self.toggle_inventory,
+        )
+
+        # Fabrication: titre et recettes sont statiques
+        crafting_width = 500
+        crafting_height = 400
+        crafting_x = (SCREEN_WIDTH - crafting_width) // 2
+        crafting_y = (SCREEN_HEIGHT - crafting_height) // 2
+        texts = [("Fabrication", 32, (10, 10))]
+        Recipe.initialize_recipes()
+        self.crafting_buttons = []
+        self.recipe_buttons = {}
+        for i, recipe in enumerate(Recipe.all_recipes):
+            if recipe.special:
+                craft_action = lambda r=recipe.special: self.special_craft(r)
+            else:
+                craft_action = lambda r=recipe.name: self.craft_item(r)
+            texts.append((recipe.describe(), 24, (10, 50 + i * 60)))
+            button = Button(
+                crafting_x + crafting_width - 110,
+                crafting_y + 50 + i * 60,
+                100,
+                30,
+                "Fabriquer",
+                action=craft_action,
+            )
+            self.recipe_buttons[recipe.name] = button
+            self.crafting_buttons.append(button)
+        self.crafting_buttons.append(
+            Button(
+                crafting_x + crafting_width - 90,
+                crafting_y + crafting_height - 40,
+                80,
+                30,
+                "Fermer",
+                action=self.toggle_crafting,
+            )
+        )
+        self.crafting_panel = ModalPanel(
+            (crafting_x, crafting_y, crafting_width, crafting_height), texts
+        )
+        self.craftability = CraftabilityCache()
+
+    def initialize_input(self):
+        # Couches de saisie, de la scène vers les fenêtres modales
+        router = InputRouter()
+        base_widgets = self.buttons + [self.message_view]
+        inventory_widgets = [self.inventory_close_button]
+        no_widgets = []
+        router.add_layer(InputLayer("scene", lambda: True, lambda: base_widgets))
+        router.add_layer(
+            InputLayer(
+                "inventory",
+                lambda: self.inventory_visible,
+                lambda: inventory_widgets,
+                modal=True,
+            )
+        )
+        router.add_layer(
+            InputLayer(
+                "crafting",
+                lambda: self.crafting_visible,
+                lambda: self.crafting_buttons,
+                modal=True,
+            )
+        )
+        router.add_layer(
+            InputLayer(
+                "popup",
+                lambda: self.active_popup is not None,
+                lambda: self.active_popup.buttons if self.active_popup else no_widgets,
+                modal=True,
+            )
+        )
+
+        # Raccourcis clavier
+        for key, speed in SPEED_KEYS.items():
+            router.bind_key(key, lambda s=speed: self.set_speed(s))
+        for key, lines in LOG_SCROLL_KEYS.items():
+            router.bind_key(key, lambda n=lines: self.message_view.scroll_by(n))
+        router.bind_key(pygame.K_F3, self.toggle_profiler)
+        router.bind_key(pygame.K_F4, self.export_profile)
+        if self.autosaver:
+            router.bind_key(pygame.K_F5, self.quick_save)
+            router.bind_key(pygame.K_F9, self.load_saved_game)
+        self.input_router = router
+
+    def on_period_changed(self):
+        self.warm_backgrounds()
+
+        # Sauvegarde automatique à chaque période, écrite en arrière-plan
+        if self.autosaver:
+            self.autosaver.request(self)
+
+    def profiler_counters(self):
+        hud = self.status_hud.stats()
+        return {"Barres de statut": f"{hud['redraws_per_second']:.1f} màj/s"}
+
+    def toggle_profiler(self):
+        return self.profiler.toggle()
+
+    def export_profile(self):
+        path = time.strftime("profil_%Y%m%d_%H%M%S.csv")
+        frames = self.profiler.export_csv(path)
+        self.notify(f"Profil exporté: {path} ({frames} images)")
+        return True
+
+    def notify(self, message):
+        # Avis de l'interface, affiché dans le titre de la fenêtre: le journal
+        # du joueur fait partie de l'état rejoué et de son empreinte
+        pygame.display.set_caption(f"Survie Réaliste - {message}")
+
+    def quick_save(self):
+        self.autosaver.request(self)
+        self.notify("Partie sauvegardée.")
+
+    def load_saved_game(self):
+        # Un enregistrement rejoue la partie depuis sa graine: pas de chargement
+        if self.recording is not None:
+            self.notify("Chargement désactivé pendant l'enregistrement.")
+            return False
+        if self.autosaver:
+            self.autosaver.flush()
+        if not self.save_path or not os.path.exists(self.save_path):
+            return False
+        try:
+            savegame.load_game(self, self.save_path)
+        except (OSError, ValueError) as error:
+            self.notify(f"Sauvegarde illisible: {error}")
+            return False
+        self.notify("Partie chargée.")
+        self.active_popup = None
+        if self.dirty_renderer:
+            self.dirty_renderer.invalidate()
+        # Partie perdue: elle reprend sur la fenêtre de fin de partie
+        if self.player.health <= 0:
+            self.show_game_over_popup()
+        return True
+
+    def on_game_over(self):
+        # Mort sauvegardée aussitôt: quitter puis recharger ne l'annule pas
+        if self.autosaver:
+            self.autosaver.request(self)
+        self.show_game_over_popup()
+
+    def game_over_shown(self):
+        popup = self.active_popup
+        return popup is not None and popup.title == "Fin de partie"
+
+    def show_game_over_popup(self):
+        content = f"Vous n'avez pas survécu.\nJours de survie: {self.days_survived}\n\nVoulez-vous recommencer?"
+        buttons = [
+            Button(
+                self.screen.get_width() // 2 - 100,
+                self.screen.get_height() // 2 + 50,
+                80,
+                40,
+                "Oui",
+                action=self.restart_game,
+            ),
+            Button(
+                self.screen.get_width() // 2 + 20,
+                self.screen.get_height() // 2 + 50,
+                80,
+                40,
+                "Non",
+                action=self.quit_game,
+            ),
+        ]
+        self.active_popup = Popup("Fin de partie", content, buttons)
+
+    def restart_game(self):
+        self.active_popup = None
+        return super().restart_game()
+
+    def quit_game(self):
+        self.running = False
+        return True
+
+    # Popup fermé avant l'action: une mort pendant l'action ouvre celui de fin de partie
+    def consume_item(self, action_type, item_name):
+        self.active_popup = None
+        super().consume_item(action_type, item_name)
+        return True
+
+    def rest(self, hours):
+        self.active_popup = None
+        super().rest(hours)
+        return True
+
+    def close_popup(self):
+        self.active_popup = None
+        return True
+
+    def draw_status_bars(self):
+        self.status_hud.draw(self.screen, self)
+
+    def draw_message_log(self):
+        self.message_view.draw(self.screen, self.player.message_log)
+
+    def draw_inventory(self):
+        if not self.inventory_visible:
+            return
+
+        inventory = self.player.inventory
+        state = (tuple(inventory.items.items()), inventory.current_grams)
+        self.inventory_panel.draw(self.screen, state, self.render_inventory_rows)
+        self.inventory_close_button.draw(self.screen)
+
+    def render_inventory_rows(self, surface):
+        inventory = self.player.inventory
+
+        # Titre
+        title_text = text_renderer.render(
+            f"Inventaire ({inventory.current_weight:.1f}/{inventory.max_weight} kg)",
+            32,
+            BLACK,
+        )
+
+        # Items: cases de l'atlas d'abord (il peut s'agrandir), puis un seul
+        # appel blits pour le titre, les icônes et les libellés
+        rows = []
+        item_y = 50
+        for item_name, quantity in inventory.items.items():
+            item = Item.get(item_name)
+            if item:
+                item_text = text_renderer.render(
+                    f"{item_name} x{quantity} ({item.weight * quantity:.1f} kg)",
+                    24,
+                    BLACK,
+                )
+                rows.append((icon_atlas.get(item), item_text, item_y))
+                item_y += 40
+
+        atlas = icon_atlas.surface
+        sequence = [(title_text, (10, 10))]
+        for area, item_text, y in rows:
+            sequence.append((atlas, (10, y), area))
+            sequence.append((item_text, (80, y + 10)))
+        surface.blits(sequence, doreturn=False)
+
+    def draw_crafting(self):
+        if not self.crafting_visible:
+            return
+
+        # Couleurs des boutons mises à jour pour les seules recettes touchées
+        for recipe in self.craftability.refresh(self.player):
+            can_craft = self.craftability.can_craft(recipe.name)
+            self.recipe_buttons[recipe.name].color = GREEN if can_craft else GRAY
+
+        self.crafting_panel.draw(self.screen)
+
+        # Dessin des boutons persistants
+        for button in self.crafting_buttons:
+            button.draw(self.screen)
+
+    def dirty_regions(self):
+        # Régions de l'écran et signature de leur contenu visible
+        regions = []
+        inventory = self.player.inventory
+        self.status_hud.update(self)
+        regions.append(("status", self.status_hud.rect, self.status_hud.version))
+
+        self.message_view.sync(self.player.message_log)
+        regions.append(("log", self.message_view.rect, self.message_view.state()))
+
+        sprites = [
+            ("shelter", (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2)),
+            ("fire", (SCREEN_WIDTH // 2 + 50, SCREEN_HEIGHT // 2 + 30)),
+            ("player", (self.player.x, self.player.y)),
+        ]
+        visible = {
+            "shelter": self.player.has_shelter,
+            "fire": self.player.has_fire,
+            "player": True,
+        }
+        for name, position in sprites:
+            # Sprite caché et encore jamais chargé: rien à effacer, et pas de
+            # chargement avant la première image
+            if visible[name] or name in self.images:
+                size = self.images[name].get_size()
+            else:
+                size = (0, 0)
+            rect = pygame.Rect(position, size)
+            regions.append((name, rect, (visible[name], position)))
+
+        for i, button in enumerate(self.buttons):
+            regions.append(
+                (
+                    f"button{i}",
+                    button.rect.inflate(2, 2),
+                    (button.text, button.color, button.hovered),
+                )
+            )
+
+        # Fenêtres modales: l'ouverture/fermeture invalide tout l'écran,
+        # ensuite seul le panneau est redessiné
+        modal = None
+        if self.active_popup:
+            modal = (
+                self.active_popup.rect,
+                (
+                    id(self.active_popup),
+                    tuple(button.hovered for button in self.active_popup.buttons),
+                ),
+            )
+        elif self.inventory_visible or self.crafting_visible:
+            width = 400 if self.inventory_visible else 500
+            rect = pygame.Rect(
+                (SCREEN_WIDTH - width) // 2, (SCREEN_HEIGHT - 400) // 2, width, 400
+            )
+            mouse_pos = pygame.mouse.get_pos()
+            modal = (
+                rect,
+                (
+                    tuple(inventory.items.items()),
+                    self.player.has_fire,
+                    mouse_pos if rect.collidepoint(mouse_pos) else None,
+                ),
+            )
+        layer = (
+            self.active_popup is not None,
+            self.inventory_visible,
+            self.crafting_visible,
+        )
+        background = (self.time_of_day, self.current_weather, layer)
+        regions.append(("background", self.screen.get_rect(), background))
+        if modal:
+            regions.append(("modal", modal[0], modal[1]))
+        return regions
+
+    def draw(self):
+        profiler = self.profiler
+        if self.dirty_renderer:
+            self.dirty_renderer.render()
+            if profiler.enabled:
+                profiler.draw(self.screen)
+                pygame.display.update(profiler.overlay_rect)
+                profiler.mark("flip")
+            return
+
+        self.draw_scene()
+        if profiler.enabled:
+            profiler.draw(self.screen)
+
+        # Mise à jour de l'écran
+        pygame.display.flip()
+        if profiler.enabled:
+            profiler.mark("flip")
+
+    def draw_scene(self):
+        # Fond d'écran selon la météo et l'heure
+        background_key = (self.time_of_day, self.current_weather)
+        bg_image = None
+        if background_key in self.background_images:
+            bg_image = self.assets.get(
+                self.background_images[background_key], optional=True
+            )
+        if bg_image is None:
+            bg_image = self.default_bg
+        self.screen.blit(bg_image, (0, 0))
+
+        # Dessin des éléments de jeu
+        if self.player.has_shelter:
+            self.screen.blit(
+                self.images["shelter"], (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2)
+            )
+
+        if self.player.has_fire:
+            self.screen.blit(
+                self.images["fire"], (SCREEN_WIDTH // 2 + 50, SCREEN_HEIGHT // 2 + 30)
+            )
+
+        # Joueur
+        self.screen.blit(self.images["player"], (self.player.x, self.player.y))
+        profiler = self.profiler
+        if profiler.enabled:
+            profiler.mark("draw_scene")
+
+        # Interface utilisateur
+        self.draw_status_bars()
+        if profiler.enabled:
+            profiler.mark("draw_hud")
+        self.draw_message_log()
+        if profiler.enabled:
+            profiler.mark("draw_log")
+
+        # Boutons d'action
+        for button in self.buttons:
+            button.draw(self.screen)
+        if profiler.enabled:
+            profiler.mark("draw_buttons")
+
+        # Inventaire et crafting (si visible)
+        self.draw_inventory()
+        if profiler.enabled:
+            profiler.mark("draw_inventory")
+        self.draw_crafting()
+        if profiler.enabled:
+            profiler.mark("draw_crafting")
+
+        # Popup (si actif)
+        if self.active_popup:
+            self.active_popup.draw(self.screen)
+        if profiler.enabled:
+            profiler.mark("draw_popup")
+
+    def simulation_tick(self):
+        # La simulation s'arrête à la mort du joueur (popup de fin de partie).
+        # Une mort hors de la mise à jour du monde (ex: maladie en mangeant)
+        # n'a pas ouvert le popup: il l'est ici.
+        if self.player.health > 0:
+            self.update_game_state()
+        elif not self.game_over_shown():
+            self.on_game_over()
+
+    def set_speed(self, name):
+        self.simulation_clock.set_speed(name)
+        pygame.display.set_caption(f"Survie Réaliste - Jeu de Simulation ({name})")
+        return True
+
+    def run(self):
+        self.initialize()
+        self.load_saved_game()
+        frame_time = 0.0
+
+        while self.running:
+            profiler = self.profiler
+            # Effacer le graphe de l'écran quand il disparaît
+            if profiler.begin_frame() and self.dirty_renderer:
+                self.dirty_renderer.invalidate()
+
+            # Gestion des événements, routés vers le widget visé
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+                else:
+                    self.input_router.dispatch(event)
+
+            # Survol: une seule requête par image dans l'index spatial
+            self.input_router.update_hover(pygame.mouse.get_pos())
+            if profiler.enabled:
+                profiler.mark("events")
+
+            # Mise à jour de l'état du jeu à pas fixe
+            self.simulation_clock.advance(frame_time, self.simulation_tick)
+            if profiler.enabled:
+                profiler.mark("simulation")
+
+            # Dessin, sauté si l'image précédente a dépassé son budget
+            if frame_time > 1.5 / FPS and self.skipped_frames < MAX_FRAME_SKIP:
+                self.skipped_frames += 1
+            else:
+                self.skipped_frames = 0
+                self.draw()
+                self.input_router.frame_presented()
+
+                # Chargement différé, après l'affichage de l'image
+                if self.asset_stream is not None:
+                    self.stream_assets()
+                if profiler.enabled:
+                    profiler.mark("assets")
+
+            # Contrôle de la fréquence d'images
+            frame_time = self.clock.tick(FPS) / 1000.0
+            if profiler.enabled:
+                profiler.mark("wait")
+                profiler.end_frame()
+
+        # Dernière sauvegarde avant de quitter
+        if self.autosaver:
+            self.autosaver.request(self)
+            self.autosaver.close()
+
+        # Sauvegarde de l'enregistrement de la session
+        if self.recording is not None:
+            self.recording.finish(self)
+            self.recording.save(self.record_path)
+
+        pygame.quit()
+
+
+# Cuisson hors-ligne de toutes les ressources référencées
+def bake_assets(cache=None):
+    cache = cache or BakedAssetCache()
+    keep_keys = set()
+
+    paths = list(IMAGE_ASSETS) + [
+        path for path in BACKGROUND_IMAGES.values() if os.path.exists(path)
+    ]
+    for path in paths:
+        cache.load(path)
+        if os.path.exists(path):
+            keep_keys.add(cache.source_key(path))
+        else:
+            keep_keys.add(cache.generated_key(f"missing:{path}"))
+
+    Item.initialize_items()
+    for item in Item.all_items:
+        if os.path.exists(item.icon_name):
+            cache.load(item.icon_name)
+            keep_keys.add(cache.source_key(item.icon_name))
+        else:
+            cache.load_generated(
+                f"icon:{item.name}", lambda n=item.name: make_placeholder_icon(n)
+            )
+            keep_keys.add(cache.generated_key(f"icon:{item.name}"))
+
+    removed = cache.prune(keep_keys)
+    return {"baked": cache.misses, "up_to_date": cache.hits, "pruned": removed}
+
+
+def compare_cold_start():
+    # Décodage depuis les sources (PNG + icônes générées)
+    start = time.perf_counter()
+    for path in IMAGE_ASSETS:
+        load_image(path)
+    for item in Item.all_items:
+        if os.path.exists(item.icon_name):
+            load_image(item.icon_name)
+        else:
+            make_placeholder_icon(item.name)
+    decoded = time.perf_counter() - start
+
+    # Projection du cache pré-décodé
+    cache = BakedAssetCache()
+    start = time.perf_counter()
+    for path in IMAGE_ASSETS:
+        cache.load(path)
+    for item in Item.all_items:
+        if os.path.exists(item.icon_name):
+            cache.load(item.icon_name)
+        else:
+            cache.load_generated(
+                f"icon:{item.name}", lambda n=item.name: make_placeholder_icon(n)
+            )
+    mapped = time.perf_counter() - start
+    return decoded, mapped
+
+
+# Point d'entrée du programme
+if __name__ == "__main__":
+    if "--bake" in sys.argv:
+        print(bake_assets())
+        decoded, mapped = compare_cold_start()
+        print(f"Décodage des sources: {decoded * 1000:.2f} ms")
+        print(f"Cache pré-décodé: {mapped * 1000:.2f} ms")
+    else:
+        record_path = None
+        if "--record" in sys.argv:
+            record_path = sys.argv[sys.argv.index("--record") + 1]
+        save_path = "partie.sav"
+        if "--save" in sys.argv:
+            save_path = sys.argv[sys.argv.index("--save") + 1]
+        game = SurvivalGame(
+            dirty_rects="--dirty-rects" in sys.argv,
+            record_path=record_path,
+            save_path=save_path,
+            profile="--profile" in sys.argv,
+        )
+        game.run()
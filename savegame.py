@@ -0,0 +1,367 @@
+# Sauvegarde binaire compacte et versionnée de l'état complet d'une partie
+import os
+import queue
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections import namedtuple
+
+from survival_core import TimeOfDay, Weather, Item, Recipe
+
+MAGIC = b"SGSV"
+VERSION = 2
+HEADER = struct.Struct("<4sHI")  # magic, version, taille des données décompressées
+
+TIMES = list(TimeOfDay)
+WEATHERS = list(Weather)
+
+# Instantané immuable de la partie, pris sur le fil principal
+SaveSnapshot = namedtuple(
+    "SaveSnapshot",
+    [
+        "seed",
+        "tick",
+        "days_survived",
+        "time_of_day",
+        "current_weather",
+        "next_weather_day",
+        "time_scale",
+        "events",
+        "name",
+        "health",
+        "hunger",
+        "thirst",
+        "energy",
+        "body_temperature",
+        "fire_duration",
+        "has_fire",
+        "has_shelter",
+        "skills",
+        "max_grams",
+        "items",
+        "message_log",
+        "rng_state",
+    ],
+)
+# Statistiques du joueur: santé, faim, soif, énergie, température, feu
+STATS = slice(
+    SaveSnapshot._fields.index("health"), SaveSnapshot._fields.index("has_fire")
+)
+
+
+def take_snapshot(simulation):
+    player = simulation.player
+    return SaveSnapshot(
+        seed=simulation.seed,
+        tick=simulation.tick,
+        days_survived=simulation.days_survived,
+        time_of_day=simulation.time_of_day,
+        current_weather=simulation.current_weather,
+        next_weather_day=simulation.next_weather_day,
+        time_scale=simulation.time_scale,
+        events=tuple((tick, name) for tick, _, name in sorted(simulation.events)),
+        name=player.name,
+        health=player.health,
+        hunger=player.hunger,
+        thirst=player.thirst,
+        energy=player.energy,
+        body_temperature=player.body_temperature,
+        fire_duration=player.fire_duration,
+        has_fire=player.has_fire,
+        has_shelter=player.has_shelter,
+        skills=tuple(player.skills.items()),
+        max_grams=player.inventory.max_grams,
+        items=tuple(player.inventory.items.items()),
+        message_log=tuple(player.message_log),
+        rng_state=simulation.rng.getstate(),
+    )
+
+
+def restore_snapshot(simulation, snapshot):
+    # Recrée le joueur avec la classe de la simulation (ex: joueur affiché)
+    simulation.seed = snapshot.seed
+    simulation.tick = snapshot.tick
+    simulation.days_survived = snapshot.days_survived
+    simulation.time_of_day = snapshot.time_of_day
+    simulation.current_weather = snapshot.current_weather
+    simulation.next_weather_day = snapshot.next_weather_day
+    simulation.time_scale = snapshot.time_scale
+    simulation.rng.setstate(snapshot.rng_state)
+    simulation.events = []
+    for tick, name in snapshot.events:
+        simulation.schedule(tick, name)
+
+    Item.initialize_items()
+    Recipe.initialize_recipes()
+    player = simulation.player_class(snapshot.name, simulation.balance)
+    player.rng = simulation.rng
+    player.health = snapshot.health
+    player.hunger = snapshot.hunger
+    player.thirst = snapshot.thirst
+    player.energy = snapshot.energy
+    player.body_temperature = snapshot.body_temperature
+    player.fire_duration = snapshot.fire_duration
+    player.has_fire = snapshot.has_fire
+    player.has_shelter = snapshot.has_shelter
+    player.skills = dict(snapshot.skills)
+    player.inventory.max_grams = snapshot.max_grams
+    for item_name, quantity in snapshot.items:
+        player.inventory.add_item(Item.get(item_name), quantity)
+    player.message_log.extend(snapshot.message_log)
+    simulation.player = player
+
+
+# Encodage binaire: entiers et flottants à taille fixe, chaînes préfixées
+class Writer:
+    def __init__(self):
+        self.parts = []
+
+    def pack(self, fmt, *values):
+        self.parts.append(struct.pack("<" + fmt, *values))
+
+    def string(self, text):
+        data = text.encode("utf-8")
+        self.pack("H", len(data))
+        self.parts.append(data)
+
+    def number(self, value):
+        # Les statistiques peuvent être des entiers (ex: après un plafonnement)
+        if isinstance(value, int):
+            self.pack("Bq", 0, value)
+        else:
+            self.pack("Bd", 1, value)
+
+    def getvalue(self):
+        return b"".join(self.parts)
+
+
+class Reader:
+    def __init__(self, data):
+        self.data = data
+        self.offset = 0
+
+    def unpack(self, fmt):
+        layout = struct.Struct("<" + fmt)
+        values = layout.unpack_from(self.data, self.offset)
+        self.offset += layout.size
+        return values
+
+    def string(self):
+        (length,) = self.unpack("H")
+        text = self.data[self.offset : self.offset + length].decode("utf-8")
+        self.offset += length
+        return text
+
+    def number(self):
+        (kind,) = self.unpack("B")
+        return self.unpack("d" if kind else "q")[0]
+
+
+def encode(snapshot):
+    writer = Writer()
+    writer.pack(
+        "QQIBBId",
+        snapshot.seed,
+        snapshot.tick,
+        snapshot.days_survived,
+        TIMES.index(snapshot.time_of_day),
+        WEATHERS.index(snapshot.current_weather),
+        snapshot.next_weather_day,
+        snapshot.time_scale,
+    )
+    writer.pack("H", len(snapshot.events))
+    for tick, name in snapshot.events:
+        writer.pack("Q", tick)
+        writer.string(name)
+
+    writer.string(snapshot.name)
+    for value in snapshot[STATS]:
+        writer.number(value)
+    writer.pack("BB", snapshot.has_fire, snapshot.has_shelter)
+    writer.pack("B", len(snapshot.skills))
+    for skill, level in snapshot.skills:
+        writer.string(skill)
+        writer.number(level)
+    writer.pack("IH", snapshot.max_grams, len(snapshot.items))
+    for item_name, quantity in snapshot.items:
+        writer.string(item_name)
+        writer.pack("I", quantity)
+    writer.pack("H", len(snapshot.message_log))
+    for message in snapshot.message_log:
+        writer.string(message)
+
+    # État du Mersenne Twister: (version, 625 entiers, gauss_next)
+    version, state, gauss_next = snapshot.rng_state
+    writer.pack("BH", version, len(state))
+    writer.pack(f"{len(state)}I", *state)
+    writer.pack("Bd", gauss_next is not None, gauss_next or 0.0)
+
+    payload = writer.getvalue()
+    return HEADER.pack(MAGIC, VERSION, len(payload)) + zlib.compress(payload, 6)
+
+
+def decode(data):
+    # Fichier tronqué ou altéré: erreurs de bas niveau ramenées à ValueError
+    try:
+        return read_snapshot(data)
+    except (struct.error, zlib.error, IndexError) as error:
+        raise ValueError("Sauvegarde corrompue") from error
+
+
+def read_snapshot(data):
+    magic, version, size = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Fichier de sauvegarde invalide")
+    if version != VERSION:
+        raise ValueError(f"Version de sauvegarde non prise en charge: {version}")
+    payload = zlib.decompress(data[HEADER.size :])
+    if len(payload) != size:
+        raise ValueError("Sauvegarde corrompue")
+
+    reader = Reader(payload)
+    seed, tick, days, time_index, weather_index, next_weather_day, time_scale = (
+        reader.unpack("QQIBBId")
+    )
+    (event_count,) = reader.unpack("H")
+    events = []
+    for _ in range(event_count):
+        (event_tick,) = reader.unpack("Q")
+        events.append((event_tick, reader.string()))
+
+    name = reader.string()
+    health, hunger, thirst, energy, temperature, fire_duration = (
+        reader.number() for _ in range(len(SaveSnapshot._fields[STATS]))
+    )
+    fire, shelter = reader.unpack("BB")
+    (skill_count,) = reader.unpack("B")
+    skills = []
+    for _ in range(skill_count):
+        skill = reader.string()
+        skills.append((skill, reader.number()))
+    max_grams, item_count = reader.unpack("IH")
+    items = []
+    for _ in range(item_count):
+        item_name = reader.string()
+        items.append((item_name, reader.unpack("I")[0]))
+    (message_count,) = reader.unpack("H")
+    messages = tuple(reader.string() for _ in range(message_count))
+
+    rng_version, state_length = reader.unpack("BH")
+    state = reader.unpack(f"{state_length}I")
+    has_gauss, gauss_next = reader.unpack("Bd")
+
+    return SaveSnapshot(
+        seed=seed,
+        tick=tick,
+        days_survived=days,
+        time_of_day=TIMES[time_index],
+        current_weather=WEATHERS[weather_index],
+        next_weather_day=next_weather_day,
+        time_scale=time_scale,
+        events=tuple(events),
+        name=name,
+        health=health,
+        hunger=hunger,
+        thirst=thirst,
+        energy=energy,
+        body_temperature=temperature,
+        fire_duration=fire_duration,
+        has_fire=bool(fire),
+        has_shelter=bool(shelter),
+        skills=tuple(skills),
+        max_grams=max_grams,
+        items=tuple(items),
+        message_log=messages,
+        rng_state=(rng_version, state, gauss_next if has_gauss else None),
+    )
+
+
+def write_atomic(path, data):
+    # Écriture dans un fichier temporaire puis renommage atomique
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as target:
+        target.write(data)
+        target.flush()
+        os.fsync(target.fileno())
+    os.replace(temp_path, path)
+
+
+def save_game(simulation, path):
+    data = encode(take_snapshot(simulation))
+    write_atomic(path, data)
+    return len(data)
+
+
+def load_game(simulation, path):
+    with open(path, "rb") as source:
+        snapshot = decode(source.read())
+    restore_snapshot(simulation, snapshot)
+    return snapshot
+
+
+# Sauvegarde automatique sur un fil d'arrière-plan: la boucle de jeu ne fait
+# que prendre un instantané, l'encodage et l'écriture se font ailleurs
+class AutoSaver:
+    def __init__(self, path):
+        self.path = path
+        self.pending = queue.Queue(maxsize=1)
+        self.saves = 0
+        self.last_size = 0
+        self.last_duration = 0.0
+        self.error = None
+        self.thread = threading.Thread(target=self.worker, daemon=True)
+        self.thread.start()
+
+    def request(self, simulation):
+        snapshot = take_snapshot(simulation)
+        # Seul l'instantané le plus récent compte
+        try:
+            self.pending.get_nowait()
+            self.pending.task_done()
+        except queue.Empty:
+            pass
+        self.pending.put_nowait(snapshot)
+
+    def worker(self):
+        while True:
+            snapshot = self.pending.get()
+            if snapshot is None:
+                self.pending.task_done()
+                return
+            start = time.perf_counter()
+            try:
+                data = encode(snapshot)
+                write_atomic(self.path, data)
+                self.last_size = len(data)
+                self.saves += 1
+            except (OSError, ValueError, struct.error) as error:
+                self.error = error
+            self.last_duration = time.perf_counter() - start
+            self.pending.task_done()
+
+    def flush(self):
+        # Attendre la fin de la dernière écriture
+        self.pending.join()
+
+    def close(self):
+        self.flush()
+        self.pending.put(None)
+        self.thread.join()
+
+
+if __name__ == "__main__":
+    # python savegame.py partie.sav: taille et temps de chargement
+    from survival_core import SurvivalSimulation
+
+    path = sys.argv[1]
+    simulation = SurvivalSimulation()
+    start = time.perf_counter()
+    snapshot = load_game(simulation, path)
+    elapsed = time.perf_counter() - start
+    print(f"{os.path.getsize(path)} octets, chargé en {elapsed * 1000:.2f} ms")
+    print(
+        f"Jour {snapshot.days_survived}, {snapshot.time_of_day.name}, "
+        f"{snapshot.current_weather.name}, santé {snapshot.health:.1f}"
+    )
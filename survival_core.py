@@ -0,0 +1,1400 @@
+# Cœur de simulation sans pygame: joueur, inventaire, objets et écoulement du temps
+import hashlib
+import heapq
+import json
+import math
+import random
+import sys
+import time
+from collections import deque, namedtuple
+from enum import Enum
+from itertools import islice
+
+# Constantes de jeu
+MAX_HEALTH = 100
+MAX_HUNGER = 100
+MAX_THIRST = 100
+MAX_ENERGY = 100
+MAX_TEMPERATURE = 37.0  # température corporelle normale en °C
+
+# Pas de simulation fixe, indépendant de la fréquence d'affichage
+TICK_RATE = 60  # ticks de simulation par seconde réelle à vitesse x1
+
+MESSAGE_HISTORY = 100  # messages conservés dans le journal
+
+# Matériaux consommés par le feu et l'abri
+FIRE_MATERIALS = {"Bois": 3}
+SHELTER_MATERIALS = {"Bois": 5, "Corde": 2}
+# Reste de combustion (heures) en dessous duquel le feu est éteint: absorbe les
+# arrondis de la soustraction répétée, pour que le feu de 8 h s'éteigne au tick
+# 800 tick par tick comme en avance par segments
+FIRE_EPSILON = 1e-6
+
+# Paramètres d'équilibrage: taux par tick (multipliés par time_scale), chances
+# de réussite des actions et plafonds des statistiques
+Balance = namedtuple(
+    "Balance",
+    [
+        "time_scale",
+        "hunger_decay",
+        "thirst_decay",
+        "energy_decay",
+        "snow_cooling",
+        "rain_cooling",
+        "night_cooling",
+        "fire_warming",
+        "shelter_warming",
+        "shelter_rest",
+        "starvation_damage",
+        "dehydration_damage",
+        "exposure_damage",
+        "fire_burn",
+        "period_chance",
+        "weather_chance",
+        "hunt_chance",
+        "hunt_skill_bonus",
+        "hunt_weapon_bonus",
+        "forage_wood_chance",
+        "forage_stone_chance",
+        "forage_rope_chance",
+        "forage_berries_chance",
+        "forage_water_chance",
+        "fire_chance",
+        "lighter_fire_chance",
+        "raw_meat_sickness",
+        "rain_water_sickness",
+        "rest_disturbance",
+        "max_health",
+        "max_hunger",
+        "max_thirst",
+        "max_energy",
+    ],
+)
+# Équilibrage du jeu
+BALANCE = Balance(
+    time_scale=0.1,
+    hunger_decay=0.05,
+    thirst_decay=0.1,
+    energy_decay=0.03,
+    snow_cooling=0.02,
+    rain_cooling=0.01,
+    night_cooling=0.01,
+    fire_warming=0.02,
+    shelter_warming=0.005,
+    shelter_rest=0.05,
+    starvation_damage=0.1,
+    dehydration_damage=0.2,
+    exposure_damage=0.05,
+    fire_burn=0.1,
+    period_chance=0.05,
+    weather_chance=0.3,
+    hunt_chance=0.3,
+    hunt_skill_bonus=0.1,
+    hunt_weapon_bonus=0.2,
+    forage_wood_chance=0.7,
+    forage_stone_chance=0.5,
+    forage_rope_chance=0.3,
+    forage_berries_chance=0.4,
+    forage_water_chance=0.8,
+    fire_chance=0.5,
+    lighter_fire_chance=0.9,
+    raw_meat_sickness=0.3,
+    rain_water_sickness=0.2,
+    rest_disturbance=0.5,
+    max_health=MAX_HEALTH,
+    max_hunger=MAX_HUNGER,
+    max_thirst=MAX_THIRST,
+    max_energy=MAX_ENERGY,
+)
+
+
+# Énumération pour les conditions météorologiques
+class Weather(Enum):
+    SUNNY = 1
+    CLOUDY = 2
+    RAINY = 3
+    STORMY = 4
+    SNOWY = 5
+
+
+# Énumération pour les périodes de la journée
+class TimeOfDay(Enum):
+    MORNING = 1
+    AFTERNOON = 2
+    EVENING = 3
+    NIGHT = 4
+
+
+# Période suivante de chaque période de la journée
+WEATHERS = list(Weather)
+NEXT_TIME_OF_DAY = {
+    period: list(TimeOfDay)[(i + 1) % len(TimeOfDay)]
+    for i, period in enumerate(TimeOfDay)
+}
+
+
+# Résultat d'une opération groupée sur l'inventaire: objets ajoutés (nom ->
+# quantité), matériaux manquants, et si la limite de poids a réduit les ajouts
+InventoryChange = namedtuple("InventoryChange", ["ok", "added", "missing", "full"])
+
+
+# Classe pour représenter l'inventaire du joueur
+
+
+class Inventory:
+    CATEGORIES = ["food", "drinkable", "weapon", "tool"]
+
+    def __init__(self):
+        self.items = {}  # nom -> quantité
+        self.objects = {}  # nom -> Item, pour les objets présents
+        # Index par catégorie et totaux, tenus à jour à chaque ajout/retrait
+        self.by_category = {category: {} for category in self.CATEGORIES}
+        self.category_counts = dict.fromkeys(self.CATEGORIES, 0)
+        self.total_count = 0
+        self.max_grams = 20000  # poids maximum (20 kg), en grammes exacts
+        self.current_grams = 0
+        self.listeners = []  # appelés avec le nom de chaque objet modifié
+
+    @property
+    def max_weight(self):
+        return self.max_grams / 1000
+
+    @max_weight.setter
+    def max_weight(self, kilograms):
+        self.max_grams = round(kilograms * 1000)
+
+    @property
+    def current_weight(self):
+        return self.current_grams / 1000
+
+    def notify(self, item_name):
+        for listener in self.listeners:
+            listener(item_name)
+
+    def add_item(self, item, quantity=1):
+        if self.current_grams + item.grams * quantity <= self.max_grams:
+            self.store(item, quantity)
+            self.notify(item.name)
+            return True
+        else:
+            return False
+
+    def remove_item(self, item_name, quantity=1):
+        if item_name in self.items and self.items[item_name] >= quantity:
+            self.discard(item_name, quantity)
+            self.notify(item_name)
+            return True
+        return False
+
+    def apply(self, adds=(), removes=(), partial=False):
+        # Ajouts et retraits appliqués ensemble ou pas du tout: vérification
+        # complète (présence, poids) avant toute modification. En mode partiel,
+        # les ajouts sont réduits, dans l'ordre donné, à ce qui tient encore.
+        adds = dict(adds)  # Item -> quantité
+        removes = dict(removes)  # nom -> quantité
+        missing = {
+            name: quantity
+            for name, quantity in removes.items()
+            if not self.has_item(name, quantity)
+        }
+        if missing:
+            return InventoryChange(False, {}, missing, False)
+
+        free = self.max_grams - self.current_grams
+        for name, quantity in removes.items():
+            free += self.objects[name].grams * quantity
+        accepted = {}
+        full = False
+        for item, quantity in adds.items():
+            fits = quantity
+            if item.grams * quantity > free:
+                fits = free // item.grams
+                full = True
+                if not partial:
+                    return InventoryChange(False, {}, {}, True)
+            if fits:
+                accepted[item] = fits
+                free -= item.grams * fits
+
+        for name, quantity in removes.items():
+            self.discard(name, quantity)
+        for item, quantity in accepted.items():
+            self.store(item, quantity)
+        changed = dict.fromkeys(removes)
+        changed.update(dict.fromkeys(item.name for item in accepted))
+        for name in changed:
+            self.notify(name)
+        added = {item.name: quantity for item, quantity in accepted.items()}
+        return InventoryChange(True, added, {}, full)
+
+    def store(self, item, quantity):
+        # Mise à jour des quantités et des index, sans contrôle
+        if item.name in self.items:
+            self.items[item.name] += quantity
+        else:
+            self.items[item.name] = quantity
+            self.objects[item.name] = item
+            for category in item.categories():
+                self.by_category[category][item.name] = item
+        for category in item.categories():
+            self.category_counts[category] += quantity
+        self.total_count += quantity
+        self.current_grams += item.grams * quantity
+
+    def discard(self, item_name, quantity):
+        self.items[item_name] -= quantity
+        item = self.objects[item_name]
+        for category in item.categories():
+            self.category_counts[category] -= quantity
+        self.total_count -= quantity
+        self.current_grams -= item.grams * quantity
+        if self.items[item_name] <= 0:
+            del self.items[item_name]
+            del self.objects[item_name]
+            for category in item.categories():
+                del self.by_category[category][item_name]
+
+    def has_item(self, item_name, quantity=1):
+        return item_name in self.items and self.items[item_name] >= quantity
+
+    def has_category(self, category):
+        return self.category_counts[category] > 0
+
+    def items_in(self, category):
+        # Noms des objets présents de la catégorie, dans l'ordre d'arrivée
+        return list(self.by_category[category])
+
+    def best_weapon(self):
+        weapons = self.by_category["weapon"].values()
+        return max(weapons, key=lambda item: item.damage, default=None)
+
+
+# Journal des messages: tampon circulaire, les plus anciens sont oubliés
+class MessageLog:
+    def __init__(self, history=MESSAGE_HISTORY):
+        self.messages = deque(maxlen=history)
+        self.total = 0  # messages reçus depuis le début, sert de version
+
+    def append(self, message):
+        self.messages.append(message)
+        self.total += 1
+
+    def extend(self, messages):
+        for message in messages:
+            self.append(message)
+
+    def recent(self, count):
+        # Les `count` derniers messages, du plus ancien au plus récent
+        return list(islice(reversed(self.messages), count))[::-1]
+
+    def __len__(self):
+        return len(self.messages)
+
+    def __iter__(self):
+        return iter(self.messages)
+
+
+# Classe pour les objets du jeu
+class Item:
+    all_items = []
+    by_name = {}
+    by_category = {"food": [], "drinkable": [], "weapon": [], "tool": []}
+
+    def __init__(
+        self,
+        name,
+        weight,
+        description,
+        icon_name=None,
+        is_food=False,
+        is_drinkable=False,
+        is_weapon=False,
+        is_tool=False,
+        hunger_value=0,
+        thirst_value=0,
+        damage=0,
+        durability=100,
+    ):
+        self.name = name
+        self.weight = weight
+        self.grams = round(weight * 1000)  # poids exact pour l'inventaire
+        self.description = description
+        self.icon_name = (
+            icon_name if icon_name else f"icons/{name.lower().replace(' ', '_')}.png"
+        )
+        self.is_food = is_food
+        self.is_drinkable = is_drinkable
+        self.is_weapon = is_weapon
+        self.is_tool = is_tool
+        self.hunger_value = hunger_value
+        self.thirst_value = thirst_value
+        self.damage = damage
+        self.durability = durability
+        Item.register(self)
+
+    @classmethod
+    def register(cls, item):
+        # Remplacer un objet déjà connu sous le même nom plutôt que de dupliquer
+        previous = cls.by_name.get(item.name)
+        if previous is not None:
+            cls.all_items.remove(previous)
+            for items in cls.by_category.values():
+                if previous in items:
+                    items.remove(previous)
+
+        cls.all_items.append(item)
+        cls.by_name[item.name] = item
+        for category in item.categories():
+            cls.by_category[category].append(item)
+
+    @classmethod
+    def get(cls, name):
+        return cls.by_name.get(name)
+
+    @classmethod
+    def in_category(cls, category):
+        return cls.by_category[category]
+
+    def categories(self):
+        flags = {
+            "food": self.is_food,
+            "drinkable": self.is_drinkable,
+            "weapon": self.is_weapon,
+            "tool": self.is_tool,
+        }
+        return [category for category, enabled in flags.items() if enabled]
+
+    @classmethod
+    def initialize_items(cls):
+        # Le catalogue n'est construit qu'une seule fois (idempotent au redémarrage)
+        if cls.by_name:
+            return
+
+        # Nourriture
+        Item(
+            "Baies",
+            0.1,
+            "Des baies sauvages comestibles.",
+            is_food=True,
+            hunger_value=5,
+            thirst_value=2,
+        )
+        Item(
+            "Viande crue",
+            0.5,
+            "De la viande crue. Mieux vaut la cuire avant de la manger.",
+            is_food=True,
+            hunger_value=10,
+        )
+        Item(
+            "Viande cuite",
+            0.5,
+            "De la viande bien cuite.",
+            is_food=True,
+            hunger_value=30,
+        )
+
+        # Boisson
+        Item(
+            "Eau de pluie",
+            0.5,
+            "De l'eau de pluie recueillie.",
+            is_drinkable=True,
+            thirst_value=20,
+        )
+        Item(
+            "Eau purifiée",
+            0.5,
+            "De l'eau potable et purifiée.",
+            is_drinkable=True,
+            thirst_value=40,
+        )
+
+        # Armes
+        Item(
+            "Couteau de fortune",
+            0.3,
+            "Un couteau rudimentaire fabriqué avec des matériaux trouvés.",
+            is_weapon=True,
+            is_tool=True,
+            damage=10,
+            durability=50,
+        )
+        Item(
+            "Lance en bois",
+            1.2,
+            "Une lance taillée dans du bois.",
+            is_weapon=True,
+            damage=15,
+            durability=30,
+        )
+
+        # Outils
+        Item(
+            "Hache de pierre",
+            2.0,
+            "Une hache primitive faite de pierre et de bois.",
+            is_tool=True,
+            durability=40,
+        )
+        Item(
+            "Briquet",
+            0.1,
+            "Un briquet qui permet d'allumer un feu facilement.",
+            is_tool=True,
+            durability=100,
+        )
+
+        # Ressources
+        Item("Bois", 1.0, "Du bois ramassé dans la forêt.")
+        Item(
+            "Pierre",
+            0.8,
+            "Une pierre qui peut être utilisée pour fabriquer des outils.",
+        )
+        Item("Corde", 0.2, "Une corde fabriquée à partir de fibres végétales.")
+
+
+# Recettes de fabrication: registre unique, avec index inverse matériau -> recettes
+class Recipe:
+    all_recipes = []
+    by_name = {}
+    by_material = {}
+    needing_fire = []
+
+    def __init__(self, name, materials, requires_fire=False, special=None, label=None):
+        self.name = name  # objet produit, ou nom de l'action spéciale
+        self.materials = dict(materials)
+        self.requires_fire = requires_fire
+        self.special = special  # action de la simulation à la place d'un objet
+        self.label = label
+        Recipe.register(self)
+
+    @classmethod
+    def register(cls, recipe):
+        previous = cls.by_name.get(recipe.name)
+        if previous is not None:
+            cls.all_recipes.remove(previous)
+            for recipes in cls.by_material.values():
+                if previous in recipes:
+                    recipes.remove(previous)
+            if previous in cls.needing_fire:
+                cls.needing_fire.remove(previous)
+
+        cls.all_recipes.append(recipe)
+        cls.by_name[recipe.name] = recipe
+        for material in recipe.materials:
+            cls.by_material.setdefault(material, []).append(recipe)
+        if recipe.requires_fire:
+            cls.needing_fire.append(recipe)
+
+    @classmethod
+    def get(cls, name):
+        return cls.by_name.get(name)
+
+    @classmethod
+    def using(cls, material):
+        return cls.by_material.get(material, ())
+
+    def can_craft(self, player):
+        if self.requires_fire and not player.has_fire:
+            return False
+        inventory = player.inventory
+        return all(
+            inventory.has_item(material, quantity)
+            for material, quantity in self.materials.items()
+        )
+
+    def describe(self):
+        if self.label:
+            return self.label
+        materials = ", ".join(f"{qty} {mat}" for mat, qty in self.materials.items())
+        return f"{self.name} - Matériaux: {materials}"
+
+    @classmethod
+    def initialize_recipes(cls):
+        if cls.by_name:
+            return
+
+        Recipe("Couteau de fortune", {"Pierre": 1, "Bois": 1})
+        Recipe("Lance en bois", {"Bois": 2, "Corde": 1})
+        Recipe("Hache de pierre", {"Pierre": 2, "Bois": 1, "Corde": 1})
+        Recipe(
+            "Purifier l'eau",
+            {"Eau de pluie": 1},
+            requires_fire=True,
+            special="purify_water",
+            label="Purifier l'eau (Eau de pluie + Feu)",
+        )
+
+
+# Cache de faisabilité des recettes pour un joueur: seules les recettes qui
+# utilisent un objet modifié (ou le feu) sont réévaluées
+class CraftabilityCache:
+    def __init__(self):
+        self.inventory = None
+        self.has_fire = None
+        self.craftable = {}
+        self.pending = set()
+        self.evaluations = 0
+
+    def refresh(self, player):
+        # Renvoie les recettes dont la faisabilité a changé
+        if player.inventory is not self.inventory:
+            if self.inventory is not None:
+                self.inventory.listeners.remove(self.pending.add)
+            self.inventory = player.inventory
+            self.inventory.listeners.append(self.pending.add)
+            self.has_fire = player.has_fire
+            self.craftable = {}
+            self.pending.clear()
+            affected = Recipe.all_recipes
+        elif self.pending or player.has_fire != self.has_fire:
+            affected = set()
+            for material in self.pending:
+                affected.update(Recipe.using(material))
+            if player.has_fire != self.has_fire:
+                self.has_fire = player.has_fire
+                affected.update(Recipe.needing_fire)
+            self.pending.clear()
+        else:
+            return []
+
+        changed = []
+        for recipe in affected:
+            craftable = recipe.can_craft(player)
+            self.evaluations += 1
+            if self.craftable.get(recipe.name) != craftable:
+                self.craftable[recipe.name] = craftable
+                changed.append(recipe)
+        return changed
+
+    def can_craft(self, name):
+        return self.craftable.get(name, False)
+
+
+# Classe principale du joueur
+class Player:
+    def __init__(self, name, balance=BALANCE):
+        self.name = name
+        self.balance = balance
+        self.health = balance.max_health
+        self.hunger = balance.max_hunger
+        self.thirst = balance.max_thirst
+        self.energy = balance.max_energy
+        self.body_temperature = MAX_TEMPERATURE
+        self.inventory = Inventory()
+        self.skills = {
+            "Survie": 1,
+            "Chasse": 1,
+            "Construction": 1,
+            "Cuisine": 1,
+            "Combat": 1,
+        }
+        self.has_shelter = False
+        self.has_fire = False
+        self.fire_duration = 0
+        self.message_log = MessageLog()
+        self.rng = random  # remplacé par le générateur de la simulation
+
+    def add_message(self, message):
+        self.message_log.append(message)
+
+    def update_stats(self, game):
+        balance = self.balance
+        ts = game.time_scale
+
+        # Diminution naturelle des statistiques au fil du temps
+        self.hunger -= balance.hunger_decay * ts
+        self.thirst -= balance.thirst_decay * ts
+        self.energy -= balance.energy_decay * ts
+
+        # Impact de la météo sur la température corporelle
+        if game.current_weather == Weather.SNOWY:
+            self.body_temperature -= balance.snow_cooling * ts
+        elif game.current_weather == Weather.RAINY:
+            self.body_temperature -= balance.rain_cooling * ts
+
+        # Impact du moment de la journée sur la température
+        if game.time_of_day == TimeOfDay.NIGHT:
+            self.body_temperature -= balance.night_cooling * ts
+
+        # Impact du feu sur la température corporelle
+        if self.has_fire:
+            self.body_temperature = min(
+                self.body_temperature + balance.fire_warming, MAX_TEMPERATURE
+            )
+
+        # Impact d'un abri sur la température corporelle et l'énergie
+        if self.has_shelter:
+            if self.body_temperature < MAX_TEMPERATURE:
+                self.body_temperature = min(
+                    self.body_temperature + balance.shelter_warming, MAX_TEMPERATURE
+                )
+
+            # Récupération d'énergie pendant la nuit si dans un abri
+            if game.time_of_day == TimeOfDay.NIGHT:
+                self.energy = min(
+                    self.energy + balance.shelter_rest, balance.max_energy
+                )
+
+        # Impact de la faim et de la soif sur la santé
+        if self.hunger <= 0:
+            self.health -= balance.starvation_damage * ts
+            self.hunger = 0
+
+        if self.thirst <= 0:
+            self.health -= balance.dehydration_damage * ts
+            self.thirst = 0
+
+        # Impact de la température corporelle sur la santé
+        if abs(self.body_temperature - MAX_TEMPERATURE) > 2:
+            self.health -= balance.exposure_damage * ts
+
+        # Limites des statistiques
+        self.hunger = max(0, min(self.hunger, balance.max_hunger))
+        self.thirst = max(0, min(self.thirst, balance.max_thirst))
+        self.energy = max(0, min(self.energy, balance.max_energy))
+        self.health = max(0, min(self.health, balance.max_health))
+
+    def eat(self, item_name):
+        if not self.inventory.has_item(item_name):
+            self.add_message(f"Vous n'avez pas de {item_name} dans votre inventaire.")
+            return False
+
+        item = Item.get(item_name)
+        if not item or not item.is_food:
+            self.add_message(f"{item_name} n'est pas comestible.")
+            return False
+
+        self.hunger += item.hunger_value
+        self.thirst += item.thirst_value
+        self.inventory.remove_item(item_name)
+
+        self.add_message(f"Vous avez mangé {item_name}.")
+        if item_name == "Viande crue":
+            # Risque de maladie avec la viande crue
+            if self.rng.random() < self.balance.raw_meat_sickness:
+                self.health -= 10
+                self.add_message(
+                    "Vous ne vous sentez pas bien après avoir mangé de la viande crue."
+                )
+
+        self.hunger = min(self.hunger, self.balance.max_hunger)
+        self.thirst = min(self.thirst, self.balance.max_thirst)
+        return True
+
+    def drink(self, item_name):
+        if not self.inventory.has_item(item_name):
+            self.add_message(f"Vous n'avez pas de {item_name} dans votre inventaire.")
+            return False
+
+        item = Item.get(item_name)
+        if not item or not item.is_drinkable:
+            self.add_message(f"{item_name} n'est pas buvable.")
+            return False
+
+        self.thirst += item.thirst_value
+        self.inventory.remove_item(item_name)
+
+        self.add_message(f"Vous avez bu {item_name}.")
+        if (
+            item_name == "Eau de pluie"
+            and self.rng.random() < self.balance.rain_water_sickness
+        ):
+            # Risque de maladie avec l'eau non purifiée
+            self.health -= 5
+            self.add_message("Cette eau n'était peut-être pas assez propre...")
+
+        self.thirst = min(self.thirst, self.balance.max_thirst)
+        return True
+
+    def rest(self, hours):
+        if not self.has_shelter and self.rng.random() < self.balance.rest_disturbance:
+            # Risque en dormant sans abri
+            self.add_message(
+                "Vous avez été dérangé pendant votre sommeil et n'avez pas pu vous reposer correctement."
+            )
+            self.energy += hours * 5
+        else:
+            self.energy += hours * 10
+            self.add_message(f"Vous vous êtes reposé pendant {hours} heures.")
+
+        # Diminution de la faim et de la soif pendant le repos
+        self.hunger -= hours * 1
+        self.thirst -= hours * 1.5
+
+        self.energy = min(self.energy, self.balance.max_energy)
+        return True
+
+    def build_shelter(self):
+        # Consommation des matériaux, seulement s'ils sont tous présents
+        change = self.inventory.apply(removes=SHELTER_MATERIALS)
+        if not change.ok:
+            material, quantity = next(iter(change.missing.items()))
+            self.add_message(
+                f"Vous avez besoin de {quantity} {material} pour construire un abri."
+            )
+            return False
+
+        self.has_shelter = True
+        self.energy -= 20
+        self.add_message("Vous avez construit un abri simple mais efficace!")
+        return True
+
+    def make_fire(self):
+        # Vérification du briquet
+        has_lighter = self.inventory.has_item("Briquet")
+
+        # Consommation des matériaux, seulement s'ils sont tous présents
+        change = self.inventory.apply(removes=FIRE_MATERIALS)
+        if not change.ok:
+            material, quantity = next(iter(change.missing.items()))
+            self.add_message(
+                f"Vous avez besoin de {quantity} {material} pour faire un feu."
+            )
+            return False
+
+        # Chance de réussite
+        balance = self.balance
+        success_chance = (
+            balance.lighter_fire_chance if has_lighter else balance.fire_chance
+        )
+
+        if self.rng.random() < success_chance:
+            self.has_fire = True
+            self.fire_duration = 8  # Le feu dure 8 heures
+            self.energy -= 10
+            self.add_message("Vous avez réussi à allumer un feu!")
+            return True
+        else:
+            self.add_message("Vous n'avez pas réussi à allumer le feu.")
+            return False
+
+    def cook(self, item_name):
+        if not self.has_fire:
+            self.add_message("Vous avez besoin d'un feu pour cuisiner.")
+            return False
+
+        if (
+            item_name == "Viande crue"
+            and self.inventory.apply({Item.get("Viande cuite"): 1}, {item_name: 1}).ok
+        ):
+            self.add_message("Vous avez cuisiné de la viande crue en viande cuite.")
+
+            # Amélioration de la compétence de cuisine
+            self.skills["Cuisine"] += 0.1
+            return True
+        else:
+            self.add_message(f"Vous ne pouvez pas cuisiner {item_name}.")
+            return False
+
+    def hunt(self, game):
+        if self.energy < 20:
+            self.add_message("Vous êtes trop fatigué pour chasser.")
+            return False
+
+        # Vérification d'une arme
+        has_weapon = self.inventory.has_category("weapon")
+
+        balance = self.balance
+        success_chance = balance.hunt_chance + (
+            balance.hunt_skill_bonus * self.skills["Chasse"]
+        )
+        if has_weapon:
+            success_chance += balance.hunt_weapon_bonus
+
+        if self.rng.random() < success_chance:
+            # Réussite de la chasse
+            meat_qty = self.rng.randint(1, 3)
+            change = self.inventory.apply(
+                {Item.get("Viande crue"): meat_qty}, partial=True
+            )
+            meat_qty = change.added.get("Viande crue", 0)
+
+            self.add_message(
+                f"Chasse réussie! Vous avez obtenu {meat_qty} morceaux de viande crue."
+            )
+            if change.full:
+                self.add_message("Votre inventaire est trop lourd pour tout emporter.")
+
+            # Amélioration de la compétence de chasse
+            self.skills["Chasse"] += 0.2
+        else:
+            self.add_message("Vous n'avez rien trouvé à chasser.")
+
+        self.energy -= 20
+        self.hunger -= 5
+        self.thirst -= 10
+        return True
+
+    def forage(self, game):
+        if self.energy < 15:
+            self.add_message("Vous êtes trop fatigué pour chercher des ressources.")
+            return False
+
+        # Recherche de ressources basée sur l'environnement actuel
+        found = {}
+
+        # Chances de trouver des ressources
+        balance = self.balance
+        if game.current_weather != Weather.STORMY:
+            if self.rng.random() < balance.forage_wood_chance:
+                found[Item.get("Bois")] = self.rng.randint(1, 3)
+
+            if self.rng.random() < balance.forage_stone_chance:
+                found[Item.get("Pierre")] = self.rng.randint(1, 2)
+
+            if self.rng.random() < balance.forage_rope_chance:
+                found[Item.get("Corde")] = 1
+
+            if self.rng.random() < balance.forage_berries_chance:
+                found[Item.get("Baies")] = self.rng.randint(1, 4)
+
+            # Collecte d'eau pendant la pluie
+            if (
+                game.current_weather == Weather.RAINY
+                and self.rng.random() < balance.forage_water_chance
+            ):
+                found[Item.get("Eau de pluie")] = self.rng.randint(1, 2)
+
+        # Un seul ajout groupé, limité à ce que l'inventaire peut porter
+        change = self.inventory.apply(found, partial=True)
+        found_items = [f"{qty} {name}" for name, qty in change.added.items()]
+        if change.full:
+            self.add_message("Votre inventaire est trop lourd pour tout emporter.")
+
+        if found_items:
+            self.add_message(f"Vous avez trouvé: {', '.join(found_items)}")
+        else:
+            self.add_message("Vous n'avez rien trouvé d'intéressant.")
+
+        self.energy -= 15
+        self.hunger -= 3
+        self.thirst -= 7
+        return True
+
+    def craft(self, item_name):
+        recipe = Recipe.get(item_name)
+        if recipe is None or recipe.special:
+            self.add_message(f"Vous ne savez pas fabriquer {item_name}.")
+            return False
+
+        # Matériaux consommés et objet fabriqué en une seule opération
+        change = self.inventory.apply({Item.get(item_name): 1}, recipe.materials)
+        if change.missing:
+            material, quantity = next(iter(change.missing.items()))
+            self.add_message(
+                f"Vous avez besoin de {quantity} {material} pour fabriquer {item_name}."
+            )
+            return False
+        if not change.ok:
+            self.add_message(f"Votre inventaire est trop lourd pour {item_name}.")
+            return False
+
+        self.add_message(f"Vous avez fabriqué {item_name}!")
+
+        # Amélioration de la compétence de construction
+        self.skills["Construction"] += 0.2
+        self.energy -= 10
+        return True
+
+    def purify_water(self):
+        if not self.has_fire:
+            self.add_message("Vous avez besoin d'un feu pour purifier l'eau.")
+            return False
+
+        change = self.inventory.apply(
+            {Item.get("Eau purifiée"): 1}, {"Eau de pluie": 1}
+        )
+        if not change.ok:
+            self.add_message("Vous n'avez pas d'eau de pluie à purifier.")
+            return False
+
+        self.add_message("Vous avez purifié de l'eau de pluie en eau potable.")
+        return True
+
+
+# Nombre de tirages de Bernoulli(p) jusqu'au premier succès inclus
+# (infini si p est nul: l'événement n'arrive jamais)
+def geometric(p, rng=random):
+    if p >= 1:
+        return 1
+    if p <= 0:
+        return math.inf
+    return int(math.log(1.0 - rng.random()) / math.log(1.0 - p)) + 1
+
+
+# Nombre de ticks parmi 1..ticks où value - t * rate <= 0
+def threshold_ticks(value, rate, ticks):
+    if rate <= 0:
+        # Statistique qui ne baisse pas (ex: hunger_decay=0)
+        return ticks if value <= 0 else 0
+    first = max(1, math.ceil(value / rate))
+    return max(0, ticks - first + 1)
+
+
+# Nombre de ticks parmi 1..ticks où la température s'écarte de plus de 2°C
+def exposed_ticks(temperature, rate, ticks):
+    limit = MAX_TEMPERATURE - 2
+    if rate == 0:
+        return ticks if temperature < limit else 0
+    if rate < 0:
+        # Refroidissement: exposé à partir du tick où la température passe sous la limite
+        if temperature < limit:
+            return ticks
+        safe = math.floor((temperature - limit) / -rate)
+        return max(0, ticks - safe)
+    # Réchauffement: exposé tant que la limite n'est pas atteinte
+    if temperature >= limit:
+        return 0
+    return min(ticks, math.ceil((limit - temperature) / rate) - 1)
+
+
+# Enregistrement compact d'une partie: graine et actions horodatées (en ticks)
+class Recording:
+    VERSION = 2
+
+    def __init__(self, seed, actions=None, end_tick=0, digest=None):
+        self.seed = seed
+        self.actions = actions if actions is not None else []
+        self.end_tick = end_tick
+        self.digest = digest
+
+    def add(self, tick, action, *args):
+        self.actions.append([tick, action, *args])
+
+    def finish(self, simulation):
+        self.end_tick = simulation.tick
+        self.digest = state_digest(simulation)
+
+    def save(self, path):
+        data = {
+            "version": self.VERSION,
+            "seed": self.seed,
+            "end_tick": self.end_tick,
+            "digest": self.digest,
+            "actions": self.actions,
+        }
+        with open(path, "w", encoding="utf-8") as target:
+            json.dump(data, target, separators=(",", ":"), ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as source:
+            data = json.load(source)
+        if data.get("version") != cls.VERSION:
+            raise ValueError(
+                f"Version d'enregistrement inconnue: {data.get('version')}"
+            )
+        return cls(data["seed"], data["actions"], data["end_tick"], data["digest"])
+
+
+# Empreinte de l'état de la partie, pour vérifier qu'un rejeu est identique
+def state_digest(simulation):
+    player = simulation.player
+    state = [
+        simulation.tick,
+        simulation.days_survived,
+        simulation.time_of_day.name,
+        simulation.current_weather.name,
+        repr(player.health),
+        repr(player.hunger),
+        repr(player.thirst),
+        repr(player.energy),
+        repr(player.body_temperature),
+        repr(player.fire_duration),
+        player.has_fire,
+        player.has_shelter,
+        sorted(player.inventory.items.items()),
+        sorted((name, repr(level)) for name, level in player.skills.items()),
+        list(player.message_log),
+    ]
+    encoded = json.dumps(state, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha1(encoded).hexdigest()
+
+
+# Rejeu sans affichage et à vitesse maximale d'un enregistrement
+def replay(recording, simulation_class=None):
+    simulation = (simulation_class or SurvivalSimulation)(seed=recording.seed)
+    simulation.initialize()
+    for tick, action, *args in recording.actions:
+        while simulation.tick < tick:
+            simulation.update_game_state()
+        getattr(simulation, action)(*args)
+    while simulation.tick < recording.end_tick:
+        simulation.update_game_state()
+    return simulation
+
+
+# Simulation du monde, indépendante de l'affichage
+class SurvivalSimulation:
+    player_class = Player
+
+    def __init__(self, seed=None, record=False, balance=BALANCE):
+        # Générateur propre à la partie: une graine suffit à la reproduire
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+        self.recording = Recording(self.seed) if record else None
+
+        self.player = None
+        self.days_survived = 1
+        self.time_of_day = TimeOfDay.MORNING
+        self.current_weather = Weather.SUNNY
+        self.balance = balance
+        self.time_scale = balance.time_scale  # Facteur d'écoulement du temps
+
+        # Événements planifiés: (tick, ordre, nom)
+        self.tick = 0
+        self.events = []
+        self.event_order = 0
+        self.next_weather_day = None
+        self.reschedule()
+
+    def initialize(self):
+        # Créer le joueur
+        self.player = self.player_class("Survivant", self.balance)
+        self.player.rng = self.rng
+        self.days_survived = 1
+        self.time_of_day = TimeOfDay.MORNING
+        self.current_weather = Weather.SUNNY
+        self.reschedule()
+
+        # Initialisation des objets du jeu
+        Item.initialize_items()
+        Recipe.initialize_recipes()
+
+        # Objets de départ
+        self.player.inventory.add_item(Item.get("Couteau de fortune"))
+        self.player.inventory.add_item(Item.get("Baies"), 2)
+        self.player.inventory.add_item(Item.get("Eau de pluie"))
+
+        # Message de bienvenue
+        self.player.add_message(
+            "Vous vous réveillez dans une forêt inconnue. Vous devez survivre."
+        )
+
+    def update_game_state(self):
+        # Mise à jour du temps de jeu: rien à faire avant le prochain événement
+        self.tick += 1
+        if self.events and self.events[0][0] <= self.tick:
+            self.run_events(self.tick)
+
+        # Mise à jour du feu
+        if self.player.has_fire:
+            self.player.fire_duration -= self.balance.fire_burn * self.time_scale
+            if self.player.fire_duration <= FIRE_EPSILON:
+                self.extinguish_fire()
+
+        # Mise à jour des statistiques du joueur
+        self.player.update_stats(self)
+
+        # Vérification de fin de jeu
+        if self.player.health <= 0:
+            self.on_game_over()
+
+    def reschedule(self):
+        # Tirage des prochains changements selon les lois géométriques équivalentes
+        # aux tests aléatoires par tick (période) et par matin (météo).
+        # À rappeler si time_scale change.
+        self.events = []
+        period = geometric(self.period_chance(), self.rng)
+        if period != math.inf:
+            self.schedule(self.tick + period, "period")
+        self.next_weather_day = self.days_survived + geometric(
+            self.balance.weather_chance, self.rng
+        )
+
+    def period_chance(self):
+        return self.balance.period_chance * self.time_scale
+
+    def schedule(self, tick, name):
+        self.event_order += 1
+        heapq.heappush(self.events, (tick, self.event_order, name))
+
+    def run_events(self, tick):
+        while self.events and self.events[0][0] <= tick:
+            _, _, name = heapq.heappop(self.events)
+            if name == "period":
+                self.advance_period()
+                self.schedule(
+                    tick + geometric(self.period_chance(), self.rng), "period"
+                )
+
+    def advance_period(self):
+        # Changement de la période de la journée
+        self.time_of_day = NEXT_TIME_OF_DAY[self.time_of_day]
+
+        if self.time_of_day == TimeOfDay.MORNING:
+            # Nouvelle journée
+            self.days_survived += 1
+            self.player.add_message(f"Jour {self.days_survived}")
+
+            # Changement météo planifié
+            if self.days_survived >= self.next_weather_day:
+                self.next_weather_day = self.days_survived + geometric(
+                    self.balance.weather_chance, self.rng
+                )
+                self.current_weather = self.rng.choice(WEATHERS)
+                self.player.add_message(f"Le temps change: {self.current_weather.name}")
+
+        self.on_period_changed()
+
+    def extinguish_fire(self):
+        self.player.has_fire = False
+        self.player.fire_duration = 0
+        self.player.add_message("Le feu s'est éteint.")
+
+    def fast_forward(self, ticks=None, until=None, days=None):
+        # Avance le monde par segments à conditions constantes (météo, période,
+        # feu, abri) dont l'effet sur les statistiques est calculé directement.
+        # Les bornes de segments sont les événements planifiés et l'extinction du feu.
+        # Arrêt après `ticks`, au début de la période `until` ou après `days` jours.
+        start = self.tick
+        end = math.inf if ticks is None else start + ticks
+        target_day = self.days_survived + days if days is not None else None
+        player = self.player
+        fire_step = self.balance.fire_burn * self.time_scale
+
+        while self.tick < end and player.health > 0:
+            # Événements survenant au début du prochain tick
+            if self.events and self.events[0][0] <= self.tick + 1:
+                self.run_events(self.tick + 1)
+                if self.time_of_day == until or (
+                    target_day is not None and self.days_survived >= target_day
+                ):
+                    break
+            fire_off = math.inf
+            # Feu qui ne se consume pas (fire_burn=0): jamais éteint
+            if player.has_fire and fire_step > 0:
+                fire_off = self.tick + max(
+                    1, math.ceil((player.fire_duration - FIRE_EPSILON) / fire_step)
+                )
+                if fire_off == self.tick + 1:
+                    self.extinguish_fire()
+                    fire_off = math.inf
+
+            next_event = self.events[0][0] if self.events else math.inf
+            count = min(end, next_event - 1, fire_off - 1) - self.tick
+            if count == math.inf:
+                # Ni borne ni événement à venir (ex: period_chance=0 avec until)
+                raise ValueError("fast_forward sans fin: passer une limite en ticks")
+            # Segment raccourci si le joueur meurt: le feu s'arrête avec lui
+            count = self.apply_segment(count)
+            if player.has_fire:
+                player.fire_duration -= fire_step * count
+            self.tick += count
+
+        return self.tick - start
+
+    def apply_segment(self, count):
+        # Effet cumulé de `count` appels à Player.update_stats à conditions constantes
+        player = self.player
+        balance = self.balance
+        ts = self.time_scale
+        night = self.time_of_day == TimeOfDay.NIGHT
+
+        cooling = 0.0
+        if self.current_weather == Weather.SNOWY:
+            cooling += balance.snow_cooling * ts
+        elif self.current_weather == Weather.RAINY:
+            cooling += balance.rain_cooling * ts
+        if night:
+            cooling += balance.night_cooling * ts
+        warming = (balance.fire_warming if player.has_fire else 0.0) + (
+            balance.shelter_warming if player.has_shelter else 0.0
+        )
+        temperature_rate = warming - cooling
+        energy_rate = -balance.energy_decay * ts
+        if player.has_shelter and night:
+            energy_rate += balance.shelter_rest
+
+        hunger_rate = balance.hunger_decay * ts
+        thirst_rate = balance.thirst_decay * ts
+        hunger, thirst, temperature = (
+            player.hunger,
+            player.thirst,
+            player.body_temperature,
+        )
+
+        starvation = balance.starvation_damage * ts
+        dehydration = balance.dehydration_damage * ts
+        exposure = balance.exposure_damage * ts
+
+        def damage(ticks):
+            return (
+                starvation * threshold_ticks(hunger, hunger_rate, ticks)
+                + dehydration * threshold_ticks(thirst, thirst_rate, ticks)
+                + exposure * exposed_ticks(temperature, temperature_rate, ticks)
+            )
+
+        # Mort du joueur au cours du segment: recherche du tick exact
+        if player.health - damage(count) <= 0:
+            low, high = 1, count
+            while low < high:
+                middle = (low + high) // 2
+                if player.health - damage(middle) <= 0:
+                    high = middle
+                else:
+                    low = middle + 1
+            count = low
+
+        player.health = max(0, min(player.health - damage(count), balance.max_health))
+        player.hunger = max(0, min(hunger - hunger_rate * count, balance.max_hunger))
+        player.thirst = max(0, min(thirst - thirst_rate * count, balance.max_thirst))
+        player.energy = max(
+            0, min(player.energy + energy_rate * count, balance.max_energy)
+        )
+        if temperature_rate > 0:
+            temperature = min(temperature + temperature_rate * count, MAX_TEMPERATURE)
+        else:
+            temperature += temperature_rate * count
+        player.body_temperature = temperature
+
+        if player.health <= 0:
+            self.on_game_over()
+        return count
+
+    def on_period_changed(self):
+        # Point d'extension pour la couche d'affichage
+        pass
+
+    def on_game_over(self):
+        # Point d'extension pour la couche d'affichage
+        pass
+
+    def record(self, action, *args):
+        if self.recording is not None:
+            self.recording.add(self.tick, action, *args)
+
+    def perform_action(self, action):
+        self.record("perform_action", action)
+        if action == "hunt":
+            self.player.hunt(self)
+        elif action == "forage":
+            self.player.forage(self)
+        elif action == "fire":
+            if self.player.has_fire:
+                self.player.add_message("Vous avez déjà un feu allumé.")
+            else:
+                self.player.make_fire()
+        elif action == "shelter":
+            if self.player.has_shelter:
+                self.player.add_message("Vous avez déjà construit un abri.")
+            else:
+                self.player.build_shelter()
+        return True
+
+    def restart_game(self):
+        self.record("restart_game")
+        self.initialize()
+        return True
+
+    def consume_item(self, action_type, item_name):
+        self.record("consume_item", action_type, item_name)
+        if action_type == "eat":
+            self.player.eat(item_name)
+        elif action_type == "drink":
+            self.player.drink(item_name)
+        return True
+
+    def rest(self, hours):
+        self.record("rest", hours)
+        self.player.rest(hours)
+
+        # Accélération du temps
+        self.fast_forward(int(hours * 10))
+        return True
+
+    def craft_item(self, item_name):
+        self.record("craft_item", item_name)
+        self.player.craft(item_name)
+        return True
+
+    def special_craft(self, action):
+        self.record("special_craft", action)
+        if action == "purify_water":
+            self.player.purify_water()
+        return True
+
+
+# Horloge à pas fixe: accumule le temps réel et exécute un nombre entier de ticks
+class SimulationClock:
+    SPEEDS = {"x1": 1, "x4": 4, "x16": 16, "max": None}
+
+    def __init__(self, tick_rate=TICK_RATE, max_frame_time=0.25, max_budget=0.012):
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_frame_time = max_frame_time  # limite de rattrapage (s réelles)
+        self.max_budget = max_budget  # temps de calcul par image en mode max
+        self.speed_name = "x1"
+        self.speed = 1
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped_ticks = 0
+
+    def set_speed(self, name):
+        self.speed_name = name
+        self.speed = self.SPEEDS[name]
+        self.accumulator = 0.0
+
+    def advance(self, frame_time, tick):
+        if self.speed is None:
+            # Vitesse maximale: autant de ticks que le budget de l'image le permet
+            ticks = 0
+            deadline = time.perf_counter() + self.max_budget
+            while time.perf_counter() < deadline:
+                for _ in range(64):
+                    tick()
+                ticks += 64
+            self.ticks += ticks
+            return ticks
+
+        # Une image trop longue ne doit pas provoquer une spirale de rattrapage:
+        # le retard au-delà de max_frame_time est abandonné
+        if frame_time > self.max_frame_time:
+            lost = (frame_time - self.max_frame_time) * self.speed * self.tick_rate
+            self.dropped_ticks += int(lost)
+            frame_time = self.max_frame_time
+        self.accumulator += frame_time * self.speed
+        ticks = 0
+        while self.accumulator >= self.dt:
+            tick()
+            self.accumulator -= self.dt
+            ticks += 1
+        self.ticks += ticks
+        return ticks
+
+    @property
+    def simulation_time(self):
+        return self.ticks * self.dt
+
+
+# Mesure du nombre de ticks de simulation par seconde
+def benchmark_ticks(ticks=200000):
+    simulation = SurvivalSimulation()
+    simulation.initialize()
+    start = time.perf_counter()
+    for _ in range(ticks):
+        simulation.update_game_state()
+        if simulation.player.health <= 0:
+            simulation.initialize()
+    elapsed = time.perf_counter() - start
+    return ticks / elapsed
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "--replay":
+        # python survival_core.py --replay partie.json
+        recording = Recording.load(sys.argv[2])
+        start = time.perf_counter()
+        simulation = replay(recording)
+        elapsed = time.perf_counter() - start
+        digest = state_digest(simulation)
+        status = "identique" if digest == recording.digest else "DIFFÉRENT"
+        print(f"{len(recording.actions)} actions, {simulation.tick} ticks")
+        print(f"Rejeu en {elapsed * 1000:.1f} ms, état final {status} ({digest})")
+        sys.exit(0 if digest == recording.digest else 1)
+
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"{benchmark_ticks(ticks):,.0f} ticks/s")
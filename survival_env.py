@@ -0,0 +1,312 @@
+# Environnements de type Gym pour agents automatiques (scriptés ou appris), sans affichage
+#
+#   env = SurvivalEnv(seed=0)
+#   observation, info = env.reset()
+#   observation, reward, terminated, truncated, info = env.step(action)
+#
+# Une étape: l'action choisie puis STEP_TICKS ticks de simulation, avancés par
+# segments (fast_forward). Récompense de 1 par étape survécue.
+import sys
+import time
+
+import numpy as np
+
+from survival_core import (
+    BALANCE,
+    FIRE_MATERIALS,
+    SHELTER_MATERIALS,
+    CraftabilityCache,
+    Item,
+    Recipe,
+    SurvivalSimulation,
+    TimeOfDay,
+    WEATHERS,
+)
+
+STEP_TICKS = 100  # ticks de simulation par étape (une période dure ~200 ticks)
+MAX_DAYS = 100  # au-delà, l'épisode est tronqué
+REST_HOURS = 8
+
+TIMES = list(TimeOfDay)
+
+# Catalogues figés à l'import: l'ordre des objets et des recettes fixe la
+# disposition des observations et des actions
+Item.initialize_items()
+Recipe.initialize_recipes()
+ITEM_NAMES = [item.name for item in Item.all_items]
+
+# Composantes du vecteur d'observation
+OBSERVATION = (
+    [
+        "health",
+        "hunger",
+        "thirst",
+        "energy",
+        "body_temperature",
+        "fire_duration",
+        "has_fire",
+        "has_shelter",
+        "days_survived",
+    ]
+    + [f"time:{period.name}" for period in TIMES]
+    + [f"weather:{weather.name}" for weather in WEATHERS]
+    + [f"item:{name}" for name in ITEM_NAMES]
+)
+TIME_OFFSET = OBSERVATION.index(f"time:{TIMES[0].name}")
+WEATHER_OFFSET = OBSERVATION.index(f"weather:{WEATHERS[0].name}")
+ITEM_OFFSET = OBSERVATION.index(f"item:{ITEM_NAMES[0]}")
+ITEM_INDEX = {name: ITEM_OFFSET + i for i, name in enumerate(ITEM_NAMES)}
+TIME_INDEX = {period: TIME_OFFSET + i for i, period in enumerate(TIMES)}
+WEATHER_INDEX = {weather: WEATHER_OFFSET + i for i, weather in enumerate(WEATHERS)}
+
+
+def has_materials(player, materials):
+    inventory = player.inventory
+    return all(inventory.has_item(name, qty) for name, qty in materials.items())
+
+
+def build_actions():
+    # Actions discrètes: (nom, disponibilité selon le joueur et le cache des
+    # recettes faisables, exécution sur la simulation)
+    actions = [
+        ("wait", lambda player, craftable: True, lambda sim: None),
+        (
+            "hunt",
+            lambda player, craftable: player.energy >= 20,
+            lambda sim: sim.perform_action("hunt"),
+        ),
+        (
+            "forage",
+            lambda player, craftable: player.energy >= 15,
+            lambda sim: sim.perform_action("forage"),
+        ),
+        (
+            "make_fire",
+            lambda player, craftable: not player.has_fire
+            and has_materials(player, FIRE_MATERIALS),
+            lambda sim: sim.perform_action("fire"),
+        ),
+        (
+            "build_shelter",
+            lambda player, craftable: not player.has_shelter
+            and has_materials(player, SHELTER_MATERIALS),
+            lambda sim: sim.perform_action("shelter"),
+        ),
+        ("rest", lambda player, craftable: True, lambda sim: sim.rest(REST_HOURS)),
+    ]
+    for item in Item.all_items:
+        name = item.name
+        if item.is_food:
+            actions.append(
+                (
+                    f"eat:{name}",
+                    lambda player, craftable, n=name: player.inventory.has_item(n),
+                    lambda sim, n=name: sim.consume_item("eat", n),
+                )
+            )
+        if item.is_drinkable:
+            actions.append(
+                (
+                    f"drink:{name}",
+                    lambda player, craftable, n=name: player.inventory.has_item(n),
+                    lambda sim, n=name: sim.consume_item("drink", n),
+                )
+            )
+    for recipe in Recipe.all_recipes:
+        if recipe.special is None:
+            actions.append(
+                (
+                    f"craft:{recipe.name}",
+                    lambda player, craftable, n=recipe.name: craftable.can_craft(n),
+                    lambda sim, r=recipe: sim.craft_item(r.name),
+                )
+            )
+    actions.append(
+        (
+            "cook",
+            lambda player, craftable: player.has_fire
+            and player.inventory.has_item("Viande crue"),
+            lambda sim: sim.player.cook("Viande crue"),
+        )
+    )
+    actions.append(
+        (
+            "purify_water",
+            lambda player, craftable: craftable.can_craft("Purifier l'eau"),
+            lambda sim: sim.special_craft("purify_water"),
+        )
+    )
+    return actions
+
+
+ACTIONS = build_actions()
+ACTION_NAMES = [name for name, _, _ in ACTIONS]
+
+
+# Un environnement: une partie, rejouable à l'identique à partir de sa graine
+class SurvivalEnv:
+    def __init__(
+        self, seed=None, balance=BALANCE, step_ticks=STEP_TICKS, max_days=MAX_DAYS
+    ):
+        self.seed = seed
+        self.balance = balance
+        self.step_ticks = step_ticks
+        self.max_days = max_days
+        self.simulation = None
+        self.craftable = CraftabilityCache()
+        self.steps = 0
+
+    def reset(self, seed=None):
+        # Sans graine: la suivante est tirée du générateur de la partie terminée,
+        # une suite d'épisodes reste ainsi reproductible depuis la première graine
+        if seed is not None:
+            self.seed = seed
+        elif self.simulation is not None:
+            self.seed = self.simulation.rng.randrange(2**32)
+        self.simulation = SurvivalSimulation(seed=self.seed, balance=self.balance)
+        self.simulation.initialize()
+        self.seed = self.simulation.seed
+        self.steps = 0
+        return self.observe(), self.info()
+
+    def advance(self, action):
+        # Une action impossible est tout de même transmise: le jeu la refuse
+        # par un message, comme depuis l'interface
+        simulation = self.simulation
+        ACTIONS[action][2](simulation)
+        simulation.fast_forward(self.step_ticks)
+        self.steps += 1
+
+        terminated = simulation.player.health <= 0
+        truncated = not terminated and simulation.days_survived >= self.max_days
+        return (0.0 if terminated else 1.0), terminated, truncated
+
+    def step(self, action):
+        reward, terminated, truncated = self.advance(action)
+        return self.observe(), reward, terminated, truncated, self.info()
+
+    def observe(self, out=None):
+        if out is None:
+            out = np.zeros(len(OBSERVATION), dtype=np.float32)
+        else:
+            out.fill(0)
+        simulation = self.simulation
+        player = simulation.player
+        out[:TIME_OFFSET] = (
+            player.health,
+            player.hunger,
+            player.thirst,
+            player.energy,
+            player.body_temperature,
+            player.fire_duration,
+            player.has_fire,
+            player.has_shelter,
+            simulation.days_survived,
+        )
+        out[TIME_INDEX[simulation.time_of_day]] = 1
+        out[WEATHER_INDEX[simulation.current_weather]] = 1
+        for name, quantity in player.inventory.items.items():
+            out[ITEM_INDEX[name]] = quantity
+        return out
+
+    def action_mask(self, out=None):
+        if out is None:
+            out = np.zeros(len(ACTIONS), dtype=bool)
+        # Recettes réévaluées seulement pour les objets modifiés depuis l'appel précédent
+        player = self.simulation.player
+        craftable = self.craftable
+        craftable.refresh(player)
+        for index, (_, available, _) in enumerate(ACTIONS):
+            out[index] = available(player, craftable)
+        return out
+
+    def info(self):
+        return {
+            "seed": self.seed,
+            "tick": self.simulation.tick,
+            "days_survived": self.simulation.days_survived,
+            "steps": self.steps,
+        }
+
+
+# Plusieurs environnements avancés par un seul appel, observations en tableaux.
+# Un épisode terminé repart aussitôt: la ligne d'observation renvoyée est alors
+# celle du nouvel épisode, la durée de l'épisode fini est dans `final_days`
+# (0 pour les environnements dont l'épisode continue).
+class VectorSurvivalEnv:
+    def __init__(self, count, seed=None, **kwargs):
+        self.count = count
+        self.seed = seed
+        self.envs = [SurvivalEnv(**kwargs) for _ in range(count)]
+        self.observations = np.zeros((count, len(OBSERVATION)), dtype=np.float32)
+        self.masks = np.zeros((count, len(ACTIONS)), dtype=bool)
+        self.rewards = np.zeros(count, dtype=np.float32)
+        self.terminated = np.zeros(count, dtype=bool)
+        self.truncated = np.zeros(count, dtype=bool)
+        self.final_days = np.zeros(count, dtype=np.int32)
+
+    def seeds(self, seed):
+        # Une graine par environnement, dérivée d'une seule ou donnée en liste
+        if seed is None or np.isscalar(seed):
+            return np.random.SeedSequence(seed).generate_state(self.count)
+        if len(seed) != self.count:
+            raise ValueError(f"{len(seed)} graines pour {self.count} environnements")
+        return seed
+
+    def reset(self, seed=None):
+        seeds = self.seeds(self.seed if seed is None else seed)
+        for index, (env, env_seed) in enumerate(zip(self.envs, seeds)):
+            env.reset(int(env_seed))
+            env.observe(self.observations[index])
+        self.final_days.fill(0)
+        return self.observations.copy(), {"seeds": [env.seed for env in self.envs]}
+
+    def step(self, actions):
+        observations = self.observations
+        self.final_days.fill(0)
+        for index, env in enumerate(self.envs):
+            reward, terminated, truncated = env.advance(int(actions[index]))
+            self.rewards[index] = reward
+            self.terminated[index] = terminated
+            self.truncated[index] = truncated
+            if terminated or truncated:
+                self.final_days[index] = env.simulation.days_survived
+                env.reset()
+            env.observe(observations[index])
+        return (
+            observations.copy(),
+            self.rewards.copy(),
+            self.terminated.copy(),
+            self.truncated.copy(),
+            {"final_days": self.final_days.copy()},
+        )
+
+    def action_masks(self):
+        for index, env in enumerate(self.envs):
+            env.action_mask(self.masks[index])
+        return self.masks.copy()
+
+
+# Débit d'un agent aléatoire restreint aux actions possibles
+def measure_throughput(count, steps, seed=0):
+    rng = np.random.default_rng(seed)
+    vector = VectorSurvivalEnv(count, seed=seed)
+    vector.reset()
+    start = time.perf_counter()
+    for _ in range(steps):
+        masks = vector.action_masks()
+        actions = np.argmax(rng.random(masks.shape) * masks, axis=1)
+        vector.step(actions)
+    elapsed = time.perf_counter() - start
+    return count * steps / elapsed
+
+
+if __name__ == "__main__":
+    # python survival_env.py [environnements] [étapes]
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    steps = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    print(f"{len(ACTIONS)} actions, observation de {len(OBSERVATION)} valeurs")
+    single = measure_throughput(1, count * steps)
+    print(f"1 environnement: {single:,.0f} étapes/s")
+    vector = measure_throughput(count, steps)
+    print(f"{count} environnements: {vector:,.0f} étapes/s")
@@ -0,0 +1,66 @@
+# Une image lue depuis le cache pré-décodé doit être identique, pixel par pixel
+# et transparence comprise, à celle décodée depuis sa source
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+import game_v2  # noqa: E402
+from survival_core import Item  # noqa: E402
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(autouse=True)
+def display(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    game_v2.init_pygame()
+    pygame.display.set_mode((64, 64))
+    yield
+    pygame.quit()
+
+
+def rgba(image):
+    # Pixels visibles: la couleur transparente devient un alpha nul
+    if not image.get_flags() & pygame.SRCALPHA:
+        surface = pygame.Surface(image.get_size(), pygame.SRCALPHA, 32)
+        surface.fill((0, 0, 0, 0))
+        surface.blit(image, (0, 0))
+        image = surface
+    return pygame.image.tobytes(image, "RGBA")
+
+
+def sources():
+    paths = list(game_v2.IMAGE_ASSETS) + [
+        path for path in game_v2.BACKGROUND_IMAGES.values() if os.path.exists(path)
+    ]
+    yield from ((path, lambda p=path: game_v2.load_image(p)) for path in paths)
+    Item.initialize_items()
+    for item in Item.all_items:
+        if os.path.exists(item.icon_name):
+            yield item.icon_name, lambda p=item.icon_name: game_v2.load_image(p)
+        else:
+            yield f"icon:{item.name}", lambda n=item.name: (
+                game_v2.make_placeholder_icon(n)
+            )
+
+
+def test_baked_assets_round_trip(tmp_path):
+    game_v2.bake_assets(game_v2.BakedAssetCache(str(tmp_path)))
+    cache = game_v2.BakedAssetCache(str(tmp_path))
+    for name, build in sources():
+        if name.startswith("icon:"):
+            baked = cache.load_generated(name, build)
+        else:
+            baked = cache.load(name)
+        expected = build()
+        assert baked.get_size() == expected.get_size(), name
+        assert rgba(baked) == rgba(expected), name
+        # Affichage: surfaces converties au format de l'écran
+        shown = game_v2.to_display_format(baked)
+        assert rgba(shown) == rgba(game_v2.to_display_format(expected)), name
+    assert cache.misses == 0
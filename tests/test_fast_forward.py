@@ -0,0 +1,107 @@
+# fast_forward doit reproduire exactement la simulation tick par tick
+import pytest
+
+from survival_core import BALANCE, SurvivalSimulation, TimeOfDay
+
+STATS = ["health", "hunger", "thirst", "energy", "body_temperature", "fire_duration"]
+
+
+def make_simulation(seed, balance=BALANCE, **player_state):
+    simulation = SurvivalSimulation(seed=seed, balance=balance)
+    simulation.initialize()
+    for name, value in player_state.items():
+        setattr(simulation.player, name, value)
+    return simulation
+
+
+def tick_by_tick(simulation, ticks):
+    for _ in range(ticks):
+        simulation.update_game_state()
+        if simulation.player.health <= 0:
+            break
+
+
+def assert_same_state(expected, actual):
+    assert actual.tick == expected.tick
+    assert actual.days_survived == expected.days_survived
+    assert actual.time_of_day == expected.time_of_day
+    assert actual.current_weather == expected.current_weather
+    assert actual.player.has_fire == expected.player.has_fire
+    assert actual.player.has_shelter == expected.player.has_shelter
+    for name in STATS:
+        assert getattr(actual.player, name) == pytest.approx(
+            getattr(expected.player, name), abs=1e-6
+        ), name
+
+
+SCENARIOS = {
+    "repos": {},
+    # Durée donnée par make_fire: multiple exact du pas de combustion
+    "feu": {"has_fire": True, "fire_duration": 8},
+    "feu_entame": {"has_fire": True, "fire_duration": 7.995},
+    "abri": {"has_shelter": True, "energy": 40},
+    "feu_et_abri": {"has_fire": True, "fire_duration": 2.995, "has_shelter": True},
+    "froid": {"body_temperature": 34.0},
+    # Mort en cours de segment, feu allumé: le feu s'arrête au tick de la mort
+    "mort_au_feu": {
+        "thirst": 0,
+        "hunger": 0,
+        "health": 5,
+        "has_fire": True,
+        "fire_duration": 8,
+    },
+    "mort_de_soif": {"thirst": 1, "health": 3},
+}
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("scenario", SCENARIOS)
+def test_fast_forward_matches_ticks(seed, scenario):
+    ticks = 3000
+    expected = make_simulation(seed, **SCENARIOS[scenario])
+    tick_by_tick(expected, ticks)
+    actual = make_simulation(seed, **SCENARIOS[scenario])
+    actual.fast_forward(ticks)
+    assert_same_state(expected, actual)
+
+
+def test_fast_forward_until_period_then_ticks():
+    # Arrêt au début d'une période puis reprise: même état qu'en continu
+    expected = make_simulation(1)
+    tick_by_tick(expected, 1000)
+    actual = make_simulation(1)
+    actual.fast_forward(until=TimeOfDay.NIGHT)
+    actual.fast_forward(1000 - actual.tick)
+    assert_same_state(expected, actual)
+
+
+@pytest.mark.parametrize("ticks", [799, 800, 801])
+def test_fire_of_make_fire_goes_out_at_tick_800(ticks):
+    # 8 h de feu à 0,01 h par tick: allumé au tick 799, éteint au tick 800
+    expected = make_simulation(0, has_fire=True, fire_duration=8)
+    tick_by_tick(expected, ticks)
+    actual = make_simulation(0, has_fire=True, fire_duration=8)
+    actual.fast_forward(ticks)
+    assert expected.player.has_fire == (ticks < 800)
+    assert_same_state(expected, actual)
+
+
+# Taux nuls, bornes naturelles d'un balayage: aucun événement ou aucune baisse
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"period_chance": 0},
+        {"weather_chance": 0},
+        {"hunger_decay": 0, "thirst_decay": 0},
+        {"fire_burn": 0},
+    ],
+    ids=["sans_période", "sans_météo", "sans_faim_ni_soif", "feu_éternel"],
+)
+def test_fast_forward_with_zero_rates(params):
+    balance = BALANCE._replace(**params)
+    state = {"has_fire": True, "fire_duration": 8, "hunger": 0}
+    expected = make_simulation(0, balance, **state)
+    tick_by_tick(expected, 3000)
+    actual = make_simulation(0, balance, **state)
+    actual.fast_forward(3000)
+    assert_same_state(expected, actual)
@@ -0,0 +1,38 @@
+# Une sauvegarde illisible doit lever ValueError, quelle que soit l'altération
+import pytest
+
+import savegame
+from survival_core import SurvivalSimulation
+
+
+def encoded_game():
+    simulation = SurvivalSimulation(seed=0)
+    simulation.initialize()
+    simulation.fast_forward(500)
+    return savegame.encode(savegame.take_snapshot(simulation))
+
+
+def flip_byte(data, index):
+    return data[:index] + bytes([data[index] ^ 0xFF]) + data[index + 1 :]
+
+
+def test_round_trip():
+    data = encoded_game()
+    assert savegame.encode(savegame.decode(data)) == data
+
+
+@pytest.mark.parametrize(
+    "alter",
+    [
+        lambda data: data[: len(data) // 2],
+        lambda data: data[:2],
+        lambda data: b"",
+        lambda data: flip_byte(data, len(data) // 2),
+        lambda data: flip_byte(data, len(data) - 1),
+        lambda data: flip_byte(data, 6),
+    ],
+    ids=["moitié", "deux_octets", "vide", "octet_milieu", "dernier_octet", "taille"],
+)
+def test_corrupt_save_raises_value_error(alter):
+    with pytest.raises(ValueError):
+        savegame.decode(alter(encoded_game()))